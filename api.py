@@ -0,0 +1,305 @@
+import argparse
+import json
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import tornado.ioloop
+import tornado.web
+
+import forecasting
+import instrumentation
+import registry
+import rollups
+import snapshot
+import sources
+import sync
+from downsampling import date_window
+
+
+# horizonte máximo atendido pela API; a previsão desse horizonte é calculada uma vez por versão e fatiada por requisição
+API_MAX_HORIZON = 90
+
+HISTORY_DAYS = 90
+
+
+class ForecastService:
+    # estado compartilhado pelas requisições: série pré-processada, registro de modelos e previsões em memória;
+    # a série só é substituída depois que a previsão da nova versão já foi calculada, de forma que as requisições
+    # nunca esperam por um ajuste
+    def __init__(self, brent_sync, model_registry=None, forecast_cache=None, snapshot_store=None, model_name='sm',
+                 max_h=API_MAX_HORIZON, max_responses=256):
+        self.brent_sync = brent_sync
+        self.snapshot_store = snapshot_store or snapshot.SnapshotStore()
+        self.rollups = rollups.RollupStore()
+        self.model_registry = model_registry or registry.ModelRegistry()
+        self.forecast_cache = forecast_cache or forecasting.ForecastCache()
+        self.model_name = model_name
+        self.max_h = max_h
+        self.max_responses = max_responses
+        self.serie = None
+        self._respostas = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        instrumentation.register_cache('modelos', self.model_registry.stats)
+        instrumentation.register_cache('previsoes', self.forecast_cache.stats)
+        instrumentation.register_cache('respostas', self.response_stats)
+        instrumentation.register_cache('snapshot', self.snapshot_store.stats)
+        instrumentation.register_cache('agregados', self.rollups.stats)
+
+    def refresh(self):
+        try:
+            with instrumentation.stage('dados/sincronizacao'):
+                self.brent_sync.maybe_sync()
+
+        except Exception as e:
+            print(f'Ocorreu um erro ao obter os dados da fonte {self.brent_sync.source.name}: {e}')
+
+        if self.brent_sync.data().empty:
+            df = sources.CsvSource().fetch_since()
+            version = f'csv-{len(df)}'
+        else:
+            df, version = self.brent_sync.data(), self.brent_sync.version
+
+        if self.serie is not None and version == self.serie.version:
+            return False
+
+        with instrumentation.stage('dados/preprocessamento'):
+            serie = snapshot.load_or_publish(self.snapshot_store, df, version)
+
+        self.forecast_cache.get(self.model_artifact(), serie, 1, self.max_h)
+        with instrumentation.stage('dados/agregados'):
+            self.rollups.update(serie)
+        self.serie = serie
+
+        return True
+
+    def model_artifact(self):
+        return self.model_registry.get(self.model_name)
+
+    def _cached(self, key, build):
+        # respostas já serializadas; a chave inclui a versão dos dados (e do modelo), então não há invalidação explícita
+        with self._lock:
+            resposta = self._respostas.get(key)
+            if resposta is not None:
+                self.hits += 1
+                self._respostas.move_to_end(key)
+                return resposta
+
+            self.misses += 1
+
+        with instrumentation.stage(f'api/{key[0]}/serializacao'):
+            resposta = json.dumps(build()).encode()
+
+        with self._lock:
+            self._respostas[key] = resposta
+            while len(self._respostas) > self.max_responses:
+                self._respostas.popitem(last=False)
+
+        return resposta
+
+    def response_stats(self):
+        total = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hits / total if total else None, 'entradas': len(self._respostas)}
+
+    def history(self, start=None, end=None, days=HISTORY_DAYS):
+        serie = self.serie
+
+        # visões em ordem crescente (sem cópia) para a consulta por intervalo de datas com busca binária
+        ds, y = serie.ds[::-1], serie.y[::-1]
+
+        def build():
+            if start is None and end is None:
+                janela = slice(max(len(ds) - days, 0), len(ds))
+            else:
+                janela = date_window(ds, start, end)
+
+            return {
+                'versao_dados': serie.version,
+                'ds': np.datetime_as_string(ds[janela], unit='D').tolist(),
+                'y': y[janela].tolist(),
+            }
+
+        return self._cached(('history', serie.version, start, end, days), build)
+
+    def rollup(self, freq, start=None, end=None):
+        serie = self.serie
+        if freq not in self.rollups.frequencies:
+            raise ValueError(f"freq deve ser {', '.join(self.rollups.frequencies)}")
+
+        def build():
+            df = self.rollups.frame(freq, start, end)
+            return {
+                'versao_dados': serie.version,
+                'freq': freq,
+                'ds': np.datetime_as_string(df['ds'].to_numpy(dtype='datetime64[ns]'), unit='D').tolist(),
+                **{coluna: df[coluna].tolist() for coluna in rollups.COLUMNS[1:]},
+            }
+
+        return self._cached(('rollup', serie.version, freq, start, end), build)
+
+    def forecast(self, h):
+        if not 1 <= h <= self.max_h:
+            raise ValueError(f'O horizonte deve estar entre 1 e {self.max_h} dias')
+
+        serie = self.serie
+        artifact = self.model_artifact()
+
+        def build():
+            previsao = self.forecast_cache.get(artifact, serie, h, self.max_h)
+            colunas = [coluna for coluna in previsao.columns if coluna not in ('unique_id', 'ds')]
+
+            return {
+                'modelo': artifact.name,
+                'versao_modelo': artifact.version,
+                'versao_dados': serie.version,
+                'ultimo_dado': f'{serie.last_date:%Y-%m-%d}',
+                'h': h,
+                'ds': np.datetime_as_string(previsao['ds'].to_numpy(dtype='datetime64[ns]'), unit='D').tolist(),
+                **{coluna: previsao[coluna].tolist() for coluna in colunas},
+            }
+
+        return self._cached(('forecast', artifact.sha256, serie.version, h), build)
+
+    def model(self):
+        artifact = self.model_artifact()
+        model = artifact.model
+
+        return json.dumps({
+            **artifact.info(),
+            'modelos': [repr(m) for m in model.models],
+            'freq': model.freq,
+            'janela_estado': forecasting.state_window(model),
+            'horizonte_maximo': self.max_h,
+            'versao_dados': self.serie.version,
+            'ultimo_dado': f'{self.serie.last_date:%Y-%m-%d}',
+            'cache_previsoes': self.forecast_cache.stats(),
+        }).encode()
+
+
+class BaseHandler(tornado.web.RequestHandler):
+    def initialize(self, service):
+        self.service = service
+
+    def on_finish(self):
+        instrumentation.timings.record(f'api{self.request.path}', self.request.request_time(), erro=self.get_status() >= 400,
+                                       status=self.get_status())
+
+    def set_default_headers(self):
+        self.set_header('Content-Type', 'application/json; charset=utf-8')
+
+    def write_error(self, status_code, **kwargs):
+        erro = self._reason
+        if 'exc_info' in kwargs and isinstance(kwargs['exc_info'][1], tornado.web.HTTPError) and kwargs['exc_info'][1].log_message:
+            erro = kwargs['exc_info'][1].log_message
+
+        self.finish(json.dumps({'erro': erro}))
+
+    def get_date(self, name):
+        valor = self.get_query_argument(name, None)
+        if valor is None:
+            return None
+
+        try:
+            return pd.Timestamp(valor)
+        except ValueError:
+            raise tornado.web.HTTPError(400, f'Data inválida em {name}: {valor}')
+
+    def get_int(self, name, default):
+        valor = self.get_query_argument(name, None)
+        if valor is None:
+            return default
+
+        try:
+            return int(valor)
+        except ValueError:
+            raise tornado.web.HTTPError(400, f'Valor inválido em {name}: {valor}')
+
+
+class HistoryHandler(BaseHandler):
+    def get(self):
+        days = self.get_int('days', HISTORY_DAYS)
+        if days < 1:
+            raise tornado.web.HTTPError(400, 'days deve ser maior que zero')
+
+        self.finish(self.service.history(self.get_date('start'), self.get_date('end'), days))
+
+
+class RollupHandler(BaseHandler):
+    def get(self):
+        try:
+            resposta = self.service.rollup(self.get_query_argument('freq', 'M'), self.get_date('start'), self.get_date('end'))
+        except ValueError as e:
+            raise tornado.web.HTTPError(400, str(e))
+
+        self.finish(resposta)
+
+
+class ForecastHandler(BaseHandler):
+    async def get(self):
+        h = self.get_int('h', forecasting.MAX_HORIZON)
+
+        try:
+            # a consulta ao registro e, se o modelo mudou, o novo ajuste rodam fora do event loop
+            resposta = await tornado.ioloop.IOLoop.current().run_in_executor(None, self.service.forecast, h)
+        except ValueError as e:
+            raise tornado.web.HTTPError(400, str(e))
+
+        self.finish(resposta)
+
+
+class ModelHandler(BaseHandler):
+    async def get(self):
+        self.finish(await tornado.ioloop.IOLoop.current().run_in_executor(None, self.service.model))
+
+
+class MetricsHandler(BaseHandler):
+    def get(self):
+        self.finish(json.dumps({'etapas': instrumentation.timings.summary(), 'caches': instrumentation.cache_stats()}))
+
+
+def make_app(service):
+    return tornado.web.Application([
+        (r'/history', HistoryHandler, {'service': service}),
+        (r'/rollup', RollupHandler, {'service': service}),
+        (r'/forecast', ForecastHandler, {'service': service}),
+        (r'/model', ModelHandler, {'service': service}),
+        (r'/metrics', MetricsHandler, {'service': service}),
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='API HTTP/JSON de previsão do preço do petróleo Brent.')
+    parser.add_argument('--port', type=int, default=8502)
+    parser.add_argument('--source', choices=list(sources.SOURCES), default=None, help='fonte de dados (padrão: BRENT_DATA_SOURCE ou csv)')
+    parser.add_argument('--model', default='sm', help='nome do modelo no registro')
+    parser.add_argument('--interval', type=int, default=3600, help='intervalo (s) entre as consultas à fonte de dados')
+    args = parser.parse_args()
+
+    instrumentation.configure_logging()
+    source = sources.get_source({'type': args.source} if args.source else None)
+    service = ForecastService(sync.BrentSync(source, interval=args.interval), model_name=args.model)
+
+    # a série é pré-processada e a primeira previsão calculada antes de aceitar conexões
+    inicio = time.perf_counter()
+    service.refresh()
+    print(f'Dados {service.serie.version} e modelo {args.model} prontos em {time.perf_counter() - inicio:.2f}s')
+
+    make_app(service).listen(args.port)
+    print(f'API disponível em http://localhost:{args.port} (/history, /rollup?freq=, /forecast?h=, /model, /metrics)')
+
+    loop = tornado.ioloop.IOLoop.current()
+
+    def agendar_atualizacao():
+        loop.run_in_executor(None, service.refresh)
+
+    tornado.ioloop.PeriodicCallback(agendar_atualizacao, args.interval * 1000).start()
+    loop.start()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+import numpy as np
+from scipy.stats import norm
+
+
+def _next_fast_len(n):
+    return 1 << (int(n) - 1).bit_length()
+
+
+def autocovariance(x, nlags):
+    # autocovariância (estimador viesado, dividido por n) via FFT: O(n log n) independente da quantidade de lags
+    x = np.asarray(x, dtype='float64')
+    x = x - x.mean()
+    n = len(x)
+
+    espectro = np.fft.rfft(x, n=_next_fast_len(2 * n))
+    return np.fft.irfft(espectro * np.conj(espectro))[:nlags + 1] / n
+
+
+def acf(x, nlags, alpha=0.05):
+    # mesmos valores e intervalos (fórmula de Bartlett) do statsmodels.tsa.stattools.acf(..., fft=True)
+    autocov = autocovariance(x, nlags)
+    valores = autocov / autocov[0]
+
+    n = len(x)
+    variancia = np.ones(nlags + 1) / n
+    variancia[0] = 0
+    variancia[2:] *= 1 + 2 * np.cumsum(valores[1:-1] ** 2)
+
+    intervalo = norm.ppf(1 - alpha / 2) * np.sqrt(variancia)
+    return valores, np.column_stack([valores - intervalo, valores + intervalo])
+
+
+def levinson_durbin(r, nlags):
+    # autocorrelações parciais a partir das autocorrelações r[0..nlags] (recursão de Levinson-Durbin, O(nlags²))
+    pacf = np.empty(nlags + 1)
+    pacf[0] = 1.0
+
+    phi = np.zeros(nlags + 1)
+    erro = r[0]
+
+    for k in range(1, nlags + 1):
+        reflexao = (r[k] - phi[1:k] @ r[k - 1:0:-1]) / erro
+
+        phi[1:k] = phi[1:k] - reflexao * phi[k - 1:0:-1]
+        phi[k] = reflexao
+        pacf[k] = reflexao
+
+        erro *= 1 - reflexao ** 2
+
+    return pacf
+
+
+def pacf(x, nlags, alpha=0.05):
+    # equivalente ao statsmodels.tsa.stattools.pacf(..., method='ywm'), que resolve Yule-Walker para cada lag
+    autocov = autocovariance(x, nlags)
+    valores = levinson_durbin(autocov / autocov[0], nlags)
+
+    intervalo = norm.ppf(1 - alpha / 2) * np.sqrt(1.0 / len(x))
+    confint = np.column_stack([valores - intervalo, valores + intervalo])
+    confint[0] = valores[0]
+
+    return valores, confint
+
+
+def figure(values, confint, title, nlags=None):
+    # gráfico interativo equivalente ao plot_acf/plot_pacf: hastes, marcadores e intervalo de confiança centrado em zero
+    import plotly.graph_objects as go
+
+    nlags = len(values) - 1 if nlags is None else nlags
+    values = values[:nlags + 1]
+    confint = confint[:nlags + 1]
+    lags = np.arange(nlags + 1)
+
+    # todas as hastes em um único trace, separadas por None
+    hastes_x = np.column_stack([lags, lags, np.full(len(lags), np.nan)]).ravel()
+    hastes_y = np.column_stack([np.zeros(len(lags)), values, np.full(len(lags), np.nan)]).ravel()
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=lags, y=confint[:, 0] - values, mode='lines', line=dict(width=0), showlegend=False, hoverinfo='skip'))
+    fig.add_trace(go.Scatter(x=lags, y=confint[:, 1] - values, mode='lines', line=dict(width=0), fill='tonexty',
+                             fillcolor='rgba(31, 119, 180, 0.25)', name='Intervalo de confiança (95%)', hoverinfo='skip'))
+    fig.add_trace(go.Scatter(x=hastes_x, y=hastes_y, mode='lines', line=dict(color='rgb(31, 119, 180)', width=1), showlegend=False, hoverinfo='skip'))
+    fig.add_trace(go.Scatter(x=lags, y=values, mode='markers', marker=dict(color='rgb(31, 119, 180)', size=5), name=title))
+
+    fig.add_hline(y=0, line=dict(color='black', width=1))
+    fig.update_layout(title=title, xaxis_title='Lag', showlegend=False)
+
+    return fig
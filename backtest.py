@@ -0,0 +1,142 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import metrics
+import series
+from evaluation import ARTIFACTS_DIR, MODEL_CONFIGS
+from utils import data_fingerprint
+
+
+_worker_data = {}
+
+
+def default_models(configs=MODEL_CONFIGS):
+    # mesmos modelos (e a primeira combinação de cada grade) da aba "Performance dos Modelos"
+    from statsforecast.models import Naive, SeasonalExponentialSmoothingOptimized, SeasonalNaive, SeasonalWindowAverage
+
+    return {
+        'Naive': Naive(),
+        'SeasonalNaive': SeasonalNaive(season_length=configs['seasonal_naive']['season_length'][0]),
+        'SeasWA': SeasonalWindowAverage(season_length=configs['seasonal_window_average']['season_length'][0],
+                                        window_size=configs['seasonal_window_average']['window_size'][0]),
+        'SeasESOpt': SeasonalExponentialSmoothingOptimized(season_length=configs['seasonal_exponential_smoothing_optimized']['season_length'][0]),
+    }
+
+
+def windows(n, horizon, step, n_windows=None, train_size=None, mode='rolling'):
+    # pontos de corte (índice da primeira observação prevista) do mais antigo para o mais recente; no modo
+    # rolling o treino tem tamanho fixo (train_size) e no expanding ele vai sempre do início da série até o corte
+    if mode == 'rolling' and not train_size:
+        raise ValueError("O modo 'rolling' exige train_size (tamanho fixo do treino)")
+
+    primeiro_corte = train_size or horizon
+    cortes = np.arange(n - horizon, primeiro_corte - 1, -step)[::-1]
+
+    if n_windows is not None:
+        cortes = cortes[-n_windows:]
+
+    inicios = cortes - train_size if mode == 'rolling' else np.zeros_like(cortes)
+    return np.column_stack([inicios, cortes])
+
+
+def _init_worker(y, models, horizon):
+    # a série e os modelos são enviados uma única vez para cada processo
+    _worker_data['y'] = y
+    _worker_data['models'] = models
+    _worker_data['horizon'] = horizon
+
+
+def forecast_windows(janelas):
+    y = _worker_data['y']
+    models = _worker_data['models']
+    horizon = _worker_data['horizon']
+
+    # resultado pré-alocado (janelas x modelos x passos); cada treino é uma visão da série, sem cópia
+    preds = np.empty((len(janelas), len(models), horizon))
+
+    for i, (inicio, corte) in enumerate(janelas):
+        treino = y[inicio:corte]
+
+        for j, model in enumerate(models):
+            preds[i, j] = model.new().forecast(y=treino, h=horizon)['mean']
+
+    return preds
+
+
+def run_backtest(serie, models=None, horizon=30, step=30, n_windows=None, train_size=730, mode='rolling', workers=None, batch_size=8):
+    models = models or default_models()
+    nomes = list(models)
+
+    # arrays em ordem crescente, formato esperado pelos modelos
+    ds = serie.ds[::-1]
+    y = np.ascontiguousarray(serie.y[::-1])
+
+    janelas = windows(len(y), horizon, step, n_windows, train_size, mode)
+    lotes = [janelas[i:i + batch_size] for i in range(0, len(janelas), batch_size)]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(y, list(models.values()), horizon)) as executor:
+        preds = np.concatenate(list(executor.map(forecast_windows, lotes)))
+
+    # valores reais de cada janela (janelas x passos) por meio de uma visão indexada da série
+    reais = y[janelas[:, 1, None] + np.arange(horizon)]
+
+    # erros por janela: agregados sobre os passos do horizonte
+    por_janela = metrics.compute(reais[:, None, :], preds, axis=2)
+    df_janelas = pd.DataFrame({
+        'janela': np.repeat(np.arange(len(janelas)), len(nomes)),
+        'corte': np.repeat(ds[janelas[:, 1]], len(nomes)),
+        'modelo': np.tile(nomes, len(janelas)),
+        **{metrica: valores.ravel() for metrica, valores in por_janela.items()},
+    })
+
+    # erros por passo do horizonte: agregados sobre as janelas
+    por_passo = metrics.compute(reais[:, None, :], preds, axis=0)
+    df_passos = pd.DataFrame({
+        'passo': np.tile(np.arange(1, horizon + 1), len(nomes)),
+        'modelo': np.repeat(nomes, horizon),
+        **{metrica: valores.ravel() for metrica, valores in por_passo.items()},
+    })
+
+    return df_janelas, df_passos
+
+
+def results_paths(serie, **params):
+    fingerprint = data_fingerprint(serie.frame(), params)[:16]
+    return (os.path.join(ARTIFACTS_DIR, f'backtest_{fingerprint}_janelas.csv'),
+            os.path.join(ARTIFACTS_DIR, f'backtest_{fingerprint}_passos.csv'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Backtesting (validação com origem móvel) dos modelos sobre todo o histórico.')
+    parser.add_argument('--csv', default='dados/dados_preco_petroleo.csv', help='arquivo CSV com as colunas data e preco_petroleo_brent')
+    parser.add_argument('--horizon', type=int, default=30)
+    parser.add_argument('--step', type=int, default=30, help='dias entre dois cortes consecutivos')
+    parser.add_argument('--windows', type=int, default=None, help='quantidade de janelas mais recentes (padrão: todo o histórico)')
+    parser.add_argument('--train-size', type=int, default=730, help='tamanho do treino no modo rolling')
+    parser.add_argument('--mode', choices=['rolling', 'expanding'], default='rolling')
+    parser.add_argument('--workers', type=int, default=None, help='quantidade de processos (padrão: núcleos disponíveis)')
+    args = parser.parse_args()
+
+    serie = series.preprocess(pd.read_csv(args.csv))
+    params = {'horizon': args.horizon, 'step': args.step, 'n_windows': args.windows, 'train_size': args.train_size, 'mode': args.mode}
+
+    inicio = time.perf_counter()
+    df_janelas, df_passos = run_backtest(serie, workers=args.workers, **params)
+    tempo = time.perf_counter() - inicio
+
+    os.makedirs(ARTIFACTS_DIR, exist_ok=True)
+    path_janelas, path_passos = results_paths(serie, **params)
+    df_janelas.to_csv(path_janelas, index=False)
+    df_passos.to_csv(path_passos, index=False)
+
+    print(f'{df_janelas["janela"].nunique()} janelas avaliadas em {tempo:.1f}s; resultados em {path_janelas} e {path_passos}')
+    print(df_janelas.groupby('modelo')[['wmape', 'mape', 'rmse', 'mae', 'bias']].mean().sort_values(by='wmape').to_string())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+from tornado.httpclient import AsyncHTTPClient, HTTPClientError
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PATHS = ['/forecast?h=30', '/forecast?h=7', '/history', '/model']
+
+
+async def wait_ready(client, url, timeout):
+    limite = time.monotonic() + timeout
+
+    while True:
+        try:
+            await client.fetch(f'{url}/model')
+            return
+        except (ConnectionError, HTTPClientError, OSError):
+            if time.monotonic() > limite:
+                raise SystemExit(f'A API não respondeu em {timeout}s')
+
+            await asyncio.sleep(0.5)
+
+
+async def run_load(url, paths, n_requests, concurrency):
+    client = AsyncHTTPClient(max_clients=concurrency)
+    latencias = {path: [] for path in paths}
+    erros = {path: 0 for path in paths}
+    proxima = iter(range(n_requests))
+
+    async def worker():
+        # cada worker envia uma requisição por vez; os caminhos são alternados entre as requisições
+        for i in proxima:
+            path = paths[i % len(paths)]
+            inicio = time.perf_counter()
+
+            try:
+                await client.fetch(f'{url}{path}')
+                latencias[path].append(time.perf_counter() - inicio)
+            except (ConnectionError, HTTPClientError, OSError):
+                erros[path] += 1
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    tempo = time.perf_counter() - inicio
+
+    return latencias, erros, tempo
+
+
+def report(latencias, erros, tempo):
+    print(f'{"caminho":<18} {"requisições":>11} {"erros":>6} {"p50 (ms)":>9} {"p99 (ms)":>9} {"máx (ms)":>9}')
+
+    todas = []
+    for path, valores in latencias.items():
+        todas.extend(valores)
+        p50, p99, maximo = np.percentile(valores, [50, 99, 100]) * 1000 if valores else (np.nan,) * 3
+        print(f'{path:<18} {len(valores):>11} {erros[path]:>6} {p50:>9.2f} {p99:>9.2f} {maximo:>9.2f}')
+
+    p50, p99 = np.percentile(todas, [50, 99]) * 1000 if todas else (np.nan, np.nan)
+    print(f'\ntotal: {len(todas)} requisições em {tempo:.2f}s | {len(todas) / tempo:.0f} req/s | p50 {p50:.2f} ms | p99 {p99:.2f} ms | erros {sum(erros.values())}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Teste de carga local da API de previsão (api.py).')
+    parser.add_argument('--url', default=None, help='API já em execução (padrão: inicia o api.py em um subprocesso)')
+    parser.add_argument('--port', type=int, default=8502)
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--paths', nargs='+', default=PATHS)
+    parser.add_argument('--timeout', type=int, default=120, help='tempo máximo (s) de espera pelo início da API')
+    args = parser.parse_args()
+
+    processo = None
+    url = args.url
+
+    if url is None:
+        url = f'http://localhost:{args.port}'
+        processo = subprocess.Popen([sys.executable, 'api.py', '--port', str(args.port)], cwd=RAIZ)
+
+    async def executar():
+        await wait_ready(AsyncHTTPClient(), url, args.timeout)
+
+        # aquecimento: a primeira requisição de cada caminho serializa e guarda a resposta
+        await run_load(url, args.paths, len(args.paths), 1)
+        return await run_load(url, args.paths, args.requests, args.concurrency)
+
+    try:
+        latencias, erros, tempo = asyncio.run(executar())
+    finally:
+        if processo is not None:
+            processo.terminate()
+            processo.wait()
+
+    report(latencias, erros, tempo)
+
+
+if __name__ == '__main__':
+    main()
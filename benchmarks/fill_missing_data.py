@@ -0,0 +1,72 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import FillMissingData
+
+
+def legacy_fill_missing_data(df, freq='D'):
+    # implementação anterior (merge com o date_range + ordenação completa), mantida como referência
+    date_range = pd.date_range(start=df['ds'].min(), end=df['ds'].max(), freq=freq)
+    df_date_range = pd.DataFrame({'ds': date_range})
+    df_completo = pd.merge(df_date_range, df, on='ds', how='left')
+    df_completo.sort_values(by='ds', ascending=False, inplace=True)
+    df_completo['y'] = df_completo['y'].bfill()
+    df_completo.reset_index(drop=True, inplace=True)
+
+    return df_completo
+
+
+def synthetic_series(n_rows, freq, missing_ratio=0.3, seed=42):
+    # série em ordem decrescente (como retornada pelo BigQuery) com lacunas aleatórias
+    rng = np.random.default_rng(seed)
+    n_total = int(n_rows / (1 - missing_ratio))
+
+    ds = pd.date_range(start='2000-01-01', periods=n_total, freq=freq)
+    mask = rng.random(n_total) >= missing_ratio
+    mask[0] = mask[-1] = True
+
+    y = 80 + np.cumsum(rng.normal(0, 1, n_total))
+    df = pd.DataFrame({'ds': ds[mask], 'y': y[mask]})
+
+    return df.iloc[::-1].reset_index(drop=True)
+
+
+def best_of(func, df, repeat):
+    timings = []
+    for _ in range(repeat):
+        inicio = time.perf_counter()
+        func(df)
+        timings.append(time.perf_counter() - inicio)
+
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compara a implementação atual do FillMissingData com a implementação anterior.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f'{"linhas":>12} {"freq":>5} {"anterior (s)":>14} {"atual (s)":>11} {"ganho":>8}')
+
+    for n_rows in args.sizes:
+        # séries diárias longas ultrapassam o limite do Timestamp, então os tamanhos maiores usam dados intradiários
+        freq = 'D' if n_rows <= 50_000 else 'min'
+        df = synthetic_series(n_rows, freq)
+        fill = FillMissingData(freq=freq)
+
+        tempo_anterior = best_of(lambda d: legacy_fill_missing_data(d, freq), df, args.repeat)
+        tempo_atual = best_of(fill.transform, df, args.repeat)
+
+        print(f'{n_rows:>12,} {freq:>5} {tempo_anterior:>14.4f} {tempo_atual:>11.4f} {tempo_anterior / tempo_atual:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ingestion
+
+
+def legacy_read(path):
+    # leitura anterior: colunas object, vírgula decimal convertida por str.replace e datas pelo pd.to_datetime
+    df = pd.read_csv(path, dtype=str)
+    df = df.rename(columns={'data': 'ds', 'preco_petroleo_brent': 'y'})
+    df = df.assign(y=df['y'].str.replace(',', '.').astype(float), ds=pd.to_datetime(df['ds']))
+
+    return df
+
+
+def synthetic_csv(path, n_series, n_days, seed=42):
+    # painel no formato longo, com vírgula decimal (exportação em português), gravado em disco
+    rng = np.random.default_rng(seed)
+
+    datas = pd.date_range('2000-01-01', periods=n_days, freq='D').strftime('%Y-%m-%d').to_numpy()
+    precos = np.round(80 + rng.normal(0, 5, size=n_series * n_days), 2).astype(str)
+
+    pd.DataFrame({
+        'unique_id': np.repeat([f'serie_{i:05d}' for i in range(n_series)], n_days),
+        'data': np.tile(datas, n_series),
+        'preco_petroleo_brent': np.char.replace(precos, '.', ','),
+    }).to_csv(path, index=False)
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        inicio = time.perf_counter()
+        resultado = func()
+        timings.append(time.perf_counter() - inicio)
+
+    return min(timings), resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compara a leitura tipada (ingestion.read_csv) com a leitura anterior de um painel em CSV.')
+    parser.add_argument('--series', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--days', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f'{"linhas":>12} {"anterior (s)":>13} {"atual (s)":>10} {"ganho":>7} {"anterior (MB)":>14} {"atual (MB)":>11}')
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        for n_series in args.series:
+            path = os.path.join(diretorio, f'painel_{n_series}.csv')
+            synthetic_csv(path, n_series, args.days)
+
+            tempo_anterior, df_anterior = best_of(lambda: legacy_read(path), args.repeat)
+            tempo_atual, (df_atual, _) = best_of(lambda: ingestion.read_csv(path, id_column='unique_id'), args.repeat)
+
+            memoria_anterior = df_anterior.memory_usage(deep=True).sum() / 2 ** 20
+            memoria_atual = df_atual.memory_usage(deep=True).sum() / 2 ** 20
+
+            print(f'{len(df_atual):>12,} {tempo_anterior:>13.3f} {tempo_atual:>10.3f} {tempo_anterior / tempo_atual:>6.1f}x '
+                  f'{memoria_anterior:>14.1f} {memoria_atual:>11.1f}')
+
+
+if __name__ == '__main__':
+    main()
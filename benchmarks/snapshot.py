@@ -0,0 +1,121 @@
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+import series
+import snapshot
+import sources
+
+MODOS = ('vazio', 'copia', 'snapshot')
+
+
+def memory_kb():
+    # memória do processo segundo o kernel (Linux): privada (só deste processo) e PSS (compartilhada rateada)
+    campos = {}
+    with open('/proc/self/smaps_rollup') as f:
+        for linha in f:
+            partes = linha.split()
+            if len(partes) == 3 and partes[2] == 'kB':
+                campos[partes[0].rstrip(':')] = int(partes[1])
+
+    return campos['Private_Clean'] + campos['Private_Dirty'], campos['Pss']
+
+
+def worker(mode, directory):
+    pd.set_option('mode.copy_on_write', True)
+    inicio = time.perf_counter()
+
+    if mode == 'vazio':
+        # referência: apenas o interpretador e as bibliotecas importadas
+        serie = series.CanonicalSeries(pd.DataFrame({'ds': pd.to_datetime(['2000-01-01']), 'y': [80.0]}), 'vazio')
+    elif mode == 'snapshot':
+        serie = snapshot.SnapshotStore(directory).current()
+    else:
+        # situação anterior: cada processo mantém a sua própria cópia da série
+        df = pd.read_parquet(os.path.join(directory, 'serie.parquet'))
+        serie = series.CanonicalSeries(df, 'benchmark')
+
+    # as páginas só entram na memória do processo quando são lidas
+    serie.y.sum(), serie.ds.max()
+    carga = time.perf_counter() - inicio
+
+    # todos os processos ficam vivos até o fim da medição, para que as páginas compartilhadas sejam rateadas entre eles
+    print('pronto', flush=True)
+    sys.stdin.readline()
+    print(carga, *memory_kb(), flush=True)
+    sys.stdin.readline()
+
+
+def run_workers(mode, directory, n_workers):
+    processos = [subprocess.Popen([sys.executable, __file__, '--worker', mode, directory], stdin=subprocess.PIPE,
+                                  stdout=subprocess.PIPE, text=True) for _ in range(n_workers)]
+
+    for processo in processos:
+        processo.stdout.readline()
+
+    resultados = []
+    for processo in processos:
+        processo.stdin.write('\n')
+        processo.stdin.flush()
+        resultados.append([float(valor) for valor in processo.stdout.readline().split()])
+
+    for processo in processos:
+        processo.communicate('\n')
+
+    carga, privada, pss = zip(*resultados)
+    return sum(carga) / n_workers, sum(privada) / n_workers / 1024, sum(pss) / 1024
+
+def main():
+    parser = argparse.ArgumentParser(description='Compara a carga da série pelo snapshot mapeado em memória com uma cópia da série em cada processo.')
+    parser.add_argument('--rows', type=int, default=10_000_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--worker', nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(*args.worker)
+        return
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        # histórico real: pré-processamento a cada início de processo x leitura do snapshot já publicado
+        df_raw = sources.CsvSource().fetch_since()
+        store = snapshot.SnapshotStore(os.path.join(diretorio, 'historico'))
+
+        inicio = time.perf_counter()
+        serie = series.preprocess(df_raw, 'historico')
+        tempo_preprocessamento = time.perf_counter() - inicio
+
+        store.publish(serie)
+        inicio = time.perf_counter()
+        snapshot.SnapshotStore(store.directory).current()
+        tempo_snapshot = time.perf_counter() - inicio
+
+        print(f'histórico ({len(serie):,} linhas): pré-processamento {tempo_preprocessamento * 1000:.1f} ms, '
+              f'snapshot {tempo_snapshot * 1000:.2f} ms\n')
+
+        # série sintética maior (intradiária), para que o tamanho dos dados se destaque da memória do interpretador
+        ds = np.arange(np.datetime64('2000-01-01'), args.rows, dtype='datetime64[m]')[::-1].astype('datetime64[ns]')
+        y = 80 + np.cumsum(np.random.default_rng(42).normal(0, 1, args.rows))
+        serie = series.CanonicalSeries(pd.DataFrame({'ds': ds, 'y': y}), 'benchmark')
+
+        serie.frame().to_parquet(os.path.join(diretorio, 'serie.parquet'), index=False)
+        snapshot.SnapshotStore(diretorio).publish(serie)
+        print(f'série sintética: {len(serie):,} linhas ({(serie.ds.nbytes + serie.y.nbytes) / 2 ** 20:.0f} MB)')
+
+        print(f'{"modo":>9} {"processos":>10} {"carga (ms)":>11} {"privada/processo (MB)":>22} {"PSS total (MB)":>15}')
+        for mode in MODOS:
+            for n_workers in args.workers:
+                carga, privada, pss = run_workers(mode, diretorio, n_workers)
+                print(f'{mode:>9} {n_workers:>10} {carga * 1000:>11.1f} {privada:>22.1f} {pss:>15.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,315 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from fill_missing_data import synthetic_series
+
+BASELINE_PATH = os.path.join(RAIZ, 'benchmarks', 'baseline.json')
+RESULTS_DIR = os.path.join(RAIZ, 'artefatos', 'benchmarks')
+
+GROUPS = ('transformers', 'models', 'artifacts', 'app')
+
+# variações menores que isto (em segundos) são tratadas como ruído de medição, independentemente da tolerância
+MIN_DELTA = 0.002
+
+
+def measure(func, repeat, setup=None):
+    # setup (fora da medição) prepara uma entrada nova a cada repetição, para os casos que alteram o estado
+    tempos = []
+    for _ in range(repeat):
+        argumento = setup() if setup is not None else None
+
+        inicio = time.perf_counter()
+        func() if setup is None else func(argumento)
+        tempos.append(time.perf_counter() - inicio)
+
+    return {'mediana_s': float(np.median(tempos)), 'min_s': float(np.min(tempos)), 'repeticoes': repeat}
+
+
+def raw_frames(sizes):
+    # base distribuída com o projeto e séries sintéticas no formato bruto da fonte (data como texto)
+    from sources import CSV_PATH, DATE_COLUMN, PRICE_COLUMN
+
+    frames = {'csv': pd.read_csv(os.path.join(RAIZ, CSV_PATH))}
+
+    for n_rows in sizes:
+        # séries diárias longas ultrapassam o limite do Timestamp, então os tamanhos maiores usam dados intradiários
+        freq = 'D' if n_rows <= 50_000 else 'min'
+        df = synthetic_series(n_rows, freq)
+        frames[f'sintetica-{n_rows}'] = pd.DataFrame({DATE_COLUMN: df['ds'].astype(str), PRICE_COLUMN: df['y']})
+
+    return frames
+
+
+def bench_transformers(args):
+    from sklearn.pipeline import Pipeline
+
+    from sources import PRICE_COLUMN
+    from utils import CastToDatetime, CastToFloat, FillMissingData, RenameColumns
+
+    resultados = []
+
+    for nome, df_raw in raw_frames(args.sizes).items():
+        freq = 'min' if nome.startswith('sintetica') and int(nome.split('-')[1]) > 50_000 else 'D'
+
+        df_renomeado = RenameColumns().transform(df_raw)
+        df_texto = RenameColumns().transform(df_raw.assign(**{PRICE_COLUMN: df_raw[PRICE_COLUMN].astype(str).str.replace('.', ',', regex=False)}))
+        df_datas = CastToDatetime().transform(df_renomeado)
+
+        casos = {
+            'rename_columns': lambda: RenameColumns().transform(df_raw),
+            'cast_to_float': lambda: CastToFloat().transform(df_texto),
+            'cast_to_datetime': lambda: CastToDatetime().transform(df_renomeado),
+            'fill_missing_data': lambda: FillMissingData(freq=freq).transform(df_datas),
+            'pipeline': lambda: Pipeline([
+                ('rename_columns', RenameColumns()),
+                ('cast_to_datetime', CastToDatetime()),
+                ('fill_missing_data', FillMissingData(freq=freq)),
+            ]).transform(df_raw),
+        }
+
+        for caso, func in casos.items():
+            resultados.append({'nome': f'transformers/{caso}/{nome}', 'linhas': len(df_raw), **measure(func, args.repeat)})
+
+    return resultados
+
+
+def bench_models(args):
+    from statsforecast import StatsForecast
+    from statsforecast.models import AutoARIMA
+
+    import series
+    import sources
+    from backtest import default_models
+    from evaluation import MODEL_CONFIGS
+
+    serie = series.preprocess(sources.CsvSource(os.path.join(RAIZ, sources.CSV_PATH)).fetch_since())
+
+    models = default_models()
+    if args.arima:
+        models['AutoARIMA'] = AutoARIMA(season_length=MODEL_CONFIGS['auto_arima']['season_length'])
+
+    resultados = []
+
+    for nome, model in models.items():
+        # a primeira chamada inclui a compilação (numba) e é registrada à parte
+        df_inicial = serie.statsforecast().iloc[:max(args.train_sizes)].iloc[::-1]
+        resultados.append({'nome': f'models/{nome}/primeira_chamada', **measure(
+            lambda: StatsForecast(models=[model.new()], freq='D', n_jobs=1).fit(df_inicial).predict(h=args.horizon), 1)})
+
+        for tamanho in args.train_sizes:
+            df = serie.statsforecast().iloc[:tamanho].iloc[::-1]
+            repeticoes = 1 if nome == 'AutoARIMA' else args.repeat
+
+            def novo():
+                return StatsForecast(models=[model.new()], freq='D', n_jobs=1)
+
+            ajustado = novo().fit(df)
+
+            resultados.append({'nome': f'models/{nome}/fit/{len(df)}', 'linhas': len(df),
+                               **measure(lambda sf: sf.fit(df), repeticoes, setup=novo)})
+            resultados.append({'nome': f'models/{nome}/predict/{len(df)}', 'linhas': len(df),
+                               **measure(lambda: ajustado.predict(h=args.horizon), repeticoes)})
+
+    return resultados
+
+
+def bench_artifacts(args):
+    import joblib
+
+    from registry import file_sha256, load_manifest
+
+    resultados = []
+
+    for nome, entry in load_manifest(os.path.join(RAIZ, 'modelo', 'registry.json')).items():
+        path = os.path.join(RAIZ, entry['versions'][entry['latest']]['path'])
+
+        resultados.append({'nome': f'artifacts/{nome}/joblib_load', 'bytes': os.path.getsize(path), **measure(lambda: joblib.load(path), args.repeat)})
+        resultados.append({'nome': f'artifacts/{nome}/sha256', 'bytes': os.path.getsize(path), **measure(lambda: file_sha256(path), args.repeat)})
+
+    return resultados
+
+
+def bench_app(args):
+    # renderização de ponta a ponta de cada aba pelo AppTest (sem navegador), em um processo novo: a primeira
+    # execução inclui as importações e os caches vazios (cold start) e as seguintes medem os reruns
+    from streamlit.testing.v1 import AppTest
+
+    os.chdir(RAIZ)
+    resultados = []
+
+    def verificar(at, nome):
+        if at.exception:
+            raise RuntimeError(f'{nome}: {at.exception[0].value}')
+
+    at = AppTest.from_file('app.py', default_timeout=600)
+    inicio = time.perf_counter()
+    at.run()
+    tempo = time.perf_counter() - inicio
+
+    resultados.append({'nome': 'app/cold_start', 'mediana_s': tempo, 'min_s': tempo, 'repeticoes': 1})
+    verificar(at, 'cold_start')
+
+    for aba in at.radio[0].options:
+        inicio = time.perf_counter()
+        at.radio[0].set_value(aba).run()
+        tempo = time.perf_counter() - inicio
+        verificar(at, aba)
+
+        resultados.append({'nome': f'app/{aba}/primeira_renderizacao', 'mediana_s': tempo, 'min_s': tempo, 'repeticoes': 1})
+        resultados.append({'nome': f'app/{aba}/rerun', **measure(at.run, args.repeat)})
+
+        if at.button:
+            resultados.append({'nome': f'app/{aba}/botao', **measure(lambda: at.button[0].click().run(), args.repeat)})
+            verificar(at, aba)
+
+    return resultados
+
+
+BENCHMARKS = {
+    'transformers': bench_transformers,
+    'models': bench_models,
+    'artifacts': bench_artifacts,
+    'app': bench_app,
+}
+
+
+def environment():
+    import statsforecast
+    import streamlit
+
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=RAIZ, capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = None
+
+    return {
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'cpus': os.cpu_count(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'statsforecast': statsforecast.__version__,
+        'streamlit': streamlit.__version__,
+    }
+
+
+def run_group(group, args):
+    # cada grupo roda em um processo próprio, para que importações, compilações e caches de um grupo
+    # não interfiram nas medições dos demais (principalmente no cold start do app)
+    comando = [sys.executable, os.path.abspath(__file__), '--worker', group, '--repeat', str(args.repeat),
+               '--horizon', str(args.horizon), '--sizes', *map(str, args.sizes), '--train-sizes', *map(str, args.train_sizes)]
+    if args.arima:
+        comando.append('--arima')
+
+    saida = subprocess.run(comando, cwd=RAIZ, capture_output=True, text=True)
+    if saida.returncode != 0:
+        raise RuntimeError(f'Falha no grupo {group}:\n{saida.stderr[-2000:]}')
+
+    return json.loads(saida.stdout.strip().splitlines()[-1])
+
+
+def compare(resultados, baseline, tolerance):
+    anteriores = {r['nome']: r for r in baseline['resultados']}
+    comparacao = []
+
+    for resultado in resultados:
+        anterior = anteriores.get(resultado['nome'])
+        if anterior is None:
+            continue
+
+        # o menor tempo das repetições é o menos sensível à carga da máquina (as medianas ficam no json)
+        razao = resultado['min_s'] / anterior['min_s'] if anterior['min_s'] else np.inf
+        regressao = razao > 1 + tolerance and resultado['min_s'] - anterior['min_s'] > MIN_DELTA
+
+        comparacao.append({'nome': resultado['nome'], 'baseline_s': anterior['min_s'], 'atual_s': resultado['min_s'],
+                           'razao': razao, 'regressao': bool(regressao)})
+
+    return comparacao
+
+
+def report(resultados, comparacao):
+    por_nome = {c['nome']: c for c in comparacao}
+
+    print(f'{"benchmark":<58} {"mínimo (ms)":>13} {"baseline (ms)":>14} {"razão":>7}')
+    for resultado in resultados:
+        c = por_nome.get(resultado['nome'])
+        baseline = f'{c["baseline_s"] * 1000:>14.2f} {c["razao"]:>6.2f}x' if c else f'{"-":>14} {"-":>7}'
+        marca = '  <- regressão' if c and c['regressao'] else ''
+
+        print(f'{resultado["nome"][:58]:<58} {resultado["min_s"] * 1000:>13.2f} {baseline}{marca}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks dos transformadores, modelos, artefatos e abas da aplicação.')
+    parser.add_argument('--groups', nargs='+', choices=GROUPS, default=list(GROUPS))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000], help='tamanhos das séries sintéticas')
+    parser.add_argument('--train-sizes', type=int, nargs='+', default=[730, 11_000], help='tamanhos do treino dos modelos')
+    parser.add_argument('--horizon', type=int, default=30)
+    parser.add_argument('--arima', action='store_true', help='inclui o AutoARIMA (ajuste de vários segundos)')
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--tolerance', type=float, default=0.25, help='aumento relativo do menor tempo considerado regressão')
+    parser.add_argument('--save-baseline', action='store_true', help='salva os resultados como o novo baseline')
+    parser.add_argument('--strict', action='store_true', help='termina com erro se houver regressões')
+    parser.add_argument('--worker', choices=GROUPS, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(BENCHMARKS[args.worker](args)))
+        return
+
+    resultados = []
+    for group in args.groups:
+        inicio = time.perf_counter()
+        resultados.extend(run_group(group, args))
+        print(f'{group}: {time.perf_counter() - inicio:.1f}s', file=sys.stderr)
+
+    execucao = {'ambiente': environment(), 'resultados': resultados}
+
+    comparacao = []
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+        comparacao = compare(resultados, baseline, args.tolerance)
+        execucao['comparacao'] = comparacao
+
+        if baseline['ambiente'].get('cpus') != execucao['ambiente']['cpus'] or baseline['ambiente'].get('plataforma') != execucao['ambiente']['plataforma']:
+            print('Atenção: o baseline foi gerado em outro ambiente; as razões podem não ser comparáveis', file=sys.stderr)
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, f'{datetime.now():%Y%m%d_%H%M%S}.json')
+    with open(path, 'w') as f:
+        json.dump(execucao, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump({'ambiente': execucao['ambiente'], 'resultados': resultados}, f, indent=2)
+
+    report(resultados, comparacao)
+    print(f'\nresultados salvos em {os.path.relpath(path, RAIZ)}')
+
+    regressoes = [c['nome'] for c in comparacao if c['regressao']]
+    if regressoes:
+        print(f'{len(regressoes)} regressões em relação ao baseline: {", ".join(regressoes)}')
+
+        if args.strict:
+            raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
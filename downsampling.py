@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+
+
+# quantidade máxima de pontos enviada ao navegador por série em cada gráfico
+POINT_BUDGET = 2000
+
+
+def _bucket_edges(n, n_out):
+    # o primeiro e o último ponto são mantidos; os demais são divididos em n_out - 2 grupos
+    return np.floor(np.linspace(1, n - 1, n_out - 1)).astype('int64')
+
+
+def lttb(x, y, n_out=POINT_BUDGET):
+    # Largest-Triangle-Three-Buckets: de cada grupo é mantido o ponto que forma o maior triângulo com o ponto
+    # escolhido no grupo anterior e a média do grupo seguinte, preservando picos e vales visíveis no gráfico
+    # retorna os índices dos pontos selecionados (x precisa estar em ordem crescente)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+
+    edges = _bucket_edges(n, n_out)
+    tamanhos = np.diff(edges)
+
+    # a média de cada grupo não depende dos pontos escolhidos, então é calculada de uma vez
+    medias_x = np.append(np.add.reduceat(x[:-1], edges[:-1]) / tamanhos, x[-1])
+    medias_y = np.append(np.add.reduceat(y[:-1], edges[:-1]) / tamanhos, y[-1])
+
+    selecionados = np.empty(n_out, dtype='int64')
+    selecionados[0] = 0
+    selecionados[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        inicio, fim = edges[i], edges[i + 1]
+
+        areas = np.abs((x[a] - medias_x[i + 1]) * (y[inicio:fim] - y[a]) - (x[a] - x[inicio:fim]) * (medias_y[i + 1] - y[a]))
+        a = inicio + int(np.argmax(areas))
+        selecionados[i + 1] = a
+
+    return selecionados
+
+
+def minmax(y, n_out=POINT_BUDGET):
+    # mantém o menor e o maior valor de cada grupo (n_out / 2 grupos), na ordem original
+    n = len(y)
+    if n_out >= n or n_out < 4:
+        return np.arange(n)
+
+    n_grupos = n_out // 2
+    tamanho = -(-n // n_grupos)
+
+    # os grupos têm o mesmo tamanho; o último é completado com NaN para permitir o reshape
+    valores = np.full(n_grupos * tamanho, np.nan)
+    valores[:n] = y
+    valores = valores.reshape(n_grupos, tamanho)
+
+    validos = ~np.isnan(valores).all(axis=1)
+    base = np.arange(n_grupos)[validos] * tamanho
+
+    indices = np.concatenate([base + np.nanargmin(valores[validos], axis=1), base + np.nanargmax(valores[validos], axis=1)])
+    return np.unique(indices)
+
+
+def downsample(ds, y, n_out=POINT_BUDGET, method='lttb'):
+    # ds e y em ordem crescente de data; retorna um dataframe (ds, y) com no máximo n_out pontos
+    ds = np.asarray(ds, dtype='datetime64[ns]')
+    y = np.asarray(y, dtype='float64')
+
+    if method == 'lttb':
+        # as datas são convertidas em dias para que o cálculo das áreas não perca precisão
+        x = (ds - ds[0]) / np.timedelta64(1, 'D') if len(ds) else ds.astype('float64')
+        indices = lttb(x, y, n_out)
+    elif method == 'minmax':
+        indices = minmax(y, n_out)
+    else:
+        raise ValueError(f'Método de downsampling desconhecido: {method}')
+
+    return pd.DataFrame({'ds': ds[indices], 'y': y[indices]})
+
+
+def date_window(ds, inicio=None, fim=None):
+    # fatia [inicio, fim] de um array de datas em ordem crescente, por busca binária
+    esquerda = 0 if inicio is None else np.searchsorted(ds, np.datetime64(pd.Timestamp(inicio), 'ns'), side='left')
+    direita = len(ds) if fim is None else np.searchsorted(ds, np.datetime64(pd.Timestamp(fim), 'ns'), side='right')
+
+    return slice(esquerda, direita)
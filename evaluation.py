@@ -0,0 +1,350 @@
+import argparse
+import glob
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from itertools import product
+
+import joblib
+import pandas as pd
+from sklearn.pipeline import Pipeline
+
+import autocorrelation
+import instrumentation
+import metrics
+import series
+import stationarity
+from utils import RenameColumns, CastToDatetime, FillMissingData, AddColumn, TransformIndexToColumn, data_fingerprint
+
+
+ARTIFACTS_DIR = 'artefatos'
+
+# configuração da avaliação exibida na aba "Performance dos Modelos"
+# qualquer alteração aqui gera uma nova versão do artefato
+MODEL_CONFIGS = {
+    'treino_inicio': '2022-10-01',
+    'valid_inicio': '2023-10-01',
+    'valid_fim': '2024-01-22',
+    'grafico_inicio': '2023-06-01',
+    'level': [90],
+    'acf_lags': 730,
+    'seasonal_naive': {'season_length': [346]},
+    'seasonal_window_average': {'season_length': [181], 'window_size': [2]},
+    'seasonal_exponential_smoothing_optimized': {'season_length': [171]},
+    'auto_arima': {'season_length': 30},
+}
+
+# versão do formato do artefato: alterações no conteúdo gerado pelo build_evaluation devem incrementá-la, para
+# que os arquivos antigos com os mesmos dados e configuração não sejam reaproveitados
+ARTIFACT_SCHEMA = 2
+
+# artefatos mantidos em disco (os das versões mais recentes dos dados) e em memória, por processo
+KEEP = 3
+MAX_LOADED = 2
+MAX_FINGERPRINTS = 8
+
+_artifacts = OrderedDict()
+_fingerprints = OrderedDict()
+_building = set()
+_lock = threading.Lock()
+
+
+def _fingerprint(serie, configs, adf_lags):
+    return data_fingerprint(serie.frame(), configs, adf_lags, {'schema': ARTIFACT_SCHEMA})
+
+
+def evaluation_fingerprint(serie, configs=MODEL_CONFIGS):
+    # os lags do ADF reutilizados pela análise incremental de estacionariedade também determinam o resultado,
+    # então fazem parte da chave (os que o stationarity.analyze utilizará para esta série)
+    # calculada uma vez por versão dos dados e estado do arquivo da análise: cada renderização da aba consulta
+    # apenas o mtime do arquivo, sem relê-lo nem refazer o hash da série
+    key = (serie.version, stationarity.store_state(), json.dumps(configs, sort_keys=True, default=str))
+
+    with _lock:
+        fingerprint = _fingerprints.get(key)
+        if fingerprint is not None:
+            _fingerprints.move_to_end(key)
+            return fingerprint
+
+    fingerprint = _fingerprint(serie, configs, stationarity.expected_lag_key(serie))
+
+    with _lock:
+        _fingerprints[key] = fingerprint
+        while len(_fingerprints) > MAX_FINGERPRINTS:
+            _fingerprints.popitem(last=False)
+
+    return fingerprint
+
+
+def artifact_path(fingerprint):
+    return os.path.join(ARTIFACTS_DIR, f'avaliacao_{fingerprint[:16]}.joblib')
+
+
+def _fit_predict(model, treino, valid, h, level=None):
+    from statsforecast import StatsForecast
+
+    sf = StatsForecast(models=[model], freq='D', n_jobs=-1)
+
+    with instrumentation.stage(f'avaliacao/{model}/ajuste'):
+        sf.fit(treino)
+
+    with instrumentation.stage(f'avaliacao/{model}/predicao'):
+        forecast = sf.predict(h=h, level=level) if level else sf.predict(h=h)
+    return forecast.reset_index().merge(valid, on=['ds', 'unique_id'], how='left')
+
+
+def _metrics(forecast, column):
+    resultado = metrics.scalar(forecast['y'].to_numpy(), forecast[column].to_numpy())
+    return {metrica: resultado[metrica] for metrica in ('wmape', 'rmse', 'mape')}
+
+
+def expand_grid(grid):
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in product(*(grid[key] for key in keys))]
+
+
+def compare_models(candidatos, treino, valid, level=None):
+    # todos os candidatos (e todas as combinações das grades) são ajustados em uma única chamada do StatsForecast
+    # e as previsões são unidas aos valores reais uma única vez, em um dataframe largo
+    # candidatos: {nome: (classe do modelo, grade, possui intervalo de previsão)}
+    from statsforecast import StatsForecast
+
+    configs = [
+        (nome, params, f'{nome}__{i}', intervalo)
+        for nome, (build_model, grid, intervalo) in candidatos.items()
+        for i, params in enumerate(expand_grid(grid))
+    ]
+    modelos = [candidatos[nome][0](alias=alias, **params) for nome, params, alias, _ in configs]
+
+    sf = StatsForecast(models=modelos, freq='D', n_jobs=1)
+
+    with instrumentation.stage('avaliacao/candidatos/ajuste', modelos=len(modelos)):
+        sf.fit(treino)
+
+    h = len(valid)
+    colunas = {'unique_id': treino['unique_id'].iloc[0], 'ds': pd.date_range(sf.last_dates[0] + pd.Timedelta(days=1), periods=h, freq='D')}
+
+    # a previsão é obtida diretamente de cada modelo ajustado, pois nem todos suportam intervalos de previsão
+    for j, (nome, params, alias, intervalo) in enumerate(configs):
+        with instrumentation.stage(f'avaliacao/{nome}/predicao'):
+            resultado = sf.fitted_[0, j].predict(h=h, level=level) if intervalo and level else sf.fitted_[0, j].predict(h=h)
+
+        colunas[alias] = resultado['mean']
+        for lv in (level or []) if intervalo else []:
+            colunas[f'{alias}-lo-{lv}'] = resultado[f'lo-{lv}']
+            colunas[f'{alias}-hi-{lv}'] = resultado[f'hi-{lv}']
+
+    forecast = pd.DataFrame(colunas).merge(valid, on=['ds', 'unique_id'], how='left')
+
+    # WMAPE de todas as combinações em uma única passagem (combinações x passos)
+    aliases = [alias for _, _, alias, _ in configs]
+    scores = metrics.compute(forecast['y'].to_numpy(), forecast[aliases].to_numpy(dtype='float64').T)['wmape']
+
+    resultados = {}
+    for nome in candidatos:
+        # mantém a previsão da melhor combinação de cada modelo, com as colunas nomeadas pelo modelo
+        indices = [i for i, config in enumerate(configs) if config[0] == nome]
+        _, params, alias, _ = configs[min(indices, key=lambda i: scores[i])]
+
+        colunas_modelo = [c for c in forecast.columns if c == alias or c.startswith(f'{alias}-')]
+        forecast_modelo = forecast[['unique_id', 'ds', *colunas_modelo, 'y']].rename(columns=lambda c: c.replace(alias, nome))
+
+        resultados[nome] = {'params': params, 'forecast': forecast_modelo, **_metrics(forecast_modelo, nome)}
+
+    return resultados
+
+
+def build_evaluation(serie, configs=MODEL_CONFIGS):
+    from statsmodels.tsa.seasonal import seasonal_decompose
+    from statsforecast.models import (AutoARIMA, Naive, SeasonalExponentialSmoothingOptimized,
+                                      SeasonalNaive, SeasonalWindowAverage)
+
+    inicio = time.perf_counter()
+
+    df_serie = serie.indexed()
+
+    # seasonal decompose
+    with instrumentation.stage('avaliacao/seasonal_decompose'):
+        results = seasonal_decompose(df_serie)
+    decomposicao = pd.DataFrame({
+        'observado': results.observed.squeeze(),
+        'tendencia': results.trend,
+        'sazonalidade': results.seasonal,
+        'residuos': results.resid,
+    })
+
+    # ADF e transformações, atualizados de forma incremental a partir da última análise armazenada
+    estacionariedade = stationarity.analyze(serie)
+    transformacoes = estacionariedade.frames()
+    df_s = transformacoes['estacionaria']
+
+    # ACF (FFT) e PACF (Levinson-Durbin), com os mesmos valores e intervalos do plot_acf/plot_pacf do statsmodels;
+    # calculados uma vez para todos os lags exibíveis, a aba apenas recorta a quantidade selecionada
+    with instrumentation.stage('avaliacao/acf_pacf'):
+        acf_values, acf_confint = autocorrelation.acf(df_s['y'], nlags=configs['acf_lags'], alpha=0.05)
+        pacf_values, pacf_confint = autocorrelation.pacf(df_s['y'], nlags=configs['acf_lags'], alpha=0.05)
+
+    # dados no formato do statsforecast
+    df_sf = serie.statsforecast()
+
+    treino = df_sf[(df_sf['ds'] >= pd.to_datetime(configs['treino_inicio'])) & (df_sf['ds'] < pd.to_datetime(configs['valid_inicio']))]
+    valid = df_sf[(df_sf['ds'] >= pd.to_datetime(configs['valid_inicio'])) & (df_sf['ds'] < pd.to_datetime(configs['valid_fim']))]
+    level = configs['level']
+
+    modelos = compare_models({
+        'Naive': (Naive, {}, True),
+        'SeasonalNaive': (SeasonalNaive, configs['seasonal_naive'], True),
+        'SeasWA': (SeasonalWindowAverage, configs['seasonal_window_average'], False),
+        'SeasESOpt': (SeasonalExponentialSmoothingOptimized, configs['seasonal_exponential_smoothing_optimized'], False),
+    }, treino, valid, level)
+
+    # o AutoARIMA é executado sobre a série estacionária
+    pipeline_auto_arima = Pipeline([
+        ('transform_index_to_column', TransformIndexToColumn()),
+        ('rename_columns', RenameColumns()),
+        ('cast_to_datetime', CastToDatetime()),
+        ('fill_missing_data', FillMissingData()),
+        ('add_column', AddColumn())
+    ])
+
+    df_s_sf = pipeline_auto_arima.transform(df_s)
+
+    treino_auto_arima = df_s_sf[(df_s_sf['ds'] >= pd.to_datetime(configs['treino_inicio'])) & (df_s_sf['ds'] < pd.to_datetime(configs['valid_inicio']))]
+    valid_auto_arima = df_s_sf[df_s_sf['ds'] >= pd.to_datetime(configs['valid_inicio'])]
+
+    forecast_auto_arima = _fit_predict(AutoARIMA(season_length=configs['auto_arima']['season_length']), treino_auto_arima, valid_auto_arima, valid_auto_arima.index.nunique(), level)
+    metricas_auto_arima = _metrics(forecast_auto_arima, 'AutoARIMA')
+    modelos['AutoARIMA'] = {
+        'params': dict(configs['auto_arima']),
+        'forecast': forecast_auto_arima,
+        'wmape': metricas_auto_arima['wmape'],
+        'mape': metricas_auto_arima['mape'],
+    }
+
+    grafico_inicio = pd.to_datetime(configs['grafico_inicio'])
+
+    return {
+        'fingerprint': _fingerprint(serie, configs, estacionariedade.lag_key()),
+        'gerado_em': pd.Timestamp.now(),
+        'tempo_execucao': time.perf_counter() - inicio,
+        'serie': df_serie,
+        'serie_statsforecast': df_sf,
+        'decomposicao': decomposicao,
+        'transformacoes': transformacoes,
+        'adf': estacionariedade.adf,
+        'acf': {'valores': acf_values, 'confint': acf_confint},
+        'pacf': {'valores': pacf_values, 'confint': pacf_confint},
+        'modelos': modelos,
+        'real_filtrado': df_sf[df_sf['ds'] >= grafico_inicio],
+        'estacionaria_filtrada': df_s_sf[df_s_sf['ds'] >= grafico_inicio],
+    }
+
+
+def save_artifact(artifact):
+    os.makedirs(ARTIFACTS_DIR, exist_ok=True)
+
+    # escrita em arquivo temporário seguida de rename para que leitores nunca vejam um artefato parcial
+    path = artifact_path(artifact['fingerprint'])
+    tmp_path = f'{path}.tmp{os.getpid()}'
+    joblib.dump(artifact, tmp_path)
+    os.replace(tmp_path, path)
+    _prune(path)
+
+    return path
+
+
+def _prune(current_path):
+    # mantém apenas os KEEP artefatos mais recentes; os demais correspondem a versões antigas dos dados
+    antigos = sorted(glob.glob(os.path.join(ARTIFACTS_DIR, 'avaliacao_*.joblib')), key=os.path.getmtime, reverse=True)
+    antigos = [path for path in antigos if path != current_path]
+
+    for path in antigos[KEEP - 1:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _remember(fingerprint, artifact):
+    # chamado com o _lock adquirido; descarta os artefatos menos utilizados além de MAX_LOADED
+    _artifacts[fingerprint] = artifact
+    _artifacts.move_to_end(fingerprint)
+
+    while len(_artifacts) > MAX_LOADED:
+        _artifacts.popitem(last=False)
+
+
+def load_artifact(fingerprint):
+    # o artefato é lido do disco uma única vez por processo e compartilhado entre as sessões; cada consulta
+    # o marca como o mais recente, para que _remember descarte os menos utilizados
+    with _lock:
+        artifact = _artifacts.get(fingerprint)
+        if artifact is not None:
+            _artifacts.move_to_end(fingerprint)
+            return artifact
+
+        path = artifact_path(fingerprint)
+        if not os.path.exists(path):
+            return None
+
+        artifact = joblib.load(path)
+        _remember(fingerprint, artifact)
+
+    return artifact
+
+
+def build_and_save(serie, configs=MODEL_CONFIGS):
+    with instrumentation.stage('avaliacao/total'):
+        artifact = build_evaluation(serie, configs)
+    save_artifact(artifact)
+
+    with _lock:
+        _remember(artifact['fingerprint'], artifact)
+
+    return artifact
+
+
+def start_background_build(serie, fingerprint, configs=MODEL_CONFIGS):
+    # dispara a geração do artefato em uma thread, garantindo uma única execução por versão dos dados
+    with _lock:
+        if fingerprint in _building or fingerprint in _artifacts:
+            return False
+        _building.add(fingerprint)
+
+    def run():
+        try:
+            build_and_save(serie, configs)
+        except Exception as e:
+            instrumentation.event('avaliacao/erro', level=logging.ERROR, fingerprint=fingerprint[:16], erro=str(e))
+        finally:
+            with _lock:
+                _building.discard(fingerprint)
+
+    threading.Thread(target=run, name=f'avaliacao-{fingerprint[:8]}', daemon=True).start()
+    return True
+
+
+def is_building(fingerprint):
+    with _lock:
+        return fingerprint in _building
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Gera o artefato de avaliação dos modelos exibido na aba "Performance dos Modelos".')
+    parser.add_argument('--csv', default='dados/dados_preco_petroleo.csv', help='arquivo CSV com as colunas data e preco_petroleo_brent')
+    args = parser.parse_args()
+
+    serie = series.preprocess(pd.read_csv(args.csv))
+    artifact = build_and_save(serie)
+
+    print(f'Artefato gerado em {artifact_path(artifact["fingerprint"])} ({artifact["tempo_execucao"]:.1f}s)')
+
+    for nome, modelo in artifact['modelos'].items():
+        print(f'{nome}: WMAPE {modelo["wmape"]:.2%} | MAPE {modelo["mape"]:.2%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+import io
+import json
+import threading
+from collections import OrderedDict
+
+import instrumentation
+
+
+# largura máxima exibida pelo Streamlit (imagens maiores são redimensionadas a cada exibição)
+MAX_WIDTH = 1460
+
+
+class FigureCache:
+    # imagens já rasterizadas dos gráficos do matplotlib, por fingerprint dos dados, nome do gráfico e parâmetros;
+    # o total em memória é limitado (max_bytes) e as imagens menos acessadas recentemente são descartadas primeiro
+    def __init__(self, max_bytes=64 * 2 ** 20):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._images = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(fingerprint, name, params=None, fmt='png', dpi=200):
+        return (fingerprint, name, json.dumps(params or {}, sort_keys=True, default=str), fmt, dpi)
+
+    def get(self, key):
+        with self._lock:
+            image = self._images.get(key)
+
+            if image is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._images.move_to_end(key)
+            return image
+
+    def put(self, key, image):
+        with self._lock:
+            self._put(key, image)
+
+    def _put(self, key, image):
+        # chamado com o _lock adquirido
+        if key in self._images:
+            self.total_bytes -= len(self._images.pop(key))
+
+        self._images[key] = image
+        self.total_bytes += len(image)
+
+        while self.total_bytes > self.max_bytes and len(self._images) > 1:
+            _, removida = self._images.popitem(last=False)
+            self.total_bytes -= len(removida)
+
+    def render(self, fingerprint, name, build_figure, params=None, fmt='png', dpi=200):
+        # build_figure só é chamada (e a figura rasterizada) quando a imagem não está em cache; como em
+        # forecasting.ForecastCache, sessões simultâneas que pedem a mesma imagem aguardam a única rasterização em
+        # andamento, feita fora do lock
+        key = self.key(fingerprint, name, params, fmt, dpi)
+
+        while True:
+            with self._lock:
+                image = self._images.get(key)
+
+                if image is not None:
+                    self.hits += 1
+                    self._images.move_to_end(key)
+                    return image
+
+                rasterizacao = self._pending.get(key)
+                if rasterizacao is None:
+                    rasterizacao = self._pending[key] = threading.Event()
+                    self.misses += 1
+                    break
+
+            # se a rasterização em andamento falhar, a próxima volta faz uma nova tentativa
+            rasterizacao.wait()
+
+        try:
+            with instrumentation.stage(f'grafico/{name}/matplotlib'):
+                fig = build_figure()
+
+            with instrumentation.stage(f'grafico/{name}/rasterizacao'):
+                image = to_bytes(fig, fmt, dpi)
+
+            with self._lock:
+                self._put(key, image)
+
+        finally:
+            with self._lock:
+                del self._pending[key]
+            rasterizacao.set()
+
+        return image
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hits / total if total else None,
+                'imagens': len(self._images), 'memoria_mb': self.total_bytes / 2 ** 20,
+                'em_rasterizacao': len(self._pending)}
+
+
+def to_bytes(fig, fmt='png', dpi=200, max_width=MAX_WIDTH):
+    import matplotlib.pyplot as plt
+
+    # mesmos parâmetros utilizados pelo st.pyplot
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=fmt, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+
+    if fmt != 'png':
+        return buffer.getvalue()
+
+    from PIL import Image
+
+    # a imagem já é armazenada na largura exibida, para que o redimensionamento não se repita a cada exibição
+    imagem = Image.open(io.BytesIO(buffer.getvalue()))
+    if imagem.width <= max_width:
+        return buffer.getvalue()
+
+    imagem = imagem.resize((max_width, int(imagem.height * max_width / imagem.width)), resample=Image.BILINEAR)
+
+    buffer = io.BytesIO()
+    imagem.save(buffer, format='PNG')
+    return buffer.getvalue()
@@ -0,0 +1,116 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import instrumentation
+
+# as funções compiladas pelo numba no ajuste dos modelos ficam em cache no disco, evitando recompilá-las a cada
+# reinício do processo (precisa ser definido antes da primeira importação do statsforecast)
+os.environ.setdefault('NIXTLA_NUMBA_CACHE', '1')
+
+
+MAX_HORIZON = 30
+
+
+def state_window(model):
+    # quantidade de observações finais que determina o estado dos modelos sazonais (ex.: SeasonalWindowAverage)
+    return max(getattr(m, 'season_length', 1) * getattr(m, 'window_size', 1) for m in model.models)
+
+
+def update_state(model, serie, unique_id='value'):
+    # o modelo publicado foi ajustado uma única vez; com os dados sincronizados, um novo ajuste apenas sobre a
+    # janela final (season_length * window_size dias) produz o mesmo estado de um ajuste na série inteira e
+    # ancora a previsão no último dado disponível, de forma que o horizonte é sempre o pedido pelo usuário
+    from statsforecast import StatsForecast
+
+    janela = state_window(model)
+    df = serie.statsforecast(unique_id).iloc[:janela].iloc[::-1]
+
+    atualizado = StatsForecast(models=[m.new() for m in model.models], freq=model.freq, n_jobs=1)
+    return atualizado.fit(df)
+
+
+class ForecastCache:
+    # a previsão do maior horizonte é calculada uma única vez por versão do modelo e dos dados e cada requisição
+    # recebe uma fatia dela; como os modelos utilizados não dependem do horizonte para calcular cada passo,
+    # a fatia é idêntica à previsão feita diretamente com o horizonte pedido
+    def __init__(self, max_entries=4):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._forecasts = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(artifact, data_version, max_h):
+        return (artifact.name, artifact.version, artifact.sha256, data_version, max_h)
+
+    def _compute(self, artifact, serie, max_h):
+        inicio = time.perf_counter()
+
+        with instrumentation.stage(f'previsao/{artifact.name}/ajuste'):
+            atualizado = update_state(artifact.model, serie)
+
+        with instrumentation.stage(f'previsao/{artifact.name}/predicao'):
+            forecast = atualizado.predict(h=max_h).reset_index(drop=True)
+        instrumentation.event(f'previsao/{artifact.name}/calculada', versao=artifact.version, ultimo_dado=f'{serie.last_date:%Y-%m-%d}',
+                              h=max_h, ms=round((time.perf_counter() - inicio) * 1000, 3))
+
+        return forecast
+
+    def get(self, artifact, serie, h, max_h=MAX_HORIZON):
+        if h > max_h:
+            raise ValueError(f'Horizonte {h} maior que o máximo em cache ({max_h})')
+
+        key = self.key(artifact, serie.version, max_h)
+
+        # o lock protege apenas a consulta, a inserção e a remoção: o ajuste é feito fora dele, então as
+        # previsões já calculadas (ex.: da versão anterior, enquanto a nova é ajustada) continuam sendo servidas;
+        # requisições simultâneas da mesma chave aguardam o único ajuste em andamento
+        while True:
+            with self._lock:
+                forecast = self._forecasts.get(key)
+
+                if forecast is not None:
+                    self.hits += 1
+                    self._forecasts.move_to_end(key)
+                    return forecast.iloc[:h]
+
+                calculo = self._pending.get(key)
+                if calculo is None:
+                    calculo = self._pending[key] = threading.Event()
+                    self.misses += 1
+                    break
+
+            # se o ajuste em andamento falhar, a próxima volta faz uma nova tentativa
+            calculo.wait()
+
+        try:
+            forecast = self._compute(artifact, serie, max_h)
+
+            with self._lock:
+                # um novo modelo ou uma nova versão dos dados invalida as previsões anteriores do mesmo modelo
+                for antiga in [k for k in self._forecasts if k[0] == artifact.name]:
+                    del self._forecasts[antiga]
+
+                self._forecasts[key] = forecast
+                while len(self._forecasts) > self.max_entries:
+                    self._forecasts.popitem(last=False)
+
+        finally:
+            with self._lock:
+                del self._pending[key]
+            calculo.set()
+
+        return forecast.iloc[:h]
+
+    def invalidate(self):
+        with self._lock:
+            self._forecasts.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hits / total if total else None, 'entradas': len(self._forecasts),
+                'em_calculo': len(self._pending)}
@@ -0,0 +1,189 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+
+
+# número no formato já normalizado (ponto decimal, sem separador de milhar)
+_NUMERO = r'^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$'
+
+ERRORS = ('raise', 'coerce', 'drop')
+
+
+class ParseError(ValueError):
+    # linhas que não puderam ser convertidas, com a posição, a coluna e o valor original de cada uma
+    def __init__(self, bad_rows):
+        self.bad_rows = bad_rows
+
+        exemplos = ', '.join(f'linha {r.linha} ({r.coluna}): {r.valor!r}' for r in bad_rows.head(5).itertuples())
+        super().__init__(f'{len(bad_rows)} valores inválidos: {exemplos}{"..." if len(bad_rows) > 5 else ""}')
+
+
+def _check_errors(errors):
+    if errors not in ERRORS:
+        raise ValueError(f"errors deve ser {', '.join(map(repr, ERRORS))}, recebido: {errors!r}")
+
+
+def _to_arrow(values):
+    if isinstance(values, (pa.Array, pa.ChunkedArray)):
+        return values
+
+    try:
+        return pa.array(values, from_pandas=True)
+
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # colunas object com tipos misturados (ex.: números e textos) são tratadas como texto
+        return pa.array([None if pd.isna(valor) else str(valor) for valor in values], type=pa.string())
+
+
+def _to_numpy(values):
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+
+    return values.to_numpy(zero_copy_only=False)
+
+
+def _text(values):
+    # texto sem espaços nas bordas; strings vazias são tratadas como valores ausentes (não como inválidos)
+    texto = pc.utf8_trim_whitespace(pc.cast(values, pa.string()))
+    return pc.if_else(pc.equal(texto, ''), pa.scalar(None, pa.string()), texto)
+
+
+def bad_rows_frame(column, values, invalidos):
+    posicoes = np.flatnonzero(invalidos)
+    return pd.DataFrame({'linha': posicoes, 'coluna': column, 'valor': pc.take(values, pa.array(posicoes)).to_pylist()})
+
+
+def _report(column, values, invalidos, errors):
+    bad_rows = bad_rows_frame(column, values, invalidos)
+    if errors == 'raise' and len(bad_rows):
+        raise ParseError(bad_rows)
+
+    return bad_rows
+
+
+def parse_decimal(values, decimal='auto', dtype='float64', column='y', errors='raise'):
+    # conversão vetorizada (Arrow) de preços em texto com vírgula ou ponto decimal, sem objetos Python por linha;
+    # com decimal='auto', o último separador do valor é o decimal e o outro é tratado como separador de milhar
+    # ("1.234,56" e "1,234.56" -> 1234.56); retorna os valores e as linhas inválidas
+    _check_errors(errors)
+    if decimal not in ('auto', ',', '.'):
+        raise ValueError(f"decimal deve ser 'auto', ',' ou '.', recebido: {decimal!r}")
+
+    values = _to_arrow(values)
+
+    if pa.types.is_integer(values.type) or pa.types.is_floating(values.type) or pa.types.is_decimal(values.type):
+        return _to_numpy(pc.cast(values, pa.float64())).astype(dtype, copy=False), bad_rows_frame(column, values, [])
+
+    texto = _text(values)
+
+    # na maioria das bases só um dos separadores aparece, e basta uma substituição (ou nenhuma) na coluna inteira;
+    # a decisão linha a linha (expressão regular) só é necessária quando os dois aparecem
+    tem_virgula = pc.any(pc.match_substring(texto, ',')).as_py()
+    tem_ponto = pc.any(pc.match_substring(texto, '.')).as_py()
+
+    if not tem_virgula:
+        normalizado = texto
+    elif decimal == '.':
+        normalizado = pc.replace_substring(texto, ',', '')
+    elif not tem_ponto:
+        normalizado = pc.replace_substring(texto, ',', '.')
+    elif decimal == ',':
+        normalizado = pc.replace_substring(pc.replace_substring(texto, '.', ''), ',', '.')
+    else:
+        virgula_decimal = pc.replace_substring(pc.replace_substring(texto, '.', ''), ',', '.')
+        ponto_decimal = pc.replace_substring(texto, ',', '')
+        normalizado = pc.if_else(pc.match_substring_regex(texto, r',[^.]*$'), virgula_decimal, ponto_decimal)
+
+    try:
+        numeros = pc.cast(normalizado, pa.float64())
+        bad_rows = bad_rows_frame(column, values, [])
+
+    except pa.ArrowInvalid:
+        # só quando há valores inválidos: as linhas são identificadas uma a uma e reportadas
+        invalidos = _to_numpy(pc.fill_null(pc.invert(pc.match_substring_regex(normalizado, _NUMERO)), False))
+        bad_rows = _report(column, values, invalidos, errors)
+        numeros = pc.cast(pc.if_else(pa.array(invalidos), pa.scalar(None, pa.string()), normalizado), pa.float64())
+
+    return _to_numpy(numeros).astype(dtype, copy=False), bad_rows
+
+
+def parse_dates(values, date_format='%Y-%m-%d', column='ds', errors='raise'):
+    # datas em texto -> datetime64[ns]; sem date_format, aceita qualquer data ISO 8601 (conversão pelo pandas)
+    _check_errors(errors)
+    values = _to_arrow(values)
+
+    if pa.types.is_timestamp(values.type) or pa.types.is_date(values.type):
+        datas = pc.cast(values, pa.timestamp('ns', tz=getattr(values.type, 'tz', None)))
+        return _to_numpy(datas).astype('datetime64[ns]'), bad_rows_frame(column, values, [])
+
+    texto = _text(values)
+
+    if date_format is not None:
+        datas = _to_numpy(pc.strptime(texto, format=date_format, unit='ns', error_is_null=True))
+    else:
+        datas = pd.to_datetime(_to_numpy(texto), format='ISO8601', errors='coerce', cache=True).to_numpy(dtype='datetime64[ns]')
+
+    invalidos = np.isnat(datas) & ~_to_numpy(pc.is_null(texto))
+    return datas.astype('datetime64[ns]', copy=False), _report(column, values, invalidos, errors)
+
+
+def parse_categories(values):
+    # identificador das séries como categoria: um código inteiro por linha e cada nome armazenado uma única vez
+    if isinstance(values, (pa.Array, pa.ChunkedArray)):
+        if not pa.types.is_dictionary(values.type):
+            values = pc.dictionary_encode(values)
+
+        return pd.Categorical(values.to_pandas())
+
+    return pd.Categorical(values)
+
+
+def ingest(data, date_column='data', price_column='preco_petroleo_brent', id_column=None, dtype='float64',
+           decimal='auto', date_format='%Y-%m-%d', errors='raise'):
+    # DataFrame ou tabela Arrow da fonte -> colunas tipadas (unique_id categórico, ds datetime64[ns], y float),
+    # no formato esperado pelo pipeline e pelo statsforecast; retorna os dados e as linhas inválidas
+    _check_errors(errors)
+    coluna = data.column if isinstance(data, pa.Table) else data.__getitem__
+
+    # as linhas inválidas de todas as colunas são reunidas antes de decidir o que fazer com elas
+    ds, datas_invalidas = parse_dates(coluna(date_column), date_format, 'ds', 'coerce')
+    y, precos_invalidos = parse_decimal(coluna(price_column), decimal, dtype, 'y', 'coerce')
+
+    bad_rows = pd.concat([datas_invalidas, precos_invalidos], ignore_index=True).sort_values('linha', kind='stable', ignore_index=True)
+    if errors == 'raise' and len(bad_rows):
+        raise ParseError(bad_rows)
+
+    colunas = {}
+    if id_column is not None:
+        colunas['unique_id'] = parse_categories(coluna(id_column))
+
+    colunas['ds'] = ds
+    colunas['y'] = y
+    df = pd.DataFrame(colunas)
+
+    if errors == 'drop' and len(bad_rows):
+        df = df.drop(index=bad_rows['linha'].unique()).reset_index(drop=True)
+
+    return df, bad_rows
+
+
+def read_csv(path, date_column='data', price_column='preco_petroleo_brent', id_column=None, dtype='float64',
+             decimal='auto', date_format='%Y-%m-%d', delimiter=',', errors='raise'):
+    # leitura pelo Arrow (multithread), com as colunas lidas como texto e convertidas pelo ingest; o identificador
+    # é lido diretamente como dicionário, sem criar uma string Python por linha
+    column_types = {date_column: pa.string(), price_column: pa.string()}
+    colunas = [date_column, price_column]
+
+    if id_column is not None:
+        column_types[id_column] = pa.dictionary(pa.int32(), pa.string())
+        colunas.insert(0, id_column)
+
+    tabela = pa_csv.read_csv(
+        path,
+        parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+        convert_options=pa_csv.ConvertOptions(column_types=column_types, include_columns=colunas, strings_can_be_null=True),
+    )
+
+    return ingest(tabela, date_column, price_column, id_column, dtype, decimal, date_format, errors)
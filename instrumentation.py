@@ -0,0 +1,201 @@
+import contextlib
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import unicodedata
+from collections import Counter, deque
+from datetime import datetime
+
+import numpy as np
+
+
+# quantidade de execuções recentes mantidas por etapa para o cálculo das latências
+HISTORY_SIZE = 200
+
+PROFILE_DIR = 'artefatos/perfis'
+PROFILE_INTERVAL = 0.005
+
+logger = logging.getLogger('brent.metricas')
+
+
+class _JsonFormatter(logging.Formatter):
+    def format(self, record):
+        return json.dumps({'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'), **record.metricas})
+
+
+def configure_logging(destination=None):
+    # logs estruturados (uma linha JSON por etapa), habilitados pela variável de ambiente BRENT_METRICS_LOG
+    # com 'stderr' ou o caminho de um arquivo; sem ela, as etapas são apenas acumuladas em memória
+    destination = destination or os.environ.get('BRENT_METRICS_LOG')
+    if not destination or logger.handlers:
+        return
+
+    handler = logging.StreamHandler(sys.stderr) if destination == 'stderr' else logging.FileHandler(destination)
+    handler.setFormatter(_JsonFormatter())
+
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+class StageTimings:
+    # latências das etapas nomeadas (carga dos dados, pré-processamento, ajuste de cada modelo, cada gráfico...),
+    # compartilhadas por todas as sessões e threads do processo
+    def __init__(self, history_size=HISTORY_SIZE):
+        self.history_size = history_size
+        self._recentes = {}
+        self._execucoes = Counter()
+        self._erros = Counter()
+        self._totais = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, name, duration, erro=False, **fields):
+        with self._lock:
+            if name not in self._recentes:
+                self._recentes[name] = deque(maxlen=self.history_size)
+
+            self._recentes[name].append(duration)
+            self._execucoes[name] += 1
+            self._totais[name] += duration
+            if erro:
+                self._erros[name] += 1
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(name, extra={'metricas': {'etapa': name, 'ms': round(duration * 1000, 3), 'erro': erro,
+                                                  'thread': threading.current_thread().name, **fields}})
+
+    @contextlib.contextmanager
+    def stage(self, name, **fields):
+        inicio = time.perf_counter()
+        erro = False
+
+        try:
+            yield
+        except BaseException:
+            erro = True
+            raise
+        finally:
+            self.record(name, time.perf_counter() - inicio, erro, **fields)
+
+    def summary(self):
+        with self._lock:
+            recentes = {name: np.array(valores) for name, valores in self._recentes.items()}
+            execucoes, erros, totais = dict(self._execucoes), dict(self._erros), dict(self._totais)
+
+        resumo = []
+        for name, valores in recentes.items():
+            p50, p95 = np.percentile(valores, [50, 95]) * 1000
+            resumo.append({'etapa': name, 'execucoes': execucoes[name], 'erros': erros.get(name, 0),
+                           'ultima_ms': valores[-1] * 1000, 'p50_ms': p50, 'p95_ms': p95, 'max_ms': valores.max() * 1000,
+                           'total_s': totais[name]})
+
+        return sorted(resumo, key=lambda etapa: etapa['total_s'], reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self._recentes.clear()
+            self._execucoes.clear()
+            self._erros.clear()
+            self._totais.clear()
+
+
+def event(name, level=logging.INFO, **fields):
+    # ocorrências pontuais (ex.: uma previsão calculada), no mesmo log estruturado das etapas
+    if logger.isEnabledFor(level):
+        logger.log(level, f'{name} {fields}', extra={'metricas': {'evento': name, 'thread': threading.current_thread().name, **fields}})
+
+
+# uma instância por processo, utilizada pela aplicação, pela API e pelas rotinas em segundo plano
+timings = StageTimings()
+stage = timings.stage
+
+_caches = {}
+
+
+def register_cache(name, stats):
+    # stats: função sem argumentos que retorna as estatísticas do cache (ex.: ForecastCache.stats)
+    _caches[name] = stats
+
+
+def cache_stats():
+    return {name: stats() for name, stats in list(_caches.items())}
+
+
+class SamplingProfiler:
+    # perfil por amostragem: a cada interval segundos, a pilha da thread observada é registrada; o resultado, no
+    # formato de pilhas colapsadas ("a;b;c quantidade"), é lido pelo flamegraph.pl, speedscope e similares
+    def __init__(self, interval=PROFILE_INTERVAL, thread_id=None):
+        self.interval = interval
+        self.thread_id = thread_id
+        self.samples = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+
+            pilha = []
+            while frame is not None:
+                code = frame.f_code
+                pilha.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+                frame = frame.f_back
+
+            if pilha:
+                self.samples[';'.join(reversed(pilha))] += 1
+
+    def start(self):
+        self.thread_id = self.thread_id or threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample, name='perfil', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def collapsed(self):
+        return '\n'.join(f'{pilha} {quantidade}' for pilha, quantidade in self.samples.most_common())
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(self.collapsed() + '\n')
+
+        return path
+
+
+def profiling_enabled():
+    return os.environ.get('BRENT_PROFILE', '').lower() in ('1', 'true')
+
+
+@contextlib.contextmanager
+def profile(name, enabled=True, directory=PROFILE_DIR):
+    # perfila o bloco (quando habilitado) e salva as pilhas em directory; o caminho fica em resultado['arquivo']
+    resultado = {'arquivo': None}
+
+    if not enabled:
+        yield resultado
+        return
+
+    profiler = SamplingProfiler().start()
+    try:
+        yield resultado
+    finally:
+        profiler.stop()
+
+        slug = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode()
+        slug = re.sub(r'[^0-9a-zA-Z]+', '_', slug).strip('_').lower()
+        resultado['arquivo'] = profiler.save(os.path.join(directory, f'{datetime.now():%Y%m%d_%H%M%S}_{slug}.folded'))
+        event(f'perfil/{name}', arquivo=resultado['arquivo'], amostras=sum(profiler.samples.values()))
@@ -0,0 +1,49 @@
+import numpy as np
+
+
+METRICS = ('wmape', 'mape', 'rmse', 'mae', 'bias')
+
+
+def compute(y_true, y_pred, axis=-1):
+    # métricas de erro em uma única passagem sobre arrays de qualquer dimensão, por exemplo
+    # (modelos x passos) ou (janelas x modelos x passos); y_true precisa ser compatível (broadcast) com y_pred
+    # e axis define os eixos agregados. Valores ausentes (NaN) em y_true ou y_pred, como os gerados pelo merge
+    # da previsão com a validação, são descartados do cálculo; sem nenhum par válido, a métrica é NaN
+    y_true = np.asarray(y_true, dtype='float64')
+    y_pred = np.asarray(y_pred, dtype='float64')
+    y_true, y_pred = np.broadcast_arrays(y_true, y_pred)
+
+    validos = ~(np.isnan(y_true) | np.isnan(y_pred))
+    erro = np.where(validos, y_pred - y_true, 0.0)
+    erro_abs = np.abs(erro)
+    real_abs = np.where(validos, np.abs(y_true), 0.0)
+
+    n = validos.sum(axis=axis)
+    soma_real_abs = real_abs.sum(axis=axis)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        erro_percentual = np.where(validos, erro_abs / real_abs, 0.0)
+
+        return {
+            'wmape': np.where(soma_real_abs > 0, erro_abs.sum(axis=axis) / soma_real_abs, np.nan),
+            'mape': np.where(n > 0, erro_percentual.sum(axis=axis) / n, np.nan),
+            'rmse': np.where(n > 0, np.sqrt((erro ** 2).sum(axis=axis) / n), np.nan),
+            'mae': np.where(n > 0, erro_abs.sum(axis=axis) / n, np.nan),
+            'bias': np.where(n > 0, erro.sum(axis=axis) / n, np.nan),
+        }
+
+
+def summary(y_true, y_pred):
+    # y_pred: (modelos x passos) ou (janelas x modelos x passos)
+    # geral: uma métrica por modelo; por_passo: uma métrica por modelo e passo do horizonte
+    y_pred = np.asarray(y_pred, dtype='float64')
+
+    if y_pred.ndim == 2:
+        return {'geral': compute(y_true, y_pred, axis=-1), 'por_passo': compute(y_true, y_pred[None], axis=0)}
+
+    return {'geral': compute(y_true, y_pred, axis=(0, 2)), 'por_passo': compute(y_true, y_pred, axis=0)}
+
+
+def scalar(y_true, y_pred):
+    # métricas de uma única previsão, como números
+    return {metrica: float(valor) for metrica, valor in compute(y_true, y_pred).items()}
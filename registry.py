@@ -0,0 +1,263 @@
+import argparse
+import hashlib
+import io
+import json
+import logging
+import os
+import pickle
+import threading
+import time
+
+import joblib
+
+import instrumentation
+
+# como em forecasting.py: o cache em disco do numba precisa ser habilitado antes da importação do statsforecast
+os.environ.setdefault('NIXTLA_NUMBA_CACHE', '1')
+
+
+MANIFEST_PATH = 'modelo/registry.json'
+
+
+def file_sha256(path):
+    sha256 = hashlib.sha256()
+
+    with open(path, 'rb') as f:
+        for bloco in iter(lambda: f.read(1 << 20), b''):
+            sha256.update(bloco)
+
+    return sha256.hexdigest()
+
+
+def _file_state(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def read_artifact(path):
+    # conteúdo do arquivo lido uma única vez, com o estado (mtime e tamanho) do próprio arquivo aberto: o checksum e
+    # a desserialização usam os mesmos bytes, mesmo que o arquivo seja substituído durante a leitura
+    with open(path, 'rb') as f:
+        stat = os.fstat(f.fileno())
+        data = f.read()
+
+    return data, (stat.st_mtime_ns, stat.st_size)
+
+
+class ChecksumError(Exception):
+    pass
+
+
+class ModelArtifact:
+    # modelo já desserializado, com os metadados da carga (tempo, tamanho serializado e estado do arquivo de origem)
+    def __init__(self, name, version, path, sha256, model, load_time, size, file_state):
+        self.name = name
+        self.version = version
+        self.path = path
+        self.sha256 = sha256
+        self.model = model
+        self.load_time = load_time
+        self.size = size
+        self.file_state = file_state
+        self.loaded_at = time.time()
+
+    def info(self):
+        return {
+            'nome': self.name,
+            'versao': self.version,
+            'arquivo': self.path,
+            'sha256': self.sha256,
+            'tempo_carga_ms': self.load_time * 1000,
+            'tamanho_kb': self.size / 2 ** 10,
+        }
+
+
+def load_manifest(manifest_path=MANIFEST_PATH):
+    # formato: {nome: {"latest": versão, "versions": {versão: {"path": ..., "sha256": ...}}}}
+    if not os.path.exists(manifest_path):
+        return {}
+
+    with open(manifest_path) as f:
+        return json.load(f)
+
+
+def save_manifest(manifest, manifest_path=MANIFEST_PATH):
+    tmp_path = f'{manifest_path}.tmp{os.getpid()}'
+
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+
+    os.replace(tmp_path, manifest_path)
+
+
+class ModelRegistry:
+    # carrega cada artefato uma única vez por processo; a cada consulta apenas o estado do arquivo (mtime e tamanho)
+    # é verificado e, se ele mudou, a nova versão é carregada e validada antes de substituir a anterior, de forma
+    # que as sessões sempre recebem um modelo completo
+    def __init__(self, manifest_path=MANIFEST_PATH):
+        self.manifest_path = manifest_path
+        self._manifest = None
+        self._manifest_state = None
+        self._artifacts = {}
+        # arquivos já rejeitados pelo checksum, por (nome, versão): só são lidos novamente quando o arquivo muda
+        self._rejected = {}
+        self._lock = threading.Lock()
+
+    def manifest(self):
+        state = _file_state(self.manifest_path) if os.path.exists(self.manifest_path) else None
+
+        if self._manifest is None or state != self._manifest_state:
+            self._manifest = load_manifest(self.manifest_path)
+            self._manifest_state = state
+
+        return self._manifest
+
+    def _entry(self, name, version=None):
+        manifest = self.manifest()
+
+        if name not in manifest:
+            raise KeyError(f'Modelo não registrado: {name}')
+
+        version = str(version or manifest[name]['latest'])
+        if version not in manifest[name]['versions']:
+            raise KeyError(f'Versão {version} do modelo {name} não registrada')
+
+        return version, manifest[name]['versions'][version]
+
+    def _load(self, name, version, entry):
+        path = entry['path']
+        data, file_state = read_artifact(path)
+
+        sha256 = hashlib.sha256(data).hexdigest()
+        if sha256 != entry['sha256']:
+            self._rejected[(name, version)] = (file_state, entry['sha256'])
+            raise ChecksumError(f'O checksum de {path} não corresponde ao registrado para {name} v{version}')
+
+        # os artefatos são objetos do statsforecast: a biblioteca é importada antes da medição, que fica restrita
+        # à desserialização do modelo
+        import statsforecast.models  # noqa: F401
+
+        inicio = time.perf_counter()
+        model = joblib.load(io.BytesIO(data))
+        load_time = time.perf_counter() - inicio
+
+        # tamanho do modelo serializado (sem compressão), uma medida do próprio objeto, independente das
+        # bibliotecas importadas e das alocações das demais threads
+        size = len(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL))
+
+        artifact = ModelArtifact(name, version, path, sha256, model, load_time, size, file_state)
+        instrumentation.timings.record(f'modelo/{name}/carga', load_time, versao=version, tamanho_kb=round(size / 2 ** 10, 1))
+
+        return artifact
+
+    def _is_rejected(self, name, version, entry):
+        try:
+            return self._rejected.get((name, version)) == (_file_state(entry['path']), entry['sha256'])
+        except OSError:
+            return False
+
+    @staticmethod
+    def _is_current(artifact, entry):
+        try:
+            return artifact.sha256 == entry['sha256'] and artifact.file_state == _file_state(entry['path'])
+        except OSError:
+            return False
+
+    def get(self, name, version=None):
+        version, entry = self._entry(name, version)
+        key = (name, version)
+
+        artifact = self._artifacts.get(key)
+        if artifact is not None and self._is_current(artifact, entry):
+            return artifact
+
+        with self._lock:
+            # outra sessão pode ter concluído a carga enquanto esta aguardava o lock
+            artifact = self._artifacts.get(key)
+            if artifact is not None and self._is_current(artifact, entry):
+                return artifact
+
+            if self._is_rejected(name, version, entry):
+                # o mesmo arquivo já foi rejeitado (e o aviso registrado): não é lido nem validado novamente
+                if artifact is None:
+                    raise ChecksumError(f'O checksum de {entry["path"]} não corresponde ao registrado para {name} v{version}')
+                return artifact
+
+            try:
+                novo = self._load(name, version, entry)
+
+            except (ChecksumError, OSError) as e:
+                # um arquivo em cópia ou corrompido não derruba a aplicação enquanto houver uma versão válida em memória
+                if artifact is None:
+                    raise
+
+                instrumentation.event(f'modelo/{name}/versao_mantida', level=logging.WARNING, versao=version, erro=str(e))
+                return artifact
+
+            self._artifacts[key] = novo
+            self._rejected.pop(key, None)
+
+        return novo
+
+    def model(self, name, version=None):
+        return self.get(name, version).model
+
+    def stats(self):
+        return [artifact.info() for artifact in self._artifacts.values()]
+
+
+def register(name, path, version=None, manifest_path=MANIFEST_PATH, **metadata):
+    manifest = load_manifest(manifest_path)
+    entry = manifest.setdefault(name, {'latest': None, 'versions': {}})
+
+    if version is None:
+        version = str(max((int(v) for v in entry['versions'] if v.isdigit()), default=0) + 1)
+
+    entry['versions'][str(version)] = {'path': path, 'sha256': file_sha256(path), **metadata}
+    entry['latest'] = str(version)
+
+    save_manifest(manifest, manifest_path)
+    return str(version)
+
+
+def verify(manifest_path=MANIFEST_PATH):
+    invalidos = []
+
+    for name, entry in load_manifest(manifest_path).items():
+        for version, artifact in entry['versions'].items():
+            if not os.path.exists(artifact['path']) or file_sha256(artifact['path']) != artifact['sha256']:
+                invalidos.append(f'{name} v{version} ({artifact["path"]})')
+
+    return invalidos
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Registro dos modelos utilizados pela aplicação.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    parser_register = subparsers.add_parser('register', help='registra uma nova versão de um modelo')
+    parser_register.add_argument('name')
+    parser_register.add_argument('path')
+    parser_register.add_argument('--version', default=None)
+    parser_register.add_argument('--descricao', default=None)
+
+    subparsers.add_parser('verify', help='confere o checksum de todos os artefatos registrados')
+
+    args = parser.parse_args()
+
+    if args.command == 'register':
+        metadata = {'descricao': args.descricao} if args.descricao else {}
+        version = register(args.name, args.path, args.version, **metadata)
+        print(f'{args.name} v{version} registrado')
+
+    else:
+        invalidos = verify()
+        if invalidos:
+            raise SystemExit('Checksum inválido: ' + ', '.join(invalidos))
+
+        print('Todos os artefatos estão íntegros')
+
+
+if __name__ == '__main__':
+    main()
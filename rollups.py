@@ -0,0 +1,133 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from downsampling import date_window
+
+
+FREQUENCIES = {'W': 'Semanal', 'M': 'Mensal', 'Y': 'Anual'}
+
+COLUMNS = ('ds', 'open', 'high', 'low', 'close', 'mean', 'count')
+
+
+def bucket_keys(ds, freq):
+    # data inicial do período (semana de segunda a domingo, mês ou ano) de cada dia
+    dias = ds.astype('datetime64[D]')
+
+    if freq == 'W':
+        # 1970-01-01, o dia zero do datetime64, foi uma quinta-feira
+        return dias - (dias.astype('int64') + 3) % 7
+    if freq == 'M':
+        return dias.astype('datetime64[M]').astype('datetime64[D]')
+    if freq == 'Y':
+        return dias.astype('datetime64[Y]').astype('datetime64[D]')
+
+    raise ValueError(f"Frequência desconhecida: {freq} (utilize {', '.join(FREQUENCIES)})")
+
+
+def aggregate(ds, y, freq):
+    # ds e y em ordem crescente de data; os dias de cada período são contíguos, então cada agregado é uma única
+    # passada vetorizada (reduceat) sobre os limites dos períodos
+    keys = bucket_keys(ds, freq)
+    if len(y) == 0:
+        return {'ds': keys, 'open': y, 'high': y, 'low': y, 'close': y, 'mean': y, 'count': np.array([], dtype='int64')}
+
+    inicios = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    fins = np.r_[inicios[1:], len(y)]
+    contagem = fins - inicios
+
+    return {
+        'ds': keys[inicios],
+        'open': y[inicios],
+        'high': np.maximum.reduceat(y, inicios),
+        'low': np.minimum.reduceat(y, inicios),
+        'close': y[fins - 1],
+        'mean': np.add.reduceat(y, inicios) / contagem,
+        'count': contagem,
+    }
+
+
+class RollupStore:
+    # agregados semanais, mensais e anuais (abertura, máxima, mínima, fechamento e média) da série pré-processada;
+    # a cada nova versão dos dados, apenas os períodos a partir do primeiro dia novo ou alterado são recalculados
+    def __init__(self, frequencies=tuple(FREQUENCIES)):
+        self.frequencies = frequencies
+        self.version = None
+        self._ds = None
+        self._y = None
+        self._rollups = {}
+        self._lock = threading.Lock()
+        self.full_updates = 0
+        self.incremental_updates = 0
+        self.recomputed_buckets = 0
+
+    def update(self, serie):
+        if serie.version == self.version:
+            return False
+
+        # visões em ordem crescente, sem cópia
+        ds, y = serie.ds[::-1], serie.y[::-1]
+
+        with self._lock:
+            if serie.version == self.version:
+                return False
+
+            inicio = self._first_change(ds, y)
+            rollups = {freq: self._updated(freq, ds, y, inicio) for freq in self.frequencies}
+
+            if inicio == 0:
+                self.full_updates += 1
+            else:
+                self.incremental_updates += 1
+
+            # os agregados são substituídos de uma só vez: as consultas veem a versão anterior ou a nova
+            self._rollups = rollups
+            self._ds, self._y = ds, y
+            self.version = serie.version
+
+        return True
+
+    def _first_change(self, ds, y):
+        # posição do primeiro dia novo ou alterado em relação à versão anterior (0: recálculo completo)
+        if self._ds is None or len(ds) < len(self._ds) or not len(self._ds) or ds[0] != self._ds[0]:
+            return 0
+
+        n = len(self._ds)
+        alterados = np.flatnonzero((ds[:n] != self._ds) | (y[:n] != self._y))
+
+        return int(alterados[0]) if len(alterados) else n
+
+    def _updated(self, freq, ds, y, inicio):
+        if inicio == 0:
+            rollup = aggregate(ds, y, freq)
+            self.recomputed_buckets += len(rollup['ds'])
+            return rollup
+
+        anterior = self._rollups[freq]
+        if inicio >= len(ds):
+            return anterior
+
+        # o período que contém o primeiro dia novo é recalculado por inteiro, junto com os seguintes
+        chave = bucket_keys(ds[inicio:inicio + 1], freq)[0]
+        mantidos = np.searchsorted(anterior['ds'], chave)
+        posicao = np.searchsorted(ds, chave)
+        novos = aggregate(ds[posicao:], y[posicao:], freq)
+        self.recomputed_buckets += len(novos['ds'])
+
+        return {column: np.concatenate([anterior[column][:mantidos], novos[column]]) for column in COLUMNS}
+
+    def frame(self, freq, inicio=None, fim=None):
+        # períodos iniciados entre inicio e fim, selecionados por busca binária
+        if freq not in self._rollups:
+            raise ValueError(f"Frequência desconhecida: {freq} (utilize {', '.join(self.frequencies)})")
+
+        rollup = self._rollups[freq]
+        janela = date_window(rollup['ds'], inicio, fim)
+
+        return pd.DataFrame({column: rollup[column][janela] for column in COLUMNS})
+
+    def stats(self):
+        return {'versao': self.version, 'completas': self.full_updates, 'incrementais': self.incremental_updates,
+                'periodos_recalculados': self.recomputed_buckets,
+                **{f'periodos_{freq}': len(rollup['ds']) for freq, rollup in self._rollups.items()}}
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+from downsampling import date_window
+
+
+# períodos analisados na aba Insights, os mesmos filtros de cenário do dashboard do Power BI; as janelas incluem
+# as duas datas (date_window), então cada período começa no dia seguinte e termina no dia anterior aos limites
+# exclusivos originais (ex.: 2007-01-01 < ds < 2009-04-01)
+SCENARIOS = {
+    'Crise Econômica de 2008': ('2007-01-02', '2009-03-31'),
+    'Primavera Árabe': ('2010-12-02', '2012-12-30'),
+    'Expansão do Xisto nos EUA': ('2010-01-02', '2019-12-30'),
+    'Pandemia de Covid-19': ('2019-01-02', '2022-05-31'),
+}
+
+# a série diária é preenchida em todos os dias do calendário (inclusive fins de semana)
+DAYS_PER_YEAR = 365
+
+
+def summarize(ds, y):
+    # ds e y em ordem crescente de data; o drawdown é a maior queda a partir do pico anterior dentro do período
+    if len(y) == 0:
+        raise ValueError('Não há dados no período selecionado.')
+
+    maximo_anterior = np.maximum.accumulate(y)
+    drawdowns = y / maximo_anterior - 1
+
+    vale = int(np.argmin(drawdowns))
+    pico = int(np.argmax(y[:vale + 1]))
+
+    retornos = np.diff(np.log(y))
+
+    return {
+        'inicio': pd.Timestamp(ds[0]).date(),
+        'fim': pd.Timestamp(ds[-1]).date(),
+        'dias': len(y),
+        'minimo': y.min(),
+        'maximo': y.max(),
+        'media': y.mean(),
+        'variacao_pct': (y[-1] / y[0] - 1) * 100,
+        'volatilidade_anual_pct': retornos.std() * np.sqrt(DAYS_PER_YEAR) * 100 if len(retornos) > 1 else np.nan,
+        'drawdown_max_pct': drawdowns[vale] * 100,
+        'data_pico': pd.Timestamp(ds[pico]).date(),
+        'data_vale': pd.Timestamp(ds[vale]).date(),
+    }
+
+
+class ScenarioIndex:
+    # série em ordem crescente (visões sem cópia dos arrays da CanonicalSeries) com o resumo de cada cenário
+    # calculado uma única vez por versão dos dados; cada período é fatiado por busca binária, sem percorrer a
+    # série com máscaras nem reordená-la
+    def __init__(self, serie, scenarios=SCENARIOS):
+        self.version = serie.version
+        self.ds = serie.ds[::-1]
+        self.y = serie.y[::-1]
+        self.scenarios = dict(scenarios)
+        self._summaries = {name: self.summarize(inicio, fim) for name, (inicio, fim) in self.scenarios.items()}
+
+    def window(self, inicio=None, fim=None):
+        janela = date_window(self.ds, inicio, fim)
+        return self.ds[janela], self.y[janela]
+
+    def frame(self, name):
+        ds, y = self.window(*self.scenarios[name])
+        return pd.DataFrame({'ds': ds, 'y': y}, copy=False)
+
+    def summarize(self, inicio=None, fim=None):
+        return summarize(*self.window(inicio, fim))
+
+    def summary(self, name):
+        return self._summaries[name]
+
+    def summaries(self):
+        return pd.DataFrame([{'cenario': name, **resumo} for name, resumo in self._summaries.items()])
@@ -0,0 +1,158 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import metrics
+import series
+from evaluation import ARTIFACTS_DIR, MODEL_CONFIGS, expand_grid
+from utils import data_fingerprint
+
+
+# grades padrão da busca; combinações que exigem mais observações do que o período de treino são descartadas
+DEFAULT_GRIDS = {
+    'SeasonalNaive': {'season_length': list(range(2, 366))},
+    'SeasonalWindowAverage': {'season_length': list(range(7, 366, 7)), 'window_size': [1, 2, 3]},
+    'SeasonalExponentialSmoothingOptimized': {'season_length': list(range(7, 366, 7))},
+}
+
+METRICS = ['wmape', 'mape', 'rmse']
+
+_worker_data = {}
+
+
+def alias(model_name, params):
+    return model_name + ''.join(f'_{key}={value}' for key, value in params.items())
+
+
+def configs_from_grids(grids, n_treino):
+    configs = []
+
+    for model_name, grid in grids.items():
+        for params in expand_grid(grid):
+            if params.get('season_length', 1) * params.get('window_size', 1) > n_treino:
+                continue
+
+            configs.append((model_name, params))
+
+    return configs
+
+
+def _build_model(model_name, params):
+    import statsforecast.models
+
+    return getattr(statsforecast.models, model_name)(alias=alias(model_name, params), **params)
+
+
+def _init_worker(treino, y_valid):
+    # os dados de treino e validação são enviados uma única vez para cada processo
+    _worker_data['treino'] = treino
+    _worker_data['y_valid'] = y_valid
+
+
+def evaluate_batch(configs):
+    # todas as configurações do lote são ajustadas em uma única chamada do StatsForecast
+    from statsforecast import StatsForecast
+
+    treino = _worker_data['treino']
+    y_valid = _worker_data['y_valid']
+
+    sf = StatsForecast(models=[_build_model(model_name, params) for model_name, params in configs], freq='D', n_jobs=1)
+    forecast = sf.fit(treino).predict(h=len(y_valid))
+
+    aliases = [alias(model_name, params) for model_name, params in configs]
+    scores = metrics.compute(y_valid, forecast[aliases].to_numpy(dtype='float64').T)
+
+    return [
+        {'modelo': model_name, 'params': json.dumps(params), 'alias': alias_config, **{metric: scores[metric][i] for metric in METRICS}}
+        for i, ((model_name, params), alias_config) in enumerate(zip(configs, aliases))
+    ]
+
+
+def split(serie, configs=MODEL_CONFIGS):
+    # mesmo período de treino e validação utilizado na aba "Performance dos Modelos"
+    df_sf = serie.statsforecast().iloc[::-1]
+
+    treino = df_sf[(df_sf['ds'] >= pd.to_datetime(configs['treino_inicio'])) & (df_sf['ds'] < pd.to_datetime(configs['valid_inicio']))]
+    valid = df_sf[(df_sf['ds'] >= pd.to_datetime(configs['valid_inicio'])) & (df_sf['ds'] < pd.to_datetime(configs['valid_fim']))]
+
+    return treino.reset_index(drop=True), valid.reset_index(drop=True)
+
+
+def run_search(serie, grids=DEFAULT_GRIDS, configs=MODEL_CONFIGS, workers=None, batch_size=20, rank_by='wmape'):
+    treino, valid = split(serie, configs)
+    y_valid = valid['y'].to_numpy(dtype='float64')
+
+    candidatos = configs_from_grids(grids, len(treino))
+
+    # lotes de um mesmo modelo, para que as configurações de custo semelhante fiquem juntas
+    lotes = []
+    for model_name in grids:
+        do_modelo = [config for config in candidatos if config[0] == model_name]
+        lotes.extend(do_modelo[i:i + batch_size] for i in range(0, len(do_modelo), batch_size))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(treino, y_valid)) as executor:
+        resultados = [linha for lote in executor.map(evaluate_batch, lotes) for linha in lote]
+
+    df_resultados = pd.DataFrame(resultados).sort_values(by=[rank_by, *[m for m in METRICS if m != rank_by]])
+    df_resultados['ranking'] = np.arange(1, len(df_resultados) + 1)
+
+    return df_resultados.reset_index(drop=True)
+
+
+def best_configs(df_resultados, rank_by='wmape'):
+    # melhor configuração de cada modelo, no formato das grades do MODEL_CONFIGS
+    melhores = df_resultados.sort_values(by=rank_by).drop_duplicates(subset='modelo')
+    return {linha.modelo: json.loads(linha.params) for linha in melhores.itertuples()}
+
+
+def results_path(serie, grids=DEFAULT_GRIDS, configs=MODEL_CONFIGS):
+    fingerprint = data_fingerprint(serie.frame(), grids, {k: configs[k] for k in ('treino_inicio', 'valid_inicio', 'valid_fim')})
+    return os.path.join(ARTIFACTS_DIR, f'busca_{fingerprint[:16]}.csv')
+
+
+def save_results(df_resultados, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    tmp_path = f'{path}.tmp{os.getpid()}'
+    df_resultados.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Busca de hiperparâmetros dos modelos sazonais em paralelo.')
+    parser.add_argument('--csv', default='dados/dados_preco_petroleo.csv', help='arquivo CSV com as colunas data e preco_petroleo_brent')
+    parser.add_argument('--grids', default=None, help='arquivo JSON com as grades ({modelo: {parâmetro: [valores]}})')
+    parser.add_argument('--workers', type=int, default=None, help='quantidade de processos (padrão: núcleos disponíveis)')
+    parser.add_argument('--batch-size', type=int, default=20, help='configurações ajustadas em cada chamada do StatsForecast')
+    parser.add_argument('--rank-by', choices=METRICS, default='wmape')
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    grids = DEFAULT_GRIDS
+    if args.grids:
+        with open(args.grids) as f:
+            grids = json.load(f)
+
+    serie = series.preprocess(pd.read_csv(args.csv))
+
+    inicio = time.perf_counter()
+    df_resultados = run_search(serie, grids, workers=args.workers, batch_size=args.batch_size, rank_by=args.rank_by)
+    tempo = time.perf_counter() - inicio
+
+    path = results_path(serie, grids)
+    save_results(df_resultados, path)
+
+    print(f'{len(df_resultados)} configurações avaliadas em {tempo:.1f}s; resultados em {path}')
+    print(df_resultados.head(args.top)[['ranking', 'alias', *METRICS]].to_string(index=False))
+
+    for model_name, params in best_configs(df_resultados, args.rank_by).items():
+        print(f'Melhor {model_name}: {params}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+from sklearn.pipeline import Pipeline
+
+from utils import RenameColumns, CastToDatetime, FillMissingData, data_fingerprint
+
+
+def _read_only(values):
+    values.flags.writeable = False
+    return values
+
+
+class CanonicalSeries:
+    # série do preço do petróleo Brent já pré-processada (renomeada, convertida e com os gaps preenchidos)
+    # os arrays são somente leitura e cada visão monta um dataframe novo sobre eles, sem cópia, de forma
+    # que uma aba não consegue corromper os dados utilizados pelas demais sessões
+    def __init__(self, df, version):
+        self.version = version
+        self.ds = _read_only(df['ds'].to_numpy(dtype='datetime64[ns]', copy=True))
+        self.y = _read_only(df['y'].to_numpy(dtype='float64', copy=True))
+
+    @classmethod
+    def from_arrays(cls, ds, y, version):
+        # arrays já prontos (ex.: mapeados de um snapshot em disco), utilizados sem cópia
+        serie = cls.__new__(cls)
+        serie.version = version
+        serie.ds = _read_only(ds)
+        serie.y = _read_only(y)
+        return serie
+
+    def __len__(self):
+        return len(self.y)
+
+    @property
+    def last_date(self):
+        return pd.Timestamp(self.ds.max())
+
+    def frame(self):
+        # colunas ds e y, na mesma ordem (decrescente) retornada pelo FillMissingData
+        return pd.DataFrame({'ds': self.ds, 'y': self.y}, copy=False)
+
+    def indexed(self):
+        # série indexada pela data, formato utilizado pelo statsmodels
+        return pd.DataFrame({'y': self.y}, index=pd.DatetimeIndex(self.ds, name='ds'), copy=False)
+
+    def statsforecast(self, unique_id='value'):
+        # colunas ds, y e unique_id, formato utilizado pelo statsforecast
+        # o identificador é categórico: um código de 1 byte por linha em vez de uma string Python
+        df = self.frame()
+        df['unique_id'] = pd.Categorical.from_codes(np.zeros(len(df), dtype='int8'), categories=[unique_id])
+        return df
+
+    def log(self):
+        return pd.DataFrame({'y': np.log(self.y)}, index=pd.DatetimeIndex(self.ds, name='ds'), copy=False)
+
+
+def preprocess(df_raw, version=None):
+    pipeline = Pipeline([
+        ('rename_columns', RenameColumns()),
+        ('cast_to_datetime', CastToDatetime()),
+        ('fill_missing_data', FillMissingData())
+    ])
+
+    if version is None:
+        version = data_fingerprint(df_raw)
+
+    return CanonicalSeries(pipeline.transform(df_raw), version)
@@ -0,0 +1,166 @@
+import contextlib
+import glob
+import json
+import os
+import re
+import threading
+
+import pyarrow as pa
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: sem o lock entre processos, a verificação de versão do ponteiro continua valendo
+    fcntl = None
+
+import series
+from sync import LOCAL_STORE_DIR
+
+
+SNAPSHOT_DIR = os.path.join(LOCAL_STORE_DIR, 'snapshots')
+POINTER_FILE = 'CURRENT'
+
+# versões anteriores mantidas em disco; processos que ainda as mapeiam continuam lendo normalmente, já que
+# remover o arquivo não invalida um mapeamento aberto
+KEEP = 3
+
+
+def snapshot_name(version):
+    return f"serie_{re.sub(r'[^0-9A-Za-z_.-]+', '_', version)}.arrow"
+
+
+def write_snapshot(serie, path):
+    # Arrow IPC sem compressão: as colunas ficam no disco no mesmo formato da memória e podem ser mapeadas sem cópia
+    tabela = pa.table({'ds': pa.array(serie.ds), 'y': pa.array(serie.y)}, metadata={'version': serie.version})
+
+    # escrita atômica: leitores de outros processos nunca encontram um arquivo parcial
+    tmp_path = f'{path}.tmp{os.getpid()}'
+    with pa.OSFile(tmp_path, 'wb') as sink, pa.ipc.new_file(sink, tabela.schema) as writer:
+        writer.write_table(tabela)
+
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_snapshot(path):
+    # as colunas são visões numpy (somente leitura) sobre o arquivo mapeado em memória: as páginas vêm do cache
+    # do sistema operacional e são compartilhadas por todos os processos da máquina que leem a mesma versão
+    tabela = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+
+    ds = tabela.column('ds').chunk(0).to_numpy(zero_copy_only=True)
+    y = tabela.column('y').chunk(0).to_numpy(zero_copy_only=True)
+
+    return series.CanonicalSeries.from_arrays(ds, y, tabela.schema.metadata[b'version'].decode())
+
+
+def _order(serie):
+    # ordem entre versões dos dados: a série com o dado mais recente (e, na mesma data, com mais dias) é a mais nova
+    return [str(serie.last_date.date()), len(serie)]
+
+
+class SnapshotStore:
+    # série pré-processada persistida por versão dos dados; o arquivo CURRENT aponta a versão mais recente e só
+    # avança (nunca volta para uma versão anterior), substituído de forma atômica, então os leitores passam da
+    # versão anterior para a nova de uma só vez; uma versão específica é lida diretamente do seu arquivo
+    def __init__(self, directory=SNAPSHOT_DIR, keep=KEEP):
+        self.directory = directory
+        self.keep = keep
+        self.pointer_path = os.path.join(directory, POINTER_FILE)
+        self._name = None
+        self._serie = None
+        self._lock = threading.Lock()
+
+    def _pointer(self):
+        try:
+            with open(self.pointer_path) as f:
+                return json.load(f)
+
+        except (FileNotFoundError, ValueError):
+            return None
+
+    @contextlib.contextmanager
+    def _pointer_lock(self):
+        # lock entre processos da mesma máquina para a comparação e a troca do ponteiro
+        with open(f'{self.pointer_path}.lock', 'w') as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            yield
+
+    def _open(self, name):
+        # o arquivo só é mapeado novamente quando a versão pedida muda
+        with self._lock:
+            if name != self._name:
+                try:
+                    self._serie = read_snapshot(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    return None
+
+                self._name = name
+
+            return self._serie
+
+    def current(self):
+        ponteiro = self._pointer()
+        return self._open(ponteiro['arquivo']) if ponteiro is not None else None
+
+    def load(self, version):
+        name = snapshot_name(version)
+        if not os.path.exists(os.path.join(self.directory, name)):
+            return None
+
+        serie = self._open(name)
+        return serie if serie is not None and serie.version == version else None
+
+    def publish(self, serie):
+        os.makedirs(self.directory, exist_ok=True)
+
+        name = snapshot_name(serie.version)
+        path = os.path.join(self.directory, name)
+        if not os.path.exists(path):
+            write_snapshot(serie, path)
+
+        # o ponteiro só é atualizado depois que o snapshot está completo no disco e apenas para uma versão mais
+        # nova: um processo com a sincronização atrasada não faz os demais voltarem para a versão anterior
+        with self._pointer_lock():
+            ponteiro = self._pointer()
+
+            if ponteiro is None or _order(serie) > ponteiro['ordem']:
+                tmp_path = f'{self.pointer_path}.tmp{os.getpid()}'
+                with open(tmp_path, 'w') as f:
+                    json.dump({'arquivo': name, 'versao': serie.version, 'ordem': _order(serie)}, f)
+
+                os.replace(tmp_path, self.pointer_path)
+                ponteiro = {'arquivo': name}
+
+            self._prune({name, ponteiro['arquivo']})
+
+        return path
+
+    def _prune(self, manter):
+        antigos = sorted(glob.glob(os.path.join(self.directory, 'serie_*.arrow')), key=os.path.getmtime, reverse=True)
+        antigos = [path for path in antigos if os.path.basename(path) not in manter]
+
+        for path in antigos[max(self.keep - len(manter), 0):]:
+            try:
+                os.remove(path)
+            except OSError:
+                # no Windows, arquivos mapeados por outro processo não podem ser removidos
+                pass
+
+    def stats(self):
+        return {'versao': self._serie.version if self._serie is not None else None, 'arquivo': self._name,
+                'linhas': len(self._serie) if self._serie is not None else 0}
+
+
+def load_or_publish(store, df_raw, version):
+    # série da versão já publicada por qualquer processo da máquina (lida diretamente do seu arquivo, mesmo que
+    # não seja a versão apontada por CURRENT) ou, se ainda não existir, pré-processada, publicada e lida de volta
+    # pelo mapeamento, para que este processo também compartilhe as páginas
+    serie = store.load(version)
+    if serie is not None:
+        return serie
+
+    serie = series.preprocess(df_raw, version)
+    store.publish(serie)
+
+    return store.load(version) or serie
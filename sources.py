@@ -0,0 +1,211 @@
+import argparse
+import os
+
+import pandas as pd
+
+import ingestion
+
+
+DATE_COLUMN = 'data'
+PRICE_COLUMN = 'preco_petroleo_brent'
+
+CSV_PATH = 'dados/dados_preco_petroleo.csv'
+PARQUET_PATH = 'dados/local/petroleo_brent_fonte.parquet'
+SQL_URL = 'sqlite:///dados/local/petroleo_brent.db'
+
+PROJECT_ID = 'fiap-tech-challenge-4'
+DATASET_ID = 'tech_challenge_4'
+TABLE_ID = 'petroleo_brent'
+
+
+def normalize(df):
+    # todas as fontes retornam o mesmo formato: data como datetime64[ns], preço como float64, em ordem decrescente
+    data = pd.to_datetime(df[DATE_COLUMN])
+    if data.dt.tz is not None:
+        data = data.dt.tz_convert(None)
+
+    # preços em texto (ex.: "75,47" em exportações do IPEA) aceitam vírgula ou ponto decimal; valores inválidos
+    # geram um ingestion.ParseError com as linhas, em vez de interromper a conversão sem indicar onde
+    precos, _ = ingestion.parse_decimal(df[PRICE_COLUMN], column=PRICE_COLUMN)
+
+    df_normalizado = pd.DataFrame({
+        DATE_COLUMN: data.astype('datetime64[ns]'),
+        PRICE_COLUMN: precos,
+    })
+
+    if not df_normalizado[DATE_COLUMN].is_monotonic_decreasing:
+        df_normalizado = df_normalizado.sort_values(by=DATE_COLUMN, ascending=False)
+
+    return df_normalizado.reset_index(drop=True)
+
+
+def _after(df, watermark):
+    if watermark is None:
+        return df
+
+    return df[df[DATE_COLUMN] > pd.Timestamp(watermark)].reset_index(drop=True)
+
+
+class BigQuerySource:
+    name = 'bigquery'
+
+    def __init__(self, client=None, project_id=PROJECT_ID, dataset_id=DATASET_ID, table_id=TABLE_ID, credentials_info=None):
+        self._client = client
+        self.credentials_info = credentials_info
+        self.table = f'{project_id}.{dataset_id}.{table_id}'
+
+    @property
+    def client(self):
+        # o cliente (e as bibliotecas do Google Cloud) só são carregados na primeira consulta
+        if self._client is None:
+            from google.cloud import bigquery
+            from google.oauth2 import service_account
+
+            credentials = None
+            if self.credentials_info is not None:
+                credentials = service_account.Credentials.from_service_account_info(self.credentials_info)
+
+            self._client = bigquery.Client(credentials=credentials)
+
+        return self._client
+
+    def fetch_since(self, watermark=None):
+        from google.cloud import bigquery
+
+        query = f'SELECT {DATE_COLUMN}, {PRICE_COLUMN} FROM `{self.table}`'
+        job_config = bigquery.QueryJobConfig()
+
+        # somente as linhas posteriores à última data armazenada localmente trafegam pela rede
+        if watermark is not None:
+            query += f' WHERE CAST({DATE_COLUMN} AS DATETIME) > @watermark'
+            job_config.query_parameters = [
+                bigquery.ScalarQueryParameter('watermark', 'DATETIME', pd.Timestamp(watermark).to_pydatetime())
+            ]
+
+        query += f' ORDER BY {DATE_COLUMN} DESC'
+
+        return normalize(self.client.query(query, job_config=job_config).to_dataframe())
+
+
+class CsvSource:
+    # base distribuída junto com o projeto, utilizada como fonte padrão offline
+    name = 'csv'
+
+    def __init__(self, path=CSV_PATH):
+        self.path = path
+
+    def fetch_since(self, watermark=None):
+        return _after(normalize(pd.read_csv(self.path)), watermark)
+
+
+class ParquetSource:
+    name = 'parquet'
+
+    def __init__(self, path=PARQUET_PATH):
+        self.path = path
+
+    def fetch_since(self, watermark=None):
+        # o filtro é aplicado na leitura (predicate pushdown), sem carregar o arquivo inteiro
+        filters = None
+        if watermark is not None:
+            filters = [(DATE_COLUMN, '>', pd.Timestamp(watermark))]
+
+        df = pd.read_parquet(self.path, columns=[DATE_COLUMN, PRICE_COLUMN], filters=filters)
+        return _after(normalize(df), watermark)
+
+
+class SqlSource:
+    # qualquer banco suportado pelo SQLAlchemy; por padrão, um arquivo SQLite local
+    name = 'sql'
+
+    def __init__(self, url=SQL_URL, table=TABLE_ID):
+        self.url = url
+        self.table = table
+        self._engine = None
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from sqlalchemy import create_engine
+
+            self._engine = create_engine(self.url)
+
+        return self._engine
+
+    def fetch_since(self, watermark=None):
+        from sqlalchemy import DateTime, bindparam, text
+
+        query = f'SELECT {DATE_COLUMN}, {PRICE_COLUMN} FROM {self.table}'
+        params = {}
+
+        if watermark is not None:
+            query += f' WHERE {DATE_COLUMN} > :watermark'
+            params['watermark'] = pd.Timestamp(watermark).to_pydatetime()
+
+        statement = text(query + f' ORDER BY {DATE_COLUMN} DESC')
+        if params:
+            statement = statement.bindparams(bindparam('watermark', type_=DateTime()))
+
+        with self.engine.connect() as connection:
+            df = pd.read_sql(statement, connection, params=params)
+
+        # o filtro é repetido após a conversão de tipos, já que alguns bancos (ex.: SQLite) armazenam a data como texto
+        return _after(normalize(df), watermark)
+
+
+SOURCES = {
+    'bigquery': BigQuerySource,
+    'csv': CsvSource,
+    'parquet': ParquetSource,
+    'sql': SqlSource,
+}
+
+
+def get_source(config=None, credentials_info=None):
+    # a fonte é definida pela seção [data_source] do secrets.toml ou pela variável de ambiente BRENT_DATA_SOURCE;
+    # sem configuração, utiliza o BigQuery apenas quando há credenciais e, caso contrário, o CSV local
+    config = dict(config or {})
+    source_type = config.pop('type', None) or os.environ.get('BRENT_DATA_SOURCE')
+
+    if source_type is None:
+        source_type = 'bigquery' if credentials_info is not None else 'csv'
+
+    if source_type not in SOURCES:
+        raise ValueError(f'Fonte de dados desconhecida: {source_type}. Opções: {", ".join(SOURCES)}')
+
+    if source_type == 'bigquery':
+        config.setdefault('credentials_info', credentials_info)
+    elif 'BRENT_DATA_PATH' in os.environ:
+        config.setdefault('url' if source_type == 'sql' else 'path', os.environ['BRENT_DATA_PATH'])
+
+    return SOURCES[source_type](**config)
+
+
+def export(df, source_type, destination):
+    # gera uma cópia da base para as fontes locais (ambientes sem rede, testes de carga)
+    os.makedirs(os.path.dirname(destination) or '.', exist_ok=True)
+
+    if source_type == 'parquet':
+        df.to_parquet(destination, index=False)
+    elif source_type == 'sql':
+        from sqlalchemy import create_engine
+
+        df.to_sql(TABLE_ID, create_engine(f'sqlite:///{destination}'), if_exists='replace', index=False)
+    elif source_type == 'csv':
+        df.to_csv(destination, index=False)
+    else:
+        raise ValueError(f'Não é possível exportar para a fonte {source_type}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Exporta a base local do preço do petróleo Brent para as fontes offline.')
+    parser.add_argument('source_type', choices=['csv', 'parquet', 'sql'])
+    parser.add_argument('destination', help='arquivo de destino (para sql, o arquivo SQLite)')
+    args = parser.parse_args()
+
+    export(CsvSource().fetch_since(), args.source_type, args.destination)
+    print(f'Base exportada para {args.destination}')
+
+
+if __name__ == '__main__':
+    main()
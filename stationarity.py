@@ -0,0 +1,223 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+import instrumentation
+
+
+WINDOW = 12
+
+# a seleção automática da quantidade de lags do ADF (a parte cara do teste) é refeita quando a série cresce
+# mais do que esta fração desde a última seleção; nas demais atualizações, o lag armazenado é reutilizado
+AUTOLAG_REFRESH = 0.05
+
+STORE_PATH = 'artefatos/estacionariedade.npz'
+
+
+def _rolling(values, window, func):
+    return getattr(pd.Series(values, copy=False).rolling(window), func)().to_numpy()
+
+
+def _rolling_head(values, old, k, window, func):
+    # após k linhas novas no topo, só as k + window - 1 primeiras posições da média/desvio móvel mudam
+    if len(old) < window - 1:
+        return _rolling(values, window, func)
+
+    return np.concatenate([_rolling(values[:k + window - 1], window, func), old[window - 1:]])
+
+
+def _adf(values, lag=None):
+    from statsmodels.tsa.stattools import adfuller
+
+    with instrumentation.stage('estacionariedade/adf', autolag=lag is None):
+        if lag is None:
+            result = adfuller(values)
+        else:
+            result = adfuller(values, maxlag=lag, autolag=None)
+
+    return {'estatistica': result[0], 'p_value': result[1], 'valores_criticos': result[4]}, int(result[2])
+
+
+class StationarityAnalysis:
+    # transformações (log, média e desvio móveis, série estacionária) e testes ADF de uma versão da série,
+    # mantidos como arrays alinhados às datas, na mesma ordem da série (decrescente)
+    def __init__(self, ds, arrays, adf, lags, autolag_len, window=WINDOW):
+        self.ds = ds
+        self.arrays = arrays
+        self.adf = adf
+        self.lags = lags
+        self.autolag_len = autolag_len
+        self.window = window
+
+    @classmethod
+    def compute(cls, ds, y, window=WINDOW):
+        ds = np.asarray(ds, dtype='datetime64[ns]')
+        y = np.asarray(y, dtype='float64')
+
+        log = np.log(y)
+        ma_log = _rolling(log, window, 'mean')
+        estacionaria = log - ma_log
+
+        arrays = {
+            'y': y,
+            'ma': _rolling(y, window, 'mean'),
+            'log': log,
+            'ma_log': ma_log,
+            'estacionaria': estacionaria,
+            'ma_estacionaria': _rolling(estacionaria[window - 1:], window, 'mean'),
+            'std_estacionaria': _rolling(estacionaria[window - 1:], window, 'std'),
+        }
+
+        adf, lags = {}, {}
+        for nome, values in cls._adf_inputs(arrays, window).items():
+            adf[nome], lags[nome] = _adf(values)
+
+        return cls(ds, arrays, adf, lags, len(y), window)
+
+    @staticmethod
+    def _adf_inputs(arrays, window):
+        return {'original': arrays['y'], 'log': arrays['log'], 'estacionaria': arrays['estacionaria'][window - 1:]}
+
+    def _appended(self, ds, y):
+        # quantidade de dias acrescentados no topo, ou None se a nova série não apenas estende a analisada
+        k = len(y) - len(self.ds)
+
+        if k < 0 or not (np.array_equal(ds[k:], self.ds) and np.array_equal(y[k:], self.arrays['y'], equal_nan=True)):
+            return None
+
+        return k
+
+    def _refresh_autolag(self, n):
+        return n - self.autolag_len > AUTOLAG_REFRESH * self.autolag_len
+
+    def lag_key(self):
+        # None quando os lags foram selecionados automaticamente sobre esta mesma série (o resultado do ADF
+        # depende apenas dos dados); caso contrário, os lags reutilizados de uma análise anterior, que também
+        # determinam o resultado e por isso fazem parte da chave dos artefatos derivados
+        return _lag_key(self.autolag_len, self.lags, len(self.ds))
+
+    def update(self, ds, y):
+        # se a nova série apenas acrescenta dias mais recentes (no topo), as estatísticas móveis são recalculadas
+        # somente nas primeiras posições e o ADF reutiliza o lag já selecionado; caso contrário, recalcula tudo
+        ds = np.asarray(ds, dtype='datetime64[ns]')
+        y = np.asarray(y, dtype='float64')
+        k = self._appended(ds, y)
+        window = self.window
+
+        if k is None:
+            return self.compute(ds, y, window)
+
+        if k == 0:
+            return self
+
+        antigos = self.arrays
+
+        log = np.concatenate([np.log(y[:k]), antigos['log']])
+        ma_log = _rolling_head(log, antigos['ma_log'], k, window, 'mean')
+
+        estacionaria = antigos['estacionaria']
+        estacionaria = np.concatenate([log[:k + window - 1] - ma_log[:k + window - 1], estacionaria[window - 1:]])
+
+        arrays = {
+            'y': y,
+            'ma': _rolling_head(y, antigos['ma'], k, window, 'mean'),
+            'log': log,
+            'ma_log': ma_log,
+            'estacionaria': estacionaria,
+            'ma_estacionaria': _rolling_head(estacionaria[window - 1:], antigos['ma_estacionaria'], k, window, 'mean'),
+            'std_estacionaria': _rolling_head(estacionaria[window - 1:], antigos['std_estacionaria'], k, window, 'std'),
+        }
+
+        refazer_autolag = self._refresh_autolag(len(y))
+
+        adf, lags = {}, {}
+        for nome, values in self._adf_inputs(arrays, window).items():
+            adf[nome], lags[nome] = _adf(values, None if refazer_autolag else self.lags[nome])
+
+        return StationarityAnalysis(ds, arrays, adf, lags, len(y) if refazer_autolag else self.autolag_len, window)
+
+    def frames(self):
+        # mesmo formato das transformações exibidas na aba "Performance dos Modelos"
+        index = pd.DatetimeIndex(self.ds, name='ds')
+        index_estacionaria = index[self.window - 1:]
+
+        def frame(values, idx):
+            return pd.DataFrame({'y': values}, index=idx)
+
+        return {
+            'ma': frame(self.arrays['ma'], index),
+            'log': frame(self.arrays['log'], index),
+            'ma_log': frame(self.arrays['ma_log'], index),
+            'estacionaria': frame(self.arrays['estacionaria'][self.window - 1:], index_estacionaria),
+            'ma_estacionaria': frame(self.arrays['ma_estacionaria'], index_estacionaria),
+            'std_estacionaria': frame(self.arrays['std_estacionaria'], index_estacionaria),
+        }
+
+    def save(self, path=STORE_PATH):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+        meta = {'adf': self.adf, 'lags': self.lags, 'autolag_len': self.autolag_len, 'window': self.window}
+
+        # arquivo compactado com os arrays e os resultados dos testes; escrita atômica
+        tmp_path = f'{path}.tmp{os.getpid()}.npz'
+        np.savez_compressed(tmp_path, ds=self.ds, meta=np.array(json.dumps(meta)), **self.arrays)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path=STORE_PATH):
+        if not os.path.exists(path):
+            return None
+
+        with np.load(path) as dados:
+            meta = json.loads(str(dados['meta']))
+            arrays = {nome: dados[nome] for nome in dados.files if nome not in ('ds', 'meta')}
+
+            return cls(dados['ds'], arrays, meta['adf'], meta['lags'], meta['autolag_len'], meta['window'])
+
+
+def _lag_key(autolag_len, lags, n):
+    return None if autolag_len == n else {'autolag_len': autolag_len, 'lags': lags}
+
+
+def store_state(path=STORE_PATH):
+    # estado do arquivo da análise armazenada (mtime e tamanho), para identificar quando ela muda sem relê-la
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    return stat.st_mtime_ns, stat.st_size
+
+
+def expected_lag_key(serie, path=STORE_PATH):
+    # lag_key da análise que o analyze produzirá para esta série a partir da análise armazenada, sem executar
+    # os testes (permite localizar um artefato já gerado antes de refazer a análise)
+    anterior = StationarityAnalysis.load(path)
+    if anterior is None or anterior.window != WINDOW:
+        return None
+
+    ds = np.asarray(serie.ds, dtype='datetime64[ns]')
+    y = np.asarray(serie.y, dtype='float64')
+
+    k = anterior._appended(ds, y)
+    if k is None or (k > 0 and anterior._refresh_autolag(len(y))):
+        return None
+
+    return _lag_key(anterior.autolag_len, anterior.lags, len(y))
+
+
+def analyze(serie, path=STORE_PATH):
+    # parte da última análise armazenada, atualizando-a de forma incremental quando possível
+    anterior = StationarityAnalysis.load(path)
+
+    if anterior is None or anterior.window != WINDOW:
+        analise = StationarityAnalysis.compute(serie.ds, serie.y)
+    else:
+        analise = anterior.update(serie.ds, serie.y)
+
+    if analise is not anterior:
+        analise.save(path)
+
+    return analise
@@ -0,0 +1,103 @@
+import argparse
+import os
+import threading
+import time
+
+import pandas as pd
+
+import instrumentation
+from sources import DATE_COLUMN, PRICE_COLUMN, SOURCES, get_source, normalize
+
+
+LOCAL_STORE_DIR = 'dados/local'
+
+
+class BrentSync:
+    # mantém uma cópia local da série e busca na fonte apenas as linhas mais recentes que a última data
+    # armazenada (watermark); a versão só muda quando novas linhas são incorporadas
+    def __init__(self, source, store_path=None, interval=3600):
+        self.source = source
+        self.store_path = store_path or os.path.join(LOCAL_STORE_DIR, f'petroleo_brent_{source.name}.parquet')
+        self.interval = interval
+        self.last_sync = None
+        self._lock = threading.RLock()
+        self._df = self._read_store()
+
+    def _read_store(self):
+        if os.path.exists(self.store_path):
+            return normalize(pd.read_parquet(self.store_path))
+
+        return normalize(pd.DataFrame({DATE_COLUMN: pd.Series(dtype='datetime64[ns]'), PRICE_COLUMN: pd.Series(dtype='float64')}))
+
+    def _write_store(self, df):
+        os.makedirs(os.path.dirname(self.store_path) or '.', exist_ok=True)
+
+        # escrita atômica: leitores de outros processos nunca encontram um arquivo parcial
+        tmp_path = f'{self.store_path}.tmp{os.getpid()}'
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, self.store_path)
+
+    @property
+    def watermark(self):
+        if self._df.empty:
+            return None
+
+        # os dados são mantidos em ordem decrescente, então a data mais recente é a primeira linha
+        return self._df[DATE_COLUMN].iloc[0]
+
+    @property
+    def version(self):
+        if self._df.empty:
+            return 'vazio'
+
+        return f'{self.watermark:%Y%m%d}-{len(self._df)}'
+
+    def data(self):
+        return self._df
+
+    def sync(self):
+        with self._lock:
+            # registrado antes da consulta para que uma falha na fonte também respeite o intervalo
+            self.last_sync = time.monotonic()
+            with instrumentation.stage(f'fonte/{self.source.name}'):
+                novos = self.source.fetch_since(self.watermark)
+
+            if self.watermark is not None:
+                novos = novos[novos[DATE_COLUMN] > self.watermark]
+
+            if novos.empty:
+                return False
+
+            # as novas linhas são sempre posteriores às armazenadas, então basta empilhá-las no topo
+            df = pd.concat([novos, self._df], ignore_index=True)
+            self._write_store(df)
+            self._df = df
+
+            return True
+
+    def maybe_sync(self):
+        # consulta a fonte no máximo uma vez a cada intervalo, mesmo com várias sessões simultâneas
+        with self._lock:
+            if self.last_sync is not None and time.monotonic() - self.last_sync < self.interval:
+                return False
+
+            return self.sync()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sincroniza a cópia local da série do preço do petróleo Brent.')
+    parser.add_argument('--source', choices=list(SOURCES), default='csv', help='fonte de dados (csv é a substituta offline do BigQuery)')
+    parser.add_argument('--store', default=None, help='arquivo Parquet da cópia local')
+    args = parser.parse_args()
+
+    brent_sync = BrentSync(get_source({'type': args.source}), args.store)
+    watermark = brent_sync.watermark
+
+    inicio = time.perf_counter()
+    changed = brent_sync.sync()
+
+    print(f'watermark anterior: {watermark} | nova versão: {brent_sync.version} | alterado: {changed} ({time.perf_counter() - inicio:.2f}s)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+import os
+
+import pandas as pd
+import streamlit as st
+
+import instrumentation
+
+
+def render():
+    st.divider()
+    st.markdown("## Administração")
+
+    st.markdown("### Latência por Etapa")
+    st.markdown(f"Execuções recentes (últimas {instrumentation.HISTORY_SIZE} por etapa) de todas as sessões deste processo.")
+
+    resumo = instrumentation.timings.summary()
+    if resumo:
+        st.dataframe(pd.DataFrame(resumo).round(2), hide_index=True, use_container_width=True)
+    else:
+        st.write('Nenhuma etapa registrada.')
+
+    st.markdown("### Caches")
+
+    caches = instrumentation.cache_stats()
+    linhas = [{'cache': nome, **stats} for nome, stats in caches.items() if isinstance(stats, dict)]
+    if linhas:
+        st.dataframe(pd.DataFrame(linhas), hide_index=True, use_container_width=True)
+
+    # estatísticas em formato de lista (ex.: um item por modelo carregado)
+    for nome, stats in caches.items():
+        if isinstance(stats, list) and stats:
+            st.markdown(f"**{nome}**")
+            st.dataframe(pd.DataFrame(stats), hide_index=True, use_container_width=True)
+
+    st.markdown("### Perfil de Execução")
+    st.markdown("A próxima execução da aba selecionada é perfilada por amostragem e as pilhas são salvas no formato colapsado, utilizado pelo flamegraph.pl e pelo speedscope.")
+
+    col1, col2 = st.columns(2)
+
+    # os callbacks rodam antes da execução disparada pelo clique, que assim já é perfilada (ou parte das métricas zeradas)
+    col1.button('Perfilar a próxima execução', on_click=st.session_state.__setitem__, args=('perfilar', True))
+    col2.button('Zerar as métricas', on_click=instrumentation.timings.reset)
+
+    ultimo_perfil = st.session_state.get('ultimo_perfil')
+    if ultimo_perfil and os.path.exists(ultimo_perfil):
+        with open(ultimo_perfil, 'rb') as f:
+            st.download_button('Baixar o último perfil', f.read(), file_name=os.path.basename(ultimo_perfil))
@@ -0,0 +1,22 @@
+import streamlit as st
+
+
+def render():
+    st.markdown("## Detalhamento Técnico") 
+
+    st.image('./imagens/arquitetura.png', caption='Arquitetura do projeto')
+    texto = """
+        A arquitetura do trabalho desenvolvido segue os seguintes passos:
+
+        + **Web Scraping do Site do IPEA:** Os dados do IPEA, referente ao preço do petróleo bruto Brent, são extraídos regularmente. Esse processo é automatizado por meio do GitHub Actions, garantindo que o script seja executado diariamente às 10h da manhã.
+
+        + **Armazenamento no Google BigQuery:** Os dados extraídos são armazenados na tabela "petroleo_brent" no Google BigQuery. Isso proporciona uma solução escalável e eficiente para armazenamento e gerenciamento de grandes conjuntos de dados.
+
+        + **Notebook - Análise dos Modelos:** Um notebook foi desenvolvido com o propósito de realizar a avaliação de desempenho dos modelos Naive, Seasonal Naive, Seasonal Window Average, Seasonal Exponential Smoothing Optimized e AutoARIMA. Este notebook se conecta ao BigQuery para extrair os dados. Após a análise o modelo que obteve a melhor performance é extraído por meio do Joblib.
+
+        + **Aplicação Streamlit:** Além do notebook, uma aplicação Streamlit foi desenvolvida para oferecer uma interface interativa para a análise das séries temporais. Essa aplicação também se conecta ao BigQuery para extrair dados em tempo real, fornecendo uma visualização dinâmica e amigável para os usuários finais.
+
+        + **Dashboard Power BI:** Um dashboard foi desenvolvido no Power BI com o objetivo de oferecer insights relevantes sobre a variação do preço do petróleo. No entanto, devido ao fato de o Power BI ser uma aplicação paga para publicação de dashboards online, não foi possível disponibilizar a visualização de forma acessível pela web. Para contornar essa limitação, um arquivo .pbix foi gerado e está disponível para download. Dessa forma, os interessados podem baixar o arquivo e executar o dashboard localmente no Power BI para explorar e analisar as informações relacionadas à variação de preços do petróleo.
+       
+    """
+    st.markdown(texto) 
@@ -0,0 +1,284 @@
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+import downsampling
+import instrumentation
+import rollups
+import scenarios
+
+
+@st.cache_data(max_entries=32)
+def serie_reduzida(data_version, inicio, fim, _serie, n_out=downsampling.POINT_BUDGET):
+    # o gráfico recebe no máximo n_out pontos do período selecionado; ao reduzir o período, a resolução aumenta
+    # (utilizada na visão geral e nos gráficos dos cenários)
+    ds = _serie.ds[::-1]
+    y = _serie.y[::-1]
+
+    janela = downsampling.date_window(ds, inicio, fim)
+    return downsampling.downsample(ds[janela], y[janela], n_out)
+
+
+@st.cache_resource
+def get_rollups():
+    # agregados compartilhados por todas as sessões, atualizados de forma incremental a cada nova versão dos dados
+    store = rollups.RollupStore()
+    instrumentation.register_cache('agregados', store.stats)
+    return store
+
+
+@st.cache_resource(max_entries=2)
+def get_scenarios(data_version, _serie):
+    # índice dos cenários e os respectivos resumos, compartilhados por todas as sessões
+    return scenarios.ScenarioIndex(_serie)
+
+
+COLUNAS_RESUMO = {
+    'cenario': 'Cenário', 'inicio': 'Início', 'fim': 'Fim', 'dias': 'Dias', 'minimo': 'Mínimo (US$)',
+    'maximo': 'Máximo (US$)', 'media': 'Média (US$)', 'variacao_pct': 'Variação (%)',
+    'volatilidade_anual_pct': 'Volatilidade Anual (%)', 'drawdown_max_pct': 'Drawdown Máximo (%)',
+    'data_pico': 'Pico', 'data_vale': 'Vale',
+}
+
+
+def render_scenarios(cenarios, serie):
+    st.markdown("## Cenários")
+
+    paragrafo_cenarios = "Assim como na aba Cenários do dashboard, a tabela abaixo resume o preço do barril em cada período analisado. O drawdown máximo é a maior queda a partir de um pico anterior dentro do período, com as datas do pico e do vale correspondentes. Novos cenários podem ser adicionados informando o nome e o período."
+    st.markdown(f'<p style="text-align: justify;">{paragrafo_cenarios}</p>', unsafe_allow_html=True)
+
+    # cenários personalizados ficam na sessão; os pré-definidos são compartilhados e não são alterados
+    personalizados = st.session_state.setdefault('cenarios_personalizados', {})
+
+    data_inicial = pd.Timestamp(cenarios.ds[0]).date()
+    data_final = pd.Timestamp(cenarios.ds[-1]).date()
+
+    with st.form('novo_cenario', clear_on_submit=True):
+        col1, col2 = st.columns(2)
+        nome = col1.text_input('Nome do cenário')
+        periodo = col2.date_input('Período', value=(data_inicial, data_final), min_value=data_inicial, max_value=data_final, format='DD/MM/YYYY')
+
+        if st.form_submit_button('Adicionar cenário'):
+            if not nome.strip():
+                st.error('Informe o nome do cenário.')
+            elif len(periodo) != 2:
+                st.error('Selecione a data inicial e a data final do período.')
+            elif nome.strip() in cenarios.scenarios:
+                st.error(f'Já existe um cenário chamado {nome.strip()}.')
+            else:
+                personalizados[nome.strip()] = periodo
+
+    resumos = cenarios.summaries()
+    if personalizados:
+        resumos = pd.concat([resumos, pd.DataFrame([{'cenario': nome, **cenarios.summarize(*periodo)}
+                                                     for nome, periodo in personalizados.items()])], ignore_index=True)
+
+    st.dataframe(resumos.rename(columns=COLUNAS_RESUMO).round(2), hide_index=True, use_container_width=True)
+
+    nome = st.selectbox('Cenário exibido', resumos['cenario'])
+    inicio, fim = personalizados.get(nome) or cenarios.scenarios[nome]
+    ds, y = cenarios.window(inicio, fim)
+    resumo = resumos.set_index('cenario').loc[nome]
+
+    # a linha é reduzida como os demais gráficos; o pico e o vale são marcados sobre a série completa
+    fig = px.line(serie_reduzida(serie.version, inicio, fim, serie), x='ds', y='y', title=f'Preço por Barril do Petróleo Bruto Brent: {nome}')
+    fig.update_xaxes(title='Data')
+    fig.update_yaxes(title='Preço (US$)')
+
+    # pico e vale do drawdown máximo do período
+    for rotulo, data in (('Pico', resumo['data_pico']), ('Vale', resumo['data_vale'])):
+        posicao = downsampling.date_window(ds, data, data).start
+        fig.add_scatter(x=[ds[posicao]], y=[y[posicao]], mode='markers+text', text=[rotulo], textposition='top center',
+                        marker={'size': 10}, showlegend=False)
+
+    with instrumentation.stage('grafico/cenario/plotly'):
+        st.plotly_chart(fig)
+
+
+def render(serie):
+    st.markdown("## Visão Geral dos Dados")
+
+    cenarios = get_scenarios(serie.version, serie)
+
+    paragrafo1_tab1 = "O gráfico abaixo apresenta o preço do barril do petróleo bruto Brent comercializado ao longo dos anos."
+
+    texto_justificado1_tab1 = f'<p style="text-align: justify;">{paragrafo1_tab1}</p>'
+    st.markdown(texto_justificado1_tab1, unsafe_allow_html=True) 
+
+    data_inicial = pd.Timestamp(serie.ds.min()).date()
+    data_final = serie.last_date.date()
+    periodo = st.slider('Período exibido', min_value=data_inicial, max_value=data_final, value=(data_inicial, data_final), format='DD/MM/YYYY')
+
+    agregacoes = {'Diária': None, **{nome: freq for freq, nome in rollups.FREQUENCIES.items()}}
+    agregacao = st.radio('Agregação', list(agregacoes), horizontal=True)
+
+    if agregacoes[agregacao] is None:
+        df_reduzido_tab1 = serie_reduzida(serie.version, periodo[0], periodo[1], serie)
+        fig = px.line(df_reduzido_tab1, x='ds', y='y', title='Preço por Barril do Petróleo Bruto Brent')
+    else:
+        # abertura, máxima, mínima e fechamento de cada período, com a média do período em linha
+        store = get_rollups()
+        store.update(serie)
+        df_agregado = store.frame(agregacoes[agregacao], periodo[0], periodo[1])
+
+        fig = go.Figure([
+            go.Candlestick(x=df_agregado['ds'], open=df_agregado['open'], high=df_agregado['high'], low=df_agregado['low'],
+                           close=df_agregado['close'], name='Preço'),
+            go.Scatter(x=df_agregado['ds'], y=df_agregado['mean'], mode='lines', name='Média'),
+        ])
+        fig.update_layout(title=f'Preço por Barril do Petróleo Bruto Brent ({agregacao})', xaxis_rangeslider_visible=False)
+
+    fig.update_xaxes(title='Data')
+    fig.update_yaxes(title='Preço (US$)')
+
+    with instrumentation.stage('grafico/visao_geral/plotly'):
+        st.plotly_chart(fig)
+    
+
+    st.markdown("## Crise Econômica Global de 2008")
+    
+    paragrafo2_tab1 = """
+        Através da análise do gráfico, pode-se constatar um aumento acentuado no preço do barril do petróleo bruto Brent de 2007 até a primeira metade de 2008, atingindo o preço máximo histórico em julho de 2008 de US$ 143.95 dólares. Esse aumento no preço pode ser atribuído a uma combinação de fatores econômicos e geopolíticos, como exemplo:
+
+
+        + **Demanda Global Crescente:** A forte demanda por petróleo, especialmente da China e de outros países em desenvolvimento, impulsionou os preços. O crescimento econômico global, especialmente nos setores industrial e de transporte, aumentou a necessidade de energia.
+
+        + **Instabilidade Geopolítica:** Tensões geopolíticas em várias regiões produtoras de petróleo, como o Oriente Médio e o Norte da África, contribuíram para a incerteza quanto ao fornecimento. Eventos como a escalada de conflitos no Iraque, a instabilidade no Irã e a interrupção da produção na Nigéria impactaram as perspectivas de oferta, elevando os preços.
+
+        + **Dólar Americano Fraco:** O enfraquecimento do dólar norte-americano também desempenhou um papel significativo. O petróleo é cotado em dólar, e quando o valor do dólar cai, os preços do petróleo tendem a subir para compensar a perda de valor da moeda.
+
+        + **Restrições na Oferta:** Limitações na capacidade de produção da Organização dos Países Exportadores de Petróleo (OPEP) e a dificuldade em aumentar rapidamente a produção de petróleo em resposta à crescente demanda também exerceram pressão sobre os preços.
+    """
+    
+    st.markdown(paragrafo2_tab1)
+
+    
+    paragrafo3_tab1 = """
+        Contudo, esse aumento significativo no preço do barril do petróleo teve um impacto significativo na economia global, culminando, dentre outros fatores, na **Crise Econômica** que se desdobrou na segunda metade de 2008, devido a:
+
+        + **Pressão sobre os Consumidores:** O aumento nos preços do petróleo resultou em custos mais elevados para os consumidores, especialmente no que diz respeito aos gastos com combustíveis e produtos derivados de petróleo. Isso reduziu a renda disponível das famílias, afetando negativamente o consumo e desencadeando uma desaceleração econômica.
+
+        + **Inflação:** O aumento nos preços do petróleo contribuiu para a inflação, à medida que os custos de produção aumentaram para várias indústrias. Isso levou a um ambiente econômico em que os bancos centrais foram desafiados a equilibrar a necessidade de controlar a inflação e, ao mesmo tempo, estimular o crescimento econômico.
+
+        + **Impacto nos Setores Sensíveis:** Setores intensivos em energia, como transporte, manufatura e agricultura, foram particularmente afetados pelos preços elevados do petróleo. Empresas nesses setores enfrentaram aumentos nos custos operacionais, levando a cortes de empregos e redução de investimentos.
+
+        + **Desencadeamento de Crises Financeiras em Outros Setores:** O impacto inicial nos preços do petróleo desencadeou uma série de eventos que amplificaram a crise. As dificuldades enfrentadas por consumidores e empresas no pagamento de dívidas levaram a uma crise no mercado de hipotecas subprime nos Estados Unidos, que acabou se espalhando para o sistema financeiro global.
+
+        + **Desaceleração Econômica Global:** A combinação de inflação, custos mais elevados e redução do consumo levou a uma desaceleração econômica global. Isso exacerbou os desafios enfrentados por instituições financeiras já sob pressão devido à crise do mercado imobiliário.    
+
+
+        A Crise Econômica Global abalou os alicerces do mercado financeiro e esse fato reverberou nos preços do petróleo Brent, resultando em uma queda expressiva, conforme evidenciado abaixo:
+
+    """
+    st.markdown(paragrafo3_tab1)
+
+    df_filtrado_tab1 = serie_reduzida(serie.version, *cenarios.scenarios['Crise Econômica de 2008'], serie)
+       
+    fig = px.line(df_filtrado_tab1, x='ds', y='y', title='Preço por Barril do Petróleo Bruto Brent')
+    fig.update_xaxes(title='Data')
+    fig.update_yaxes(title='Preço (US$)', range=[2, 150])
+    fig.update_layout(width = 700)
+
+    with instrumentation.stage('grafico/crise_2008/plotly'):
+        st.plotly_chart(fig)
+
+
+    st.markdown("## Primavera Árabe")
+
+    paragrafo4_tab1 = """
+        A Primavera Árabe foi uma série de protestos, revoltas e manifestações populares que eclodiram em vários países do Oriente Médio e do Norte da África a partir de 2010. Esses eventos foram impulsionados por uma combinação de fatores, incluindo descontentamento político, social e econômico, além do desejo por reformas democráticas. Os países mais notoriamente afetados incluíram Tunísia, Egito, Líbia, Síria e Iêmen.
+
+        A influência da Primavera Árabe no preço do petróleo Brent pode ser compreendida em vários pontos-chave:
+
+        - **Instabilidade Geopolítica:** A Primavera Árabe desencadeou instabilidades geopolíticas significativas na região do Oriente Médio e Norte da África. Conflitos e incertezas políticas em países produtores de petróleo, como Líbia e Síria, afetaram as operações de produção e exportação de petróleo, gerando preocupações sobre a oferta global.
+
+        - **Interrupções na Produção e Exportação:** Em países onde os protestos evoluíram para conflitos armados, como a Líbia, as interrupções na produção e exportação de petróleo contribuíram para a volatilidade nos preços do petróleo Brent. A oferta restrita em meio à demanda contínua resultou em picos nos preços do petróleo.
+
+        - **Desafios para a OPEP:** A Organização dos Países Exportadores de Petróleo (OPEP) enfrentou desafios significativos durante a Primavera Árabe. A capacidade da OPEP para coordenar a produção e estabilizar os preços foi prejudicada pela instabilidade em alguns de seus membros-chave, afetando a influência do grupo sobre o mercado de petróleo.
+
+        - **Impacto na Economia Global:** A instabilidade nos preços do petróleo Brent devido à Primavera Árabe teve implicações na economia global. A elevação dos preços do petróleo contribuiu para custos mais altos de produção e transporte em vários setores econômicos, impactando o crescimento econômico global.
+
+        Ou seja, a Primavera Árabe influenciou os preços do petróleo Brent principalmente através da instabilidade geopolítica, interrupções na produção e exportação de petróleo e percepções de risco que levaram a especulações nos mercados financeiros. Esses fatores destacam a sensibilidade do mercado de petróleo a eventos geopolíticos em regiões-chave de produção.
+    """
+    
+    st.markdown(paragrafo4_tab1)
+
+    df_filtrado2_tab1 = serie_reduzida(serie.version, *cenarios.scenarios['Primavera Árabe'], serie)
+       
+    fig = px.line(df_filtrado2_tab1, x='ds', y='y', title='Preço por Barril do Petróleo Bruto Brent Durante a Primavera Árabe')    
+    fig.update_xaxes(title='Data')
+    fig.update_yaxes(title='Preço (US$)', range=[2, 150])
+    fig.update_layout(width = 800)
+    with instrumentation.stage('grafico/primavera_arabe/plotly'):
+        st.plotly_chart(fig)
+
+
+    st.markdown("## Expansão da Produção de Xisto nos EUA")
+
+    paragrafo5_tab1 = """
+        O petróleo de xisto refere-se a óleo extraído de forma não convencional a partir de formações de xisto, utilizando técnicas como fraturamento hidráulico (fracking). A exploração comercial em grande escala do petróleo de xisto começou nos Estados Unidos, onde as reservas significativas desses depósitos foram identificadas.
+
+        A influência do petróleo de xisto nos preços do petróleo Brent pode ser compreendida em vários pontos-chave:
+
+        - **Aumento da Oferta Global:** A exploração bem-sucedida de petróleo de xisto levou a um aumento significativo na oferta global de petróleo. Os Estados Unidos, em particular, transformaram-se de importadores líquidos para exportadores líquidos, alterando significativamente a dinâmica do mercado internacional de petróleo e reduzindo a dependência de algumas regiões produtoras tradicionais.
+
+        - **Impacto na Dinâmica da OPEP:** O aumento da produção de petróleo de xisto desafiou a influência tradicional da Organização dos Países Exportadores de Petróleo (OPEP) sobre os preços e a oferta global. A OPEP viu sua capacidade de manipular os preços do petróleo enfraquecida, uma vez que o petróleo de xisto contribuiu para um mercado mais competitivo.
+
+        - **Volatilidade nos Preços:** A rápida expansão da produção de petróleo de xisto contribuiu para maior volatilidade nos preços do petróleo Brent. A capacidade de resposta mais rápida da produção de xisto às mudanças nos preços tornou o mercado mais suscetível a flutuações, pois a oferta poderia aumentar ou diminuir rapidamente em resposta às condições do mercado.
+
+        - **Pressão sobre Países Produtores Tradicionais:** Países tradicionalmente dependentes da exportação de petróleo, especialmente aqueles com custos de produção mais elevados, sentiram a pressão da crescente produção de xisto. Isso incluiu países da OPEP que dependiam de preços mais altos para sustentar suas economias.
+
+        - **Inovação Tecnológica e Redução de Custos:** A exploração do petróleo de xisto foi impulsionada pela inovação tecnológica, resultando em processos mais eficientes e uma redução nos custos de produção ao longo do tempo. Isso teve um impacto direto na competitividade do petróleo de xisto em comparação com outras fontes de petróleo.
+
+        - **Adaptação da Indústria Global:** A ascensão do petróleo de xisto obrigou a indústria global de energia a se adaptar a um novo paradigma. Empresas e países precisaram reavaliar suas estratégias de produção, investimentos e políticas energéticas à luz da mudança na dinâmica do mercado.
+
+        Em resumo, o petróleo de xisto influenciou os preços do petróleo Brent ao aumentar a oferta global, desafiar o domínio da OPEP, introduzir maior volatilidade nos preços, pressionar países produtores tradicionais e estimular inovações tecnológicas na indústria de energia. Esses efeitos destacam a transformação significativa que o petróleo de xisto trouxe para o mercado global de petróleo.
+    """
+    
+    st.markdown(paragrafo5_tab1)
+
+    df_filtrado3_tab1 = serie_reduzida(serie.version, *cenarios.scenarios['Expansão do Xisto nos EUA'], serie)
+       
+    fig = px.line(df_filtrado3_tab1, x='ds', y='y', title='Preço por Barril do Petróleo Bruto Brent Durante a Expansão da Produção de Xisto nos EUA')    
+    fig.update_xaxes(title='Data')
+    fig.update_yaxes(title='Preço (US$)', range=[2, 150])
+    fig.update_layout(width = 800)
+    with instrumentation.stage('grafico/xisto/plotly'):
+        st.plotly_chart(fig)
+
+
+    st.markdown("## Pandemia Covid-19")
+
+    paragrafo6_tab1 = """
+        A pandemia de COVID-19, causada pelo vírus SARS-CoV-2, começou em dezembro de 2019 na cidade de Wuhan, na China, e rapidamente se disseminou globalmente. Em março de 2020, a Organização Mundial da Saúde (OMS) declarou a COVID-19 uma pandemia, desencadeando uma série de medidas de contenção, lockdowns e impactos significativos em diversos setores da sociedade.
+
+        A pandemia teve um impacto substancial nos preços do petróleo Brent, e aqui estão alguns dos pontos-chave dessa influência:
+
+        - **Colapso da Demanda por Energia:** Com lockdowns e restrições generalizadas em todo o mundo, a demanda global por energia despencou. Viagens aéreas, rodoviárias e marítimas foram drasticamente reduzidas, e setores industriais experimentaram paralisações, resultando em uma queda acentuada na demanda por petróleo.
+
+        - **Excesso de Oferta e Armazenamento Cheio:** O colapso da demanda ocorreu em um contexto de uma oferta já elevada de petróleo, devido à guerra de preços entre a Arábia Saudita e a Rússia no início de 2020. A combinação de excesso de oferta e falta de capacidade de armazenamento levou a uma pressão extrema sobre os preços do petróleo Brent.
+
+        - **Acordos de Produção da OPEP+:** Em resposta à crise, a Organização dos Países Exportadores de Petróleo (OPEP) e aliados, conhecidos como OPEP+, concordaram em reduzir a produção para equilibrar o mercado e sustentar os preços do petróleo. Esses acordos foram cruciais para conter a queda livre dos preços.
+
+        - **Recuperação Gradual com a Vacinação:** A expectativa e o progresso na vacinação contra a COVID-19 começaram a alterar as perspectivas do mercado de petróleo. A antecipação de uma recuperação econômica impulsionou a demanda, levando a um aumento gradual nos preços do petróleo Brent.
+
+        - **Volatilidade e Sensibilidade a Notícias Relacionadas à Pandemia:** Durante a pandemia, os preços do petróleo Brent tornaram-se extremamente sensíveis a desenvolvimentos relacionados à saúde pública e medidas de contenção. Notícias sobre avanços ou retrocessos na luta contra a COVID-19 influenciaram a confiança do mercado e os preços do petróleo.
+
+        Dessa forma, a pandemia da COVID-19 teve um impacto significativo nos preços do petróleo Brent, causando uma queda abrupta devido ao colapso da demanda, excesso de oferta e problemas de armazenamento. As ações da OPEP+ e as expectativas de recuperação econômica com a vacinação contribuíram para a estabilização gradual dos preços ao longo do tempo.
+    """
+    
+    st.markdown(paragrafo6_tab1)
+
+    df_filtrado4_tab1 = serie_reduzida(serie.version, *cenarios.scenarios['Pandemia de Covid-19'], serie)
+       
+    fig = px.line(df_filtrado4_tab1, x='ds', y='y', title='Preço por Barril do Petróleo Bruto Brent Durante a Pandemia da Covid-19')    
+    fig.update_xaxes(title='Data')
+    fig.update_yaxes(title='Preço (US$)', range=[2, 150])
+    fig.update_layout(width = 800)
+
+    with instrumentation.stage('grafico/covid/plotly'):
+        st.plotly_chart(fig)
+
+
+    render_scenarios(cenarios, serie)
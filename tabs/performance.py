@@ -0,0 +1,537 @@
+import matplotlib.pyplot as plt
+import plotly.graph_objects as go
+import streamlit as st
+
+import autocorrelation
+import evaluation
+import figures
+import instrumentation
+from sources import TABLE_ID
+
+
+@st.cache_resource
+def get_figure_cache():
+    # os gráficos do matplotlib são rasterizados uma única vez por versão dos dados e compartilhados entre as sessões
+    figure_cache = figures.FigureCache()
+    instrumentation.register_cache('figuras', figure_cache.stats)
+
+    return figure_cache
+
+
+def render(serie):
+    st.markdown("## Performance dos Modelos") 
+
+    st.markdown("### Objetivo")
+
+    st.markdown("O objetivo da construção deste modelo de machine learning é a predição do preço diário do barril de petróleo bruto Brent através da análise dos dados históricos.")
+
+    st.markdown("### Base de Dados")
+
+    paragrafo1_tab4 = "Para a realização desta análise, foram utilizados dados de periodicidade diária, obtidos no site do <a href='http://www.ipeadata.gov.br/ExibeSerie.aspx?module=m&serid=1650971490&oper=view' target='_blank'>IPEA</a>."
+
+    paragrafo2_tab4 = "O IPEA, Instituto de Pesquisa Econômica Aplicada, é uma instituição brasileira vinculada ao governo federal. Ele foi criado em 1964 e tem como objetivo realizar pesquisas e estudos econômicos aplicados para subsidiar o governo na formulação e avaliação de políticas públicas."
+
+    paragrafo3_tab4 = """
+    A base de dados contém as seguintes informações:
+
+    + **Data:** Data em que as informações foram registradas
+
+    + **Preço Petróleo Bruto Brent:** preço em dólar do barril de petróleo bruto Brent
+
+    """
+
+    texto_justificado1_tab4 = f"""
+    <p style="text-align: justify;">{paragrafo1_tab4}</p>
+    <p style="text-align: justify;">{paragrafo2_tab4}</p>
+    <p style="text-align: justify;">{paragrafo3_tab4}</p>  
+    """
+
+    st.markdown(texto_justificado1_tab4, unsafe_allow_html=True)
+
+    fingerprint_avaliacao = evaluation.evaluation_fingerprint(serie)
+    avaliacao = evaluation.load_artifact(fingerprint_avaliacao)
+
+    if avaliacao is None:
+        # a avaliação é gerada uma única vez por versão dos dados, fora do ciclo de renderização da página
+        evaluation.start_background_build(serie, fingerprint_avaliacao)
+        st.info('A avaliação dos modelos está sendo processada em segundo plano. Atualize a página em alguns instantes para visualizar os resultados.')
+
+    else:
+        st.markdown("### Transformação de Dados")
+
+        st.markdown(f'<p style="text-align: justify;">Para a transformação, foi realizada a leitura dos dados da tabela "{TABLE_ID}" armazenada no Google Big Query e as colunas foram ajustadas para o padrão de time series.</p>', unsafe_allow_html=True)
+        st.markdown('<p style="text-align: justify;">Devido a falta de dados nos finais de semana e feriados, por não haver comercialização de petróleo nestes dias, o valor do fechamento do último dia útil disponível será utilizado para preencher esses gaps, uma vez que os modelos de séries temporais necessitam que a periodicidade seja uniforme durante todo o período.</p>', unsafe_allow_html=True)
+
+        df_pipe_tab4 = avaliacao['serie']
+    
+        st.dataframe(df_pipe_tab4)
+
+
+        st.markdown("### Seasonal Decompose")
+
+        paragrafo4_tab4 = "Após a finalização das transformações dos dados, podemos aplicar e analisar o seasonal decompose."
+        paragrafo5_tab4 = "O seasonal decompose divide uma série em três principais componentes: tendência, sazonalidade e resíduos (o primeiro gráfico mostra os dados da série em si)."
+
+        texto_justificado2_tab4 = f"""
+        <p style="text-align: justify;">{paragrafo4_tab4}</p>
+        <p style="text-align: justify;">{paragrafo5_tab4}</p>    
+        """
+
+        st.markdown(texto_justificado2_tab4, unsafe_allow_html=True)
+
+
+        st.markdown("#### Tendência (Trend)")
+
+        paragrafo6_tab4 = '<p style="text-align: justify;">A tendência representa a direção geral dos dados ao longo do tempo. E ela é crucial para entender o comportamento de longo prazo dos dados e pode ser usada para fazer previsões de longo prazo.</p>'
+        st.markdown(paragrafo6_tab4, unsafe_allow_html=True)
+    
+        st.markdown("#### Sazonalidade (Seasonal)")
+
+        paragrafo7_tab4 = '<p style="text-align: justify;">Já a sazonalidade se refere a padrões repetitivos em intervalos regulares de tempo, como sazonalidade diária, mensal ou anual. A sazonalidade é importante para entender os padrões cíclicos e prever eventos sazonais, como vendas sazonais ou comportamento do mercado.</p>'
+        st.markdown(paragrafo7_tab4, unsafe_allow_html=True)
+
+        st.markdown("#### Resíduos (Residual)")
+        paragrafo8_tab4 = '<p style="text-align: justify;">Os resíduos são a parte não explicada pela tendência e pela sazonalidade. Eles representam o "ruído" ou a aleatoriedade na série e são importantes para entender a variação não explicada na série. Modelos de previsão frequentemente se concentram na modelagem dos resíduos para melhorar a precisão das previsões. A análise deste resultado é fundamental para entender a estrutura e os componentes da série.</p>'
+        st.markdown(paragrafo8_tab4, unsafe_allow_html=True)
+
+    
+        results = avaliacao['decomposicao']
+   
+        def figura_decomposicao():
+            fig, (ax1, ax2, ax3, ax4) = plt.subplots(4, 1, figsize=(40, 20))
+
+            # Gráfico 1 - Observado
+            ax1.plot(results['observado'])
+            ax1.set_title("Observado")
+            ax1.set_xlabel("Data")
+            ax1.set_ylabel("Valor Observado")
+
+            # Gráfico 2 - Tendência
+            ax2.plot(results['tendencia'])
+            ax2.set_title("Tendência")
+            ax2.set_xlabel("Data")
+            ax2.set_ylabel("Valor da Tendência")
+
+            # Gráfico 3 - Sazonalidade
+            ax3.plot(results['sazonalidade'])
+            ax3.set_title("Sazonalidade")
+            ax3.set_xlabel("Data")
+            ax3.set_ylabel("Valor da Sazonalidade")
+
+            # Gráfico 4 - Resíduos
+            ax4.plot(results['residuos'])
+            ax4.set_title("Resíduos")
+            ax4.set_xlabel("Data")
+            ax4.set_ylabel("Valor dos Resíduos")
+
+
+            plt.tight_layout()    
+            return fig
+
+        st.image(get_figure_cache().render(fingerprint_avaliacao, 'decomposicao', figura_decomposicao), use_column_width=True)
+
+        paragrafo9_tab4 = """
+        <p style="text-align: justify;">
+        A partir dos gráficos acima, pode-se constatar que:
+
+        **Análise da Tendência**
+
+        A tendência é crescente, indicando um aumento ao longo do tempo, contudo, não pode ser definido como um aumento constante.
+
+
+        **Análise da Sazonalidade**
+
+        Não há uma definição de períodos de sazonalidade.
+
+
+        **Análise dos Resíduos**
+
+        Os resíduos variam bastante ao longo do tempo, com uma certa tendencia de crescimento e com alguns picos bem definidos.
+        </p>
+        """
+        st.markdown(paragrafo9_tab4, unsafe_allow_html=True)
+
+        st.markdown("### Augmented Dickey-Fuller (ADF) e Transformações")
+
+        st.markdown('<p style="text-align: justify;">O Augmented Dickey-Fuller (ADF) é um teste estatístico utilizado para avaliar a estacionariedade em séries temporais. A estacionariedade é uma propriedade importante, pois muitos modelos de análise de séries temporais assumem que os dados sejam estacionários. A estacionariedade implica que as propriedades estatísticas da série, como a média e a variância, permaneçam constantes ao longo do tempo. Como resultado, o ADF retorna um valor de teste estatístico um p-value.</p>', unsafe_allow_html=True)
+        st.markdown("- **Hipótese Nula (H0):** a hipótese nula assume que a série temporal é não estacionária. Ou seja, ela possui raiz unitária, o que significa que a série possui alguma forma de tendência ou estrutura não estacionária.")
+        st.markdown("- **Hipótese Alternativa (H1):** a hipótese alternativa é a oposta da hipótese nula. Se o p-value for suficientemente baixo, você rejeita a hipótese nula e conclui que a série é estacionária.")
+        st.markdown("Analisando o resultado:")
+        st.markdown("- Se o p-value for menor que o nível de significância adotado (0,05) a hipótese nula é rejeitada e conclui-se que a série é estacionária. Além disso, também vamos analisar se o valor do teste estatísico é menor que o valor crítico de 5%")
+        st.markdown("- Se o valor-p for maior que o nível de significância, a hipótese nula não pode ser rejeitada, o que sugere que a série é não estacionária.")
+
+        adf_result = avaliacao['adf']['original']
+
+        st.markdown("#### Teste ADF")
+        st.write(f"**Teste Estatístico**: {adf_result['estatistica']}")
+        st.write(f"**P-Value**: {adf_result['p_value']}")
+        st.write("**Valores críticos:**")
+
+        for key, value in adf_result['valores_criticos'].items():
+          st.write(f"\t**{key}**: {value}")
+    
+        st.markdown("De acordo com as regras descritas acima, pode-se confirmar que a série não é estacionária.")
+        st.markdown("Também podemos confirmar a não estacionaridade através da análise gráfica.")
+
+        ma = avaliacao['transformacoes']['ma']
+
+        def figura_media_movel():
+            fig, ax = plt.subplots()
+            df_pipe_tab4.plot(ax=ax, legend=False)
+            ma.plot(ax=ax, legend=False, color='r')
+            ax.set_xlabel('Data')
+            ax.set_ylabel('Preço (US$)')
+            ax.set_title('Preço por Barril do Petróleo Bruto Brent')
+            return fig
+
+        st.image(get_figure_cache().render(fingerprint_avaliacao, 'media_movel', figura_media_movel), use_column_width=True)
+
+        st.markdown("Para transformar a série em estacionária, primeiramente, vamos aplicar a função de log.")
+
+        df_preco_petroleo_log = avaliacao['transformacoes']['log']
+        ma_log = avaliacao['transformacoes']['ma_log']
+
+        def figura_log():
+            fig, ax = plt.subplots()
+            df_preco_petroleo_log.plot(ax=ax, legend=False)
+            ma_log.plot(ax=ax, legend=False, color='r')
+            ax.set_xlabel('Data')
+            ax.set_ylabel('Preço (US$)')
+            ax.set_title('Preço por Barril do Petróleo Bruto Brent - Escala Logarítmica')
+            return fig
+
+        st.image(get_figure_cache().render(fingerprint_avaliacao, 'log', figura_log), use_column_width=True)
+
+        st.markdown("Através do gráfico acima, pode-se constatar que a escala foi ajustada, porém ainda não aparenta ser uma série estacionária. Aplicaremos novamente o ADF para comprovar")
+
+        adf_result_log = avaliacao['adf']['log']
+
+        st.markdown("#### Teste ADF")
+        st.write(f"**Teste Estatístico**: {adf_result_log['estatistica']}")
+        st.write(f"**P-Value**: {adf_result_log['p_value']}")
+        st.write("**Valores críticos:**")
+
+        for key, value in adf_result_log['valores_criticos'].items():
+          st.write(f"\t**{key}**: {value}")
+
+
+        st.markdown("Através dos resultados acima, confirmamos que a série ainda não é estacionária. Então, vamos aplicar a subtração do valor pela média móvel.")
+
+        df_preco_petroleo_s = avaliacao['transformacoes']['estacionaria']
+
+        ma_s = avaliacao['transformacoes']['ma_estacionaria']
+
+        std = avaliacao['transformacoes']['std_estacionaria']
+
+        def figura_estacionaria():
+            fig, ax = plt.subplots()
+            df_preco_petroleo_s.plot(ax=ax, legend=False)
+            ma_s.plot(ax=ax, legend=False, color='r')
+            std.plot(ax=ax, legend=False, color='g')
+            ax.set_xlabel('Data')
+            ax.set_ylabel('Preço (US$)')
+            ax.set_title('Preço por Barril do Petróleo Bruto Brent -  Série Estacionária')
+            return fig
+
+        st.image(get_figure_cache().render(fingerprint_avaliacao, 'estacionaria', figura_estacionaria), use_column_width=True)
+
+        adf_result_s = avaliacao['adf']['estacionaria']
+
+        st.markdown("#### Teste ADF")
+        st.write(f"**Teste Estatístico**: {adf_result_s['estatistica']}")
+        st.write(f"**P-Value**: {adf_result_s['p_value']}")
+        st.write("**Valores críticos:**")
+
+        for key, value in adf_result_s['valores_criticos'].items():
+          st.write(f"\t**{key}**: {value}")
+    
+        st.markdown("Confirmamos dessa forma que a série se tornou estacionária.")
+
+        st.markdown("### ACF e PACF")
+
+        paragrafo30_tab4 = '<p style="text-align: justify;">O ACF (AutoCorrelation Function) e o PACF (Partial AutoCorrelation Function) são ferramentas essenciais na análise de séries temporais. Eles são usados para entender a estrutura de dependência temporal nos dados e são fundamentais para a modelagem e previsão de séries temporais.</p>'
+        st.markdown(paragrafo30_tab4, unsafe_allow_html=True)
+
+        st.markdown("**ACF**")
+        st.markdown("- Quanto um período está relacionado com o outro, direta e indiretamente")
+        st.markdown("**PACF**")
+        st.markdown("- Quanto um período está relacionado apenas diretamente")
+    
+    
+        # os valores já estão calculados no artefato para todos os lags disponíveis; o slider apenas recorta o gráfico
+        max_lags = len(avaliacao['acf']['valores']) - 1
+        qtde_lags = st.slider('Quantidade de lags', min_value=10, max_value=max_lags, value=min(40, max_lags))
+
+        with instrumentation.stage('grafico/acf/plotly'):
+            st.plotly_chart(autocorrelation.figure(avaliacao['acf']['valores'], avaliacao['acf']['confint'], 'Autocorrelation Function (ACF)', qtde_lags))
+
+        with instrumentation.stage('grafico/pacf/plotly'):
+            st.plotly_chart(autocorrelation.figure(avaliacao['pacf']['valores'], avaliacao['pacf']['confint'], 'Partial Autocorrelation Function (PACF)', qtde_lags))
+    
+        st.markdown("Embora seja uma função composta, há uma relação forte do preço anterior do barril de petróleo bruto Brent com o próximo.")
+
+
+        st.markdown("### Métricas de Avaliação")
+
+        st.markdown("As métricas de avaliação utilizadas para medir o desempenho dos modelos são:")
+
+        st.markdown("#### WMAPE")
+
+        paragrafo10_tab4 = "O WMAPE (Weighted Mean Absolute Percentage Error) é uma métrica de avaliação usada na análise de séries temporais e previsão. Ele mede a precisão de um modelo de previsão em relação aos valores reais, levando em consideração pesos, caso necessário."
+        paragrafo11_tab4 = "Uma pontuação mais baixa de WMAPE indica maior precisão na previsão, mas a interpretação depende do contexto e da relevância dos dados."
+
+        texto_justificado3_tab4 = f"""
+        <p style="text-align: justify;">{paragrafo10_tab4}</p>
+        <p style="text-align: justify;">{paragrafo11_tab4}</p>    
+        """
+        st.markdown(texto_justificado3_tab4, unsafe_allow_html=True)
+
+
+        st.markdown("#### Erro Médio Percentual Absoluto (MAPE)")
+
+        paragrafo12_tab4 = "O MAPE (Mean Absolute Percentage Error), é uma medida usada para avaliar a precisão de previsões em relação aos valores reais. Ele calcula a média das diferenças absolutas entre as previsões e os valores reais e é expresso em porcentagem."
+        paragrafo13_tab4 = "Quanto menor o valor do MAPE, melhor é a precisão do modelo. Isso indica que as previsões estão, em média, mais próximas dos valores reais. Enquanto um valor alto, indica que as previsões estão longe dos valores observados e que o modelo precisa ser revisto."
+
+        texto_justificado4_tab4 = f"""
+        <p style="text-align: justify;">{paragrafo12_tab4}</p>
+        <p style="text-align: justify;">{paragrafo13_tab4}</p>    
+        """
+        st.markdown(texto_justificado4_tab4, unsafe_allow_html=True)
+
+
+        st.markdown("#### Root Mean Square Error (RMSE)")
+
+        paragrafo14_tab4 = "O RMSE (Root Mean Square Error) é uma métrica comum de avaliação em análise de séries temporais e previsão. Ele mede o erro médio quadrático entre as previsões e os valores reais, proporcionando uma medida da precisão do modelo."
+        paragrafo15_tab4 = "Quanto menor o valor do RMSE, maior a precisão da previsão. No entanto, sua interpretação deve levar em conta a escala dos dados e o contexto do problema."
+
+        texto_justificado5_tab4 = f"""
+        <p style="text-align: justify;">{paragrafo14_tab4}</p>
+        <p style="text-align: justify;">{paragrafo15_tab4}</p>    
+        """
+        st.markdown(texto_justificado5_tab4, unsafe_allow_html=True)
+
+
+        st.markdown("### Statsforecast")
+
+        paragrafo16_tab4 = '<p style="text-align: justify;">O StatsForecast é um pacote em Python que oferece funcionalidades para modelagem e previsão de séries temporais.</p>'
+        st.markdown(paragrafo16_tab4, unsafe_allow_html=True)
+    
+        st.markdown("#### Formatação dos Dados")
+
+        paragrafo17_tab4 = '<p style="text-align: justify;">Para utilizar o StatsForecast, é necessário fornecer como entrada um dataframe com as colunas <b>ds</b>, <b>y</b> e <b>unique_id</b>, em que <b>ds</b> representa a data associada a cada ponto dos dados da série temporal, <b>y</b> os valores numéricos e <b>unique_id</b> uma chave única.</p>'
+        st.markdown(paragrafo17_tab4, unsafe_allow_html=True)
+
+        df_pipe_tab4_sf = avaliacao['serie_statsforecast']
+        st.dataframe(df_pipe_tab4_sf)
+
+        st.markdown("#### Modelagem")
+
+        paragrafo18_tab4 = "Para iniciar a modelagem, dividiremos os dados em dois grupos: treino e teste."
+        paragrafo19_tab4 = "Dividir os dados em treino e teste no contexto de séries temporais é uma boa prática porque reflete a natureza do problema de previsão temporal. A ordem temporal dos dados é fundamental em séries temporais, pois a informação do passado é usada para prever o futuro. Dividir os dados em treino e teste permite simular essa situação realista, treinando o modelo em dados anteriores e avaliando sua capacidade de prever dados futuros não vistos. Isso ajuda a verificar se o modelo é capaz de generalizar e fazer previsões precisas em cenários reais, evitando vazamento de informações do futuro para o passado."
+
+        texto_justificado6_tab4 = f"""
+        <p style="text-align: justify;">{paragrafo18_tab4}</p>
+        <p style="text-align: justify;">{paragrafo19_tab4}</p>    
+        """
+        st.markdown(texto_justificado6_tab4, unsafe_allow_html=True)
+
+        modelos = avaliacao['modelos']
+
+        st.markdown("#### Execução dos Modelos")
+
+        st.markdown("##### Naive")
+
+        paragrafo20_tab4 = '<p style="text-align: justify;">Para iniciarmos a análise do StatsForecast, vamos utilizar o modelo básico Naive que é uma abordagem simples em que a previsão para o próximo período é igual à última observação conhecida.</p>'
+        st.markdown(paragrafo20_tab4, unsafe_allow_html=True)
+
+        forecast_naive = modelos['Naive']['forecast']
+
+        wmape1 = modelos['Naive']['wmape']
+        rmse1 = modelos['Naive']['rmse']
+        mape1 = modelos['Naive']['mape']
+
+        df_pipe_tab4_sf_filtered = avaliacao['real_filtrado']
+     
+        fig = go.Figure()
+
+        # série temporal prevista e intervalo de confiança
+        fig.add_trace(go.Scatter(x=forecast_naive['ds'], y=forecast_naive['Naive'], mode='lines', name='Previsão (Naive)', line=dict(color='rgb(101, 101, 101)')))
+        fig.add_trace(go.Scatter(x=forecast_naive['ds'], y=forecast_naive['Naive-lo-90'], fill=None, mode='lines', line=dict(color='rgb(228, 228, 228)', width=0), showlegend=False))
+        fig.add_trace(go.Scatter(x=forecast_naive['ds'], y=forecast_naive['Naive-hi-90'], fill='tonexty', mode='lines', line=dict(color='rgb(228, 228, 228)', width=0), showlegend=False))
+        fig.add_trace(go.Scatter(x=df_pipe_tab4_sf_filtered['ds'], y=df_pipe_tab4_sf_filtered['y'], mode='lines', name='Valor Real', line=dict(color='blue')))              
+  
+        fig.update_layout(title='Previsão do Preço (US$) do Petróleo Brent Utilizando o Modelo Naive', xaxis_title='Data', yaxis_title='Preço (US$)', width=1000)   
+        with instrumentation.stage('grafico/naive/plotly'):
+            st.plotly_chart(fig)
+
+        st.write("**Resultados:**")
+        st.write(f"**WMAPE**: {wmape1:.2%}")
+        st.write(f"**RMSE**: {rmse1:.2f}")
+        st.write(f"**MAPE**: {mape1:.2%}")
+
+        paragrafo20_tab4 = '<p style="text-align: justify;">Podemos constatar que o modelo não obteve um bom resultado, pois a previsão realizada através do último valor conhecido, não captura o comportamento dos dados.</p>'
+        st.markdown(paragrafo20_tab4, unsafe_allow_html=True)
+    
+
+        st.markdown("##### Seasonal Naive")
+
+        paragrafo21_tab4 = '<p style="text-align: justify;">O Seasonal Naive é um modelo semelhante ao Naive, mas é aplicado a séries temporais sazonais. A previsão para o próximo período é igual à observação do mesmo período na temporada anterior.</p>'
+        st.markdown(paragrafo21_tab4, unsafe_allow_html=True)
+
+        paragrafo21_tab4 = '<p style="text-align: justify;">Para buscar o melhor resultado possível, vamos utilizar uma técnica para encontrar o melhor valor de season_length possível.</p>'
+        st.markdown(paragrafo21_tab4, unsafe_allow_html=True)
+
+        # Grid Search for SeasonalNaive
+        # Parâmetro já calculado previamente no artefato de avaliação (evaluation.py)
+        best_season_length_seasonal_naive = modelos['SeasonalNaive']['params']['season_length']
+    
+        st.write("**Resultado:**")
+        st.write("Best Season Length:", best_season_length_seasonal_naive)
+
+        paragrafo22_tab4 = f'<p style="text-align: justify;">O melhor Season Length foi de {best_season_length_seasonal_naive} para os parâmetros de treino utilizado.</p>'
+        st.markdown(paragrafo22_tab4, unsafe_allow_html=True)
+
+        forecast_seasonal_naive = modelos['SeasonalNaive']['forecast']
+
+        wmape2 = modelos['SeasonalNaive']['wmape']
+        rmse2 = modelos['SeasonalNaive']['rmse']
+        mape2 = modelos['SeasonalNaive']['mape']
+
+        fig = go.Figure()
+
+        # série temporal prevista e intervalo de confiança
+        fig.add_trace(go.Scatter(x=forecast_seasonal_naive['ds'], y=forecast_seasonal_naive['SeasonalNaive'], mode='lines', name='Previsão (Seasonal Naive)', line=dict(color='rgb(101, 101, 101)')))
+        fig.add_trace(go.Scatter(x=forecast_seasonal_naive['ds'], y=forecast_seasonal_naive['SeasonalNaive-lo-90'], fill=None, mode='lines', line=dict(color='rgb(228, 228, 228)', width=0), showlegend=False))
+        fig.add_trace(go.Scatter(x=forecast_seasonal_naive['ds'], y=forecast_seasonal_naive['SeasonalNaive-hi-90'], fill='tonexty', mode='lines', line=dict(color='rgb(228, 228, 228)', width=0), showlegend=False))
+        fig.add_trace(go.Scatter(x=df_pipe_tab4_sf_filtered['ds'], y=df_pipe_tab4_sf_filtered['y'], mode='lines', name='Valor Real', line=dict(color='blue')))              
+  
+        fig.update_layout(title='Previsão do Preço (US$) do Petróleo Brent Utilizando o Modelo Seasonal Naive', xaxis_title='Data', yaxis_title='Preço (US$)', width=1000)   
+        with instrumentation.stage('grafico/seasonal_naive/plotly'):
+            st.plotly_chart(fig)
+
+        st.write("**Resultados:**")
+        st.write(f"**WMAPE**: {wmape2:.2%}")
+        st.write(f"**RMSE**: {rmse2:.2f}")
+        st.write(f"**MAPE**: {mape2:.2%}")
+
+        paragrafo23_tab4 = f'<p style="text-align: justify;">Ao utilizar o Seasonal Naive, percebemos que o WMAPE: {wmape2:.2%}, RMSE: {rmse2:.2f} e MAPE: {mape2:.2%} obtiveram resultados melhores, além do fato dele indicar uma previsão mais próxima dos dados reais, quando comparado com os resultados obtidos no modelo Naive (WMAPE: {wmape1:.2%}, RMSE: {rmse1:.2f} e MAPE: {mape1:.2%}).</p>'
+        st.markdown(paragrafo23_tab4, unsafe_allow_html=True)
+
+        st.markdown("##### Seasonal Window Average")
+
+        paragrafo24_tab4 = '<p style="text-align: justify;">Este modelo usa uma média móvel para suavizar as flutuações sazonais nos dados. A previsão é obtida tirando a média dos valores nas janelas temporais correspondentes na temporada anterior.</p>'
+        st.markdown(paragrafo24_tab4, unsafe_allow_html=True)
+
+        paragrafo28_tab4 = '<p style="text-align: justify;">Para buscar o melhor resultado possível, vamos utilizar uma técnica para encontrar o melhor valor de season_length e window_size possível.</p>'
+        st.markdown(paragrafo28_tab4, unsafe_allow_html=True)
+
+        # Grid Search for SeasonalWindowAverage
+        # Parâmetros já calculados previamente no artefato de avaliação (evaluation.py)
+        best_season_length_swa = modelos['SeasWA']['params']['season_length']
+        best_window_size_swa = modelos['SeasWA']['params']['window_size']
+    
+        st.write("**Resultados:**")
+        st.write("Best Season Length:", best_season_length_swa)
+        st.write("Best Window Size:", best_window_size_swa)
+
+        forecast_dfsm = modelos['SeasWA']['forecast']
+
+        wmape3 = modelos['SeasWA']['wmape']
+        rmse3 = modelos['SeasWA']['rmse']
+        mape3 = modelos['SeasWA']['mape']
+
+    
+        fig = go.Figure()
+
+        # série temporal prevista e intervalo de confiança
+        fig.add_trace(go.Scatter(x=forecast_dfsm['ds'], y=forecast_dfsm['SeasWA'], mode='lines', name='Previsão (SeasWA)', line=dict(color='rgb(101, 101, 101)')))    
+        fig.add_trace(go.Scatter(x=df_pipe_tab4_sf_filtered['ds'], y=df_pipe_tab4_sf_filtered['y'], mode='lines', name='Valor Real', line=dict(color='blue')))              
+  
+        fig.update_layout(title='Previsão do Preço (US$) do Petróleo Brent Utilizando o Modelo Seasonal Window Average', xaxis_title='Data', yaxis_title='Preço (US$)', width=1000)   
+        with instrumentation.stage('grafico/seasonal_window_average/plotly'):
+            st.plotly_chart(fig)
+
+        st.write("**Resultados:**")
+        st.write(f"**WMAPE**: {wmape3:.2%}")
+        st.write(f"**RMSE**: {rmse3:.2f}")
+        st.write(f"**MAPE**: {mape3:.2%}")
+
+        paragrafo25_tab4 = f'<p style="text-align: justify;">Utilizando a sazonalidade de {best_season_length_swa} e a janela de {best_window_size_swa}, o Seasonal Window Average obteve resultados excelentes (WMAPE: {wmape3:.2%}, RMSE: {rmse3:.2f} e MAPE: {mape3:.2%}), quando comparado aos modelos anteriores, além de conseguir capturar bem o comportamento dos dados.</p>'
+        st.markdown(paragrafo25_tab4, unsafe_allow_html=True)
+
+
+        st.markdown("##### Seasonal Exponential Smoothing Optimized")
+
+        paragrafo26_tab4 = '<p style="text-align: justify;">A suavização exponencial é uma técnica que atribui pesos decrescentes às observações passadas. A versão sazonal otimizada estende isso para capturar padrões sazonais. É um método mais avançado que ajusta automaticamente os parâmetros para otimizar a precisão da previsão.</p>'
+        st.markdown(paragrafo26_tab4, unsafe_allow_html=True)
+
+        paragrafo29_tab4 = '<p style="text-align: justify;">Para buscar o melhor resultado possível, vamos utilizar uma técnica para encontrar o melhor valor de season_length possível.</p>'
+        st.markdown(paragrafo29_tab4, unsafe_allow_html=True)
+
+        # Grid Search for SeasonalExponentialSmoothingOptimized
+        # Parâmetro já calculado previamente no artefato de avaliação (evaluation.py)
+        best_season_length_seso = modelos['SeasESOpt']['params']['season_length']
+
+        st.write("Best Season Length:", best_season_length_seso)
+
+        forecast_seasonal_exp_smo_opt = modelos['SeasESOpt']['forecast']
+
+        wmape4 = modelos['SeasESOpt']['wmape']
+        rmse4 = modelos['SeasESOpt']['rmse']
+        mape4 = modelos['SeasESOpt']['mape']
+
+        fig = go.Figure()
+
+        # série temporal prevista e intervalo de confiança
+        fig.add_trace(go.Scatter(x=forecast_seasonal_exp_smo_opt['ds'], y=forecast_seasonal_exp_smo_opt['SeasESOpt'], mode='lines', name='Previsão (SeasESOpt)', line=dict(color='rgb(101, 101, 101)')))    
+        fig.add_trace(go.Scatter(x=df_pipe_tab4_sf_filtered['ds'], y=df_pipe_tab4_sf_filtered['y'], mode='lines', name='Valor Real', line=dict(color='blue')))              
+  
+        fig.update_layout(title='Previsão do Preço (US$) do Petróleo Brent Utilizando o Modelo Seasonal Exponential Smoothing Optimized', xaxis_title='Data', yaxis_title='Preço (US$)', width=1000)   
+        with instrumentation.stage('grafico/seasonal_exponential_smoothing_optimized/plotly'):
+            st.plotly_chart(fig)
+
+        st.write("**Resultados:**")
+        st.write(f"**WMAPE**: {wmape4:.2%}")
+        st.write(f"**RMSE**: {rmse4:.2f}")
+        st.write(f"**MAPE**: {mape4:.2%}")
+
+        paragrafo27_tab4 = f'<p style="text-align: justify;">Utilizando a sazonalidade de {best_season_length_seso} dias, o modelo Seasonal Exponential Smoothing Optimized conseguiu obter bons resultados (WMAPE: {wmape4:.2%}, RMSE: {rmse4:.2f} e MAPE: {mape4:.2%}), porém não conseguiu superar o modelo Seasonal Window Average.</p>'
+        st.markdown(paragrafo27_tab4, unsafe_allow_html=True)
+
+
+        st.markdown("##### AutoARIMA")
+
+        paragrafo32_tab4 = '<p style="text-align: justify;">AutoARIMA é uma abordagem automatizada baseada em aprendizado de máquina para ajustar modelos ARIMA (AutoRegressive Integrated Moving Average). Ele procura automaticamente pelos melhores parâmetros do modelo ARIMA para a série temporal fornecida. Isso inclui termos autoregressivos (AR), termos de diferenciação (I) e termos de média móvel (MA). Para a execução do AutoARIMA, foram utilizados os dados da série convertida em estacionária.</p>'
+        st.markdown(paragrafo32_tab4, unsafe_allow_html=True)   
+    
+
+        forecast_autorima = modelos['AutoARIMA']['forecast']
+
+        wmape5 = modelos['AutoARIMA']['wmape']
+        mape5 = modelos['AutoARIMA']['mape']
+
+        df_preco_petroleo_s_filtered = avaliacao['estacionaria_filtrada']
+     
+        fig = go.Figure()
+
+        # série temporal prevista e intervalo de confiança
+        fig.add_trace(go.Scatter(x=forecast_autorima['ds'], y=forecast_autorima['AutoARIMA'], mode='lines', name='Previsão (AutoARIMA)', line=dict(color='rgb(101, 101, 101)')))
+        fig.add_trace(go.Scatter(x=forecast_autorima['ds'], y=forecast_autorima['AutoARIMA-lo-90'], fill=None, mode='lines', line=dict(color='rgb(228, 228, 228)', width=0), showlegend=False))
+        fig.add_trace(go.Scatter(x=forecast_autorima['ds'], y=forecast_autorima['AutoARIMA-hi-90'], fill='tonexty', mode='lines', line=dict(color='rgb(228, 228, 228)', width=0), showlegend=False))
+        fig.add_trace(go.Scatter(x=df_preco_petroleo_s_filtered['ds'], y=df_preco_petroleo_s_filtered['y'], mode='lines', name='Valor Real', line=dict(color='blue')))              
+  
+        fig.update_layout(title='Previsão do Preço (US$) do Petróleo Brent Utilizando o Modelo AutoARIMA', xaxis_title='Data', yaxis_title='Preço (US$)', width=1000)   
+        with instrumentation.stage('grafico/auto_arima/plotly'):
+            st.plotly_chart(fig)
+
+        st.write("**Resultados:**")
+        st.write(f"**WMAPE**: {wmape5:.2%}")   
+        st.write(f"**MAPE**: {mape5:.2%}")
+
+        paragrafo33_tab4 = '<p style="text-align: justify;">Conforme visto, devido a natureza da série, o AutoARIMA acabou obtendo resultados péssimos.</p>'
+        st.markdown(paragrafo33_tab4, unsafe_allow_html=True)
+    
+    
+        st.markdown("### Conclusão")
+        paragrafo34_tab4 = '<p style="text-align: justify;">Com base na análise comparativa dos modelos Naive, Seasonal Naive, Seasonal Window Average, Seasonal Exponential Smoothing Optimized e AutoARIMA, aplicados à série temporal de preços do petróleo Brent, obtidos do site do IPEA, e utilizando métricas de validação como WMAPE, MAPE e RMSE, constatou-se que o modelo que apresentou os resultados mais satisfatórios e que melhor capturou o comportamento dos dados foi o <b>Seasonal Window Average</b>.</p>'
+        st.markdown(paragrafo34_tab4, unsafe_allow_html=True)
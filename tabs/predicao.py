@@ -0,0 +1,113 @@
+from datetime import timedelta
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+import forecasting
+import instrumentation
+import registry
+
+
+@st.cache_resource
+def get_registry():
+    # um único registro por processo: o modelo é desserializado uma vez e compartilhado entre as sessões
+    model_registry = registry.ModelRegistry()
+    instrumentation.register_cache('modelos', model_registry.stats)
+
+    return model_registry
+
+
+@st.cache_resource
+def get_forecast_cache():
+    forecast_cache = forecasting.ForecastCache()
+    instrumentation.register_cache('previsoes', forecast_cache.stats)
+
+    return forecast_cache
+
+
+def render(serie):
+    st.markdown("## Predição do Preço Petróleo Brent")    
+
+    df_pipe_tab3 = serie.frame()
+
+    input_days_to_predict = int(st.slider('Selecione quantos dias você quer predizer', 1, forecasting.MAX_HORIZON)) 
+
+    if st.button('Enviar'):
+        # a previsão parte do último dado disponível: o modelo tem o estado atualizado com os dados sincronizados,
+        # então o horizonte é exatamente a quantidade de dias selecionada
+        data_atual_tab3 = serie.last_date.date()
+
+        # a previsão do maior horizonte do slider é calculada uma vez por versão do modelo e dos dados
+        artifact = get_registry().get('sm')
+        final_pred = get_forecast_cache().get(artifact, serie, input_days_to_predict)
+
+        ultimo_dado_ipea = df_pipe_tab3['ds'].max()
+
+        # transformações para melhorar a exibição dos dados na tabela
+        final_pred_filtrado = final_pred[final_pred['ds'] > ultimo_dado_ipea] 
+        final_pred_filtrado.rename(columns= {'ds' : 'Data', 'SeasWA': 'Preço Predito (US$)'}, inplace=True)
+        final_pred_filtrado['Data'] = final_pred_filtrado['Data'].dt.normalize()  
+        final_pred_filtrado.reset_index(drop=True, inplace=True)
+
+        # transformações para que o gráfico exiba além do período predito, os dados dos 3 meses anteriores
+        data_ha_3_meses = data_atual_tab3 - timedelta(days=3 * 30)
+
+        df_pipe_tab3 = df_pipe_tab3[df_pipe_tab3['ds'] >= pd.to_datetime(data_ha_3_meses)]
+
+        df_pipe_tab3.rename(columns= {'ds' : 'Data', 'y': 'Preço Predito (US$)'}, inplace=True)
+        df_pipe_tab3_filtrado = df_pipe_tab3[['Data', 'Preço Predito (US$)']]   
+
+        df_resultado = pd.concat([df_pipe_tab3_filtrado, final_pred_filtrado], ignore_index=True).sort_values(by='Data')        
+        df_resultado.rename(columns= {'Preço Predito (US$)' : 'Preco_pretroleo_brent'}, inplace=True)
+        df_resultado =df_resultado.reset_index(drop=True)
+
+        fig = px.line(df_resultado, x=df_resultado['Data'], y=df_resultado['Preco_pretroleo_brent'], title='Previsão do Preço por Barril do Petróleo Bruto Brent')
+        fig.update_xaxes(title='Data')
+        fig.update_yaxes(title='Preço (US$)')
+
+        
+        # linha vertical tracejada alocada na data do último dado para marcar a transição entre o período do preço real e o período do preço predito
+        fig.add_trace(go.Scatter(x=[data_atual_tab3, data_atual_tab3], y=[min(df_resultado['Preco_pretroleo_brent']), max(df_resultado['Preco_pretroleo_brent'])+2],
+                         mode='lines',
+                         line=dict(color='gray', dash='dash'),
+                         name='Último dado'))
+        
+
+        #annotation para diferenciar o período do preço real do período do preço predito
+        data_anterior = data_atual_tab3 - timedelta(days= 45)
+        data_posterior = data_atual_tab3 + timedelta(days= input_days_to_predict/2)
+        
+        fig.add_annotation(
+            x=data_anterior,
+            y= max(df_resultado['Preco_pretroleo_brent']) + 1,
+            text='Preço Real (US$)',
+            showarrow=True,
+            arrowhead=2,
+            arrowcolor='green',
+            arrowwidth=2,
+            ax=0,
+            ay=-40
+        )
+
+        fig.add_annotation(
+            x=data_posterior,
+            y= max(df_resultado['Preco_pretroleo_brent']) + 1,
+            text='Preço Predito (US$)',
+            showarrow=True,
+            arrowhead=2,
+            arrowcolor='red',
+            arrowwidth=2,
+            ax=0,
+            ay=-40
+        )        
+
+        fig.update_layout(width = 1000)
+ 
+        with instrumentation.stage('grafico/previsao/plotly'):
+            st.plotly_chart(fig)
+
+        df_final_pred_filtrado = final_pred_filtrado[final_pred_filtrado['Data'] > ultimo_dado_ipea].reset_index(drop=True)
+
+        st.dataframe(df_final_pred_filtrado)
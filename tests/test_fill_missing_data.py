@@ -0,0 +1,71 @@
+import pandas as pd
+import pytest
+
+from utils import FillMissingData
+
+
+def _painel(series):
+    return pd.DataFrame([(unique_id, pd.Timestamp(ds), y) for unique_id, linhas in series.items() for ds, y in linhas],
+                        columns=['unique_id', 'ds', 'y'])
+
+
+def _serie_unica(df, unique_id, **kwargs):
+    serie = df[df['unique_id'] == unique_id].drop(columns='unique_id')
+    return FillMissingData(**kwargs).transform(serie).reset_index(drop=True)
+
+
+@pytest.mark.parametrize('freq, series', [
+    # última observação em um sábado, fora do calendário de dias úteis
+    ('B', {
+        'a': [('2024-01-01', 1.0), ('2024-01-03', 3.0), ('2024-01-05', 5.0), ('2024-01-06', 6.0)],
+        'b': [('2024-01-02', 2.0), ('2024-01-04', 4.0)],
+    }),
+    # última observação às 03:30, fora do calendário horário
+    ('h', {
+        'a': [('2024-01-01 00:00', 1.0), ('2024-01-01 02:00', 3.0), ('2024-01-01 03:30', 4.5)],
+        'b': [('2024-01-01 00:00', 1.0), ('2024-01-01 01:00', 2.0)],
+    }),
+    # datas repetidas, fora de ordem: vale a última linha na ordem de entrada
+    ('D', {
+        'a': [('2024-01-03', 3.0), ('2024-01-01', 1.0), ('2024-01-03', 7.0), ('2024-01-01', 9.0)],
+        'b': [('2024-01-04', 4.0), ('2024-01-02', 2.0), ('2024-01-02', 5.0)],
+    }),
+    # frequência de dois dias: o calendário de cada série começa na sua primeira data, não na do painel
+    ('2D', {
+        'a': [('2024-01-01', 1.0), ('2024-01-05', 5.0)],
+        'b': [('2024-01-02', 2.0), ('2024-01-04', 4.0), ('2024-01-08', 8.0)],
+    }),
+    # nenhuma data no calendário de dias úteis
+    ('B', {
+        'a': [('2024-01-06', 6.0), ('2024-01-07', 7.0)],
+        'b': [('2024-01-13', 13.0)],
+    }),
+])
+@pytest.mark.parametrize('ascending', [True, False])
+def test_painel_igual_a_serie_unica(freq, series, ascending):
+    df = _painel(series)
+    kwargs = {'freq': freq, 'ascending': ascending}
+
+    painel = FillMissingData(ft_id='unique_id', **kwargs).transform(df)
+
+    for unique_id in series:
+        resultado = painel[painel['unique_id'] == unique_id].drop(columns='unique_id').reset_index(drop=True)
+        esperado = _serie_unica(df, unique_id, **kwargs)
+
+        # as datas fora do calendário são descartadas, sem estender a série além das observações válidas
+        assert resultado.empty or resultado['ds'].isin(pd.date_range(resultado['ds'].min(), resultado['ds'].max(), freq=freq)).all()
+        pd.testing.assert_frame_equal(resultado, esperado[['ds', 'y']], check_dtype=False)
+
+
+@pytest.mark.parametrize('datas', [
+    ['2024-01-01', '2024-01-02', '2024-01-02', '2024-01-04'],
+    ['2024-01-04', '2024-01-02', '2024-01-02', '2024-01-01'],
+    ['2024-01-02', '2024-01-04', '2024-01-01', '2024-01-02'],
+])
+def test_datas_repetidas_mantem_a_ultima_linha_da_entrada(datas):
+    df = pd.DataFrame({'ds': pd.to_datetime(datas), 'y': [1.0, 2.0, 3.0, 4.0]})
+    ultima = df[df['ds'] == '2024-01-02']['y'].iloc[-1]
+
+    resultado = FillMissingData(ascending=True).transform(df)
+
+    assert resultado.loc[resultado['ds'] == '2024-01-02', 'y'].tolist() == [ultima]
@@ -1,7 +1,14 @@
 from sklearn.base import BaseEstimator, TransformerMixin
 import pandas as pd
+import numpy as np
+import hashlib
+import json
 
+from ingestion import parse_decimal
 
+
+# os transformadores não alteram o dataframe recebido, retornando sempre um novo objeto, para que
+# possam ser aplicados sobre a série compartilhada entre as sessões (ver series.py)
 class  RenameColumns (BaseEstimator, TransformerMixin):
     def __init__(self):
         pass
@@ -10,13 +17,17 @@ class  RenameColumns (BaseEstimator, TransformerMixin):
         return self
     
     def transform(self, df):
-        df.rename(columns= {'data' : 'ds', 'preco_petroleo_brent': 'y'}, inplace=True)
-        return df
+        return df.rename(columns= {'data' : 'ds', 'preco_petroleo_brent': 'y'})
 
 
 class CastToFloat(BaseEstimator, TransformerMixin):
-    def __init__(self, ft_to_cast='y'):        
+    # aceita vírgula ou ponto decimal (ver ingestion.parse_decimal); com errors='raise', os valores que não puderam
+    # ser convertidos geram um ingestion.ParseError com as linhas inválidas e, com errors='coerce', viram NaN e ficam em bad_rows_
+    def __init__(self, ft_to_cast='y', dtype='float64', decimal='auto', errors='raise'):
         self.ft_to_cast = ft_to_cast
+        self.dtype = dtype
+        self.decimal = decimal
+        self.errors = errors
 
 
     def fit(self, df):
@@ -24,11 +35,12 @@ class CastToFloat(BaseEstimator, TransformerMixin):
     
     def transform(self, df):
         if set([self.ft_to_cast]).issubset(df.columns):
-            try:
-                df[self.ft_to_cast] = df[self.ft_to_cast].str.replace(',','.').astype(float)
-            except ValueError:                
-                pass
-            
+            valores, self.bad_rows_ = parse_decimal(df[self.ft_to_cast], self.decimal, self.dtype, self.ft_to_cast, self.errors)
+
+            df = df.assign(**{self.ft_to_cast: valores})
+            if self.errors == 'drop' and len(self.bad_rows_):
+                df = df.drop(index=df.index[self.bad_rows_['linha']])
+
         return df
 
 
@@ -43,7 +55,7 @@ class CastToDatetime(BaseEstimator, TransformerMixin):
     def transform(self, df):
         if set([self.ft_to_cast]).issubset(df.columns):
             try:                
-                df[self.ft_to_cast] = pd.to_datetime(df[self.ft_to_cast])
+                df = df.assign(**{self.ft_to_cast: pd.to_datetime(df[self.ft_to_cast])})
             except ValueError:                          
                 pass
         
@@ -51,34 +63,213 @@ class CastToDatetime(BaseEstimator, TransformerMixin):
 
 
 class FillMissingData (BaseEstimator, TransformerMixin):
-    def __init__(self):
-        pass
-    
+    # fill_method segue a ordem cronológica: 'ffill' repete o último valor conhecido (fechamento do
+    # último dia útil) e 'bfill' utiliza o próximo valor conhecido
+    # com ft_id, cada série do painel (ex.: Brent, WTI, spreads) é completada no seu próprio intervalo de datas
+    def __init__(self, freq='D', fill_method='ffill', ascending=False, ft_date='ds', ft_to_fill='y', ft_id=None):
+        self.freq = freq
+        self.fill_method = fill_method
+        self.ascending = ascending
+        self.ft_date = ft_date
+        self.ft_to_fill = ft_to_fill
+        self.ft_id = ft_id
+
     def fit(self, df):
         return self
     
     def transform(self, df):
-        date_range = pd.date_range(start=df['ds'].min(), end=df['ds'].max(), freq='D')
-        df_date_range = pd.DataFrame({'ds': date_range})
-        df_completo = pd.merge(df_date_range, df, on='ds', how='left')
-        df_completo.sort_values(by='ds', ascending=False, inplace=True)
-        df_completo['y'] = df_completo['y'].fillna(method='bfill')
-        df_completo.reset_index(drop=True, inplace=True)       
+        if self.fill_method not in ('ffill', 'bfill'):
+            raise ValueError(f"fill_method deve ser 'ffill' ou 'bfill', recebido: {self.fill_method}")
+
+        if self.ft_id is not None and self.ft_id in df.columns:
+            return self._transform_panel(df)
+
+        serie = df.set_index(self.ft_date)
+        serie.index = pd.DatetimeIndex(serie.index)
+
+        # datas repetidas: mantém a última linha na ordem de entrada, qualquer que seja a ordenação recebida (a
+        # remoção é feita antes de inverter ou ordenar a série)
+        if serie.index.has_duplicates:
+            serie = serie[~serie.index.duplicated(keep='last')]
+
+        # os dados normalmente chegam ordenados (o BigQuery retorna em ordem decrescente), então basta
+        # inverter a ordem; a ordenação completa só é feita quando a entrada está fora de ordem
+        if not serie.index.is_monotonic_increasing:
+            if serie.index.is_monotonic_decreasing:
+                serie = serie.iloc[::-1]
+            else:
+                serie = serie.sort_index()
+
+        date_range = pd.date_range(start=serie.index[0], end=serie.index[-1], freq=self.freq, name=self.ft_date)
+        indexer = self._grid_indexer(serie.index, date_range)
+
+        # datas fora do calendário nas pontas (ex.: um sábado com freq='B') não estendem a série além das
+        # observações válidas, como no caso do painel
+        # observações válidas (sem nenhuma, o resultado é vazio)
+        observados = np.flatnonzero(indexer >= 0)
+        inicio, fim = (observados[0], observados[-1] + 1) if len(observados) else (0, 0)
+        if inicio > 0 or fim < len(indexer):
+            date_range = date_range[inicio:fim]
+            indexer = indexer[inicio:fim]
+
+        # reindexação direta pelas posições no calendário, sem merge nem tabela hash
+        colunas = {self.ft_date: date_range}
+        for coluna in serie.columns:
+            colunas[coluna] = serie[coluna].array.take(indexer, allow_fill=True)
+
+        df_completo = pd.DataFrame(colunas)
+
+        if self.fill_method == 'ffill':
+            df_completo[self.ft_to_fill] = df_completo[self.ft_to_fill].ffill()
+        else:
+            df_completo[self.ft_to_fill] = df_completo[self.ft_to_fill].bfill()
+
+        if not self.ascending:
+            df_completo = df_completo.iloc[::-1].reset_index(drop=True)
 
         return df_completo
 
+    def _transform_panel(self, df):
+        # todas as séries são completadas de uma vez, sem laço por série: as linhas são ordenadas por
+        # (série, data) e cada série ocupa um trecho contíguo do resultado, com o calendário ancorado na sua
+        # primeira data, como no caso de série única
+        codigos, series_ids = pd.factorize(df[self.ft_id], sort=True)
+        datas = pd.DatetimeIndex(df[self.ft_date]).asi8
+
+        # lexsort é estável: entre datas repetidas em uma mesma série, a última linha do trecho é a última na
+        # ordem de entrada, a mesma mantida no caso de série única
+        ordem = np.lexsort((datas, codigos))
+        codigos_ordenados, datas_ordenadas = codigos[ordem], datas[ordem]
+
+        repetidas = (codigos_ordenados[1:] == codigos_ordenados[:-1]) & (datas_ordenadas[1:] == datas_ordenadas[:-1])
+        manter = np.append(~repetidas, True)
+        ordem, codigos_ordenados, datas_ordenadas = ordem[manter], codigos_ordenados[manter], datas_ordenadas[manter]
+
+        inicios = np.flatnonzero(np.diff(codigos_ordenados, prepend=-1))
+        tamanhos_entrada = np.diff(np.r_[inicios, len(codigos_ordenados)])
+
+        offset = pd.tseries.frequencies.to_offset(self.freq)
+        if isinstance(offset, pd.offsets.Tick):
+            # frequências fixas: o calendário de cada série começa na sua primeira data e as posições são
+            # calculadas aritmeticamente
+            ancoras = datas_ordenadas[inicios]
+            deslocamento = datas_ordenadas - np.repeat(ancoras, tamanhos_entrada)
+            posicoes = deslocamento // offset.nanos
+            no_calendario = deslocamento % offset.nanos == 0
+        else:
+            # demais frequências: calendário comum com o passo unitário (ex.: 'B' para '2B'); cada série começa
+            # na primeira data do calendário a partir da sua primeira data (o mesmo ajuste do pd.date_range) e
+            # avança de offset.n em offset.n posições
+            calendario = pd.date_range(start=pd.Timestamp(datas_ordenadas.min()), end=pd.Timestamp(datas_ordenadas.max()), freq=offset.base)
+            posicoes_base = calendario.searchsorted(pd.DatetimeIndex(datas_ordenadas))
+
+            ancoras = posicoes_base[inicios]
+            deslocamento = posicoes_base - np.repeat(ancoras, tamanhos_entrada)
+            posicoes = deslocamento // offset.n
+            no_calendario = deslocamento % offset.n == 0
+            if len(calendario):
+                no_calendario &= calendario.asi8[np.minimum(posicoes_base, len(calendario) - 1)] == datas_ordenadas
+            else:
+                no_calendario[:] = False
+
+        if not no_calendario.any():
+            # nenhuma data no calendário (ex.: apenas fins de semana com freq='B'): resultado vazio, como no caso
+            # de série única
+            colunas = [self.ft_id, self.ft_date] + [coluna for coluna in df.columns if coluna not in (self.ft_id, self.ft_date)]
+            return df.iloc[:0][colunas].reset_index(drop=True)
+
+        # linhas fora do calendário (ex.: um sábado com freq='B') são descartadas, como no caso de série única,
+        # antes de definir o início e o fim de cada série
+        ordem, codigos_ordenados, posicoes = ordem[no_calendario], codigos_ordenados[no_calendario], posicoes[no_calendario]
+
+        inicios = np.flatnonzero(np.diff(codigos_ordenados, prepend=-1))
+        fins = np.r_[inicios[1:], len(codigos_ordenados)] - 1
+
+        # trecho do calendário de cada série e sua posição no resultado
+        primeira_posicao = posicoes[inicios]
+        tamanhos = posicoes[fins] - primeira_posicao + 1
+        deslocamentos = np.r_[0, np.cumsum(tamanhos)[:-1]].astype(np.intp)
+        total = int(tamanhos.sum())
+
+        grupo = np.repeat(np.arange(len(tamanhos)), tamanhos)
+        posicao_no_grupo = np.arange(total) - deslocamentos[grupo]
+
+        if not self.ascending:
+            # cada série em ordem decrescente, mantendo a ordem das séries
+            posicao_no_grupo = tamanhos[grupo] - 1 - posicao_no_grupo
+
+        grupo_linha = np.repeat(np.arange(len(inicios)), fins - inicios + 1)
+        destino = deslocamentos[grupo_linha] + posicoes - primeira_posicao[grupo_linha]
+        if not self.ascending:
+            destino = deslocamentos[grupo_linha] + tamanhos[grupo_linha] - 1 - (posicoes - primeira_posicao[grupo_linha])
+
+        indexer = np.full(total, -1, dtype=np.intp)
+        indexer[destino] = ordem
+
+        ids = df[self.ft_id].array
+        codigos_grupo = codigos_ordenados[inicios][grupo]
+
+        # data de cada linha do resultado a partir da âncora da sua série
+        passos = primeira_posicao[grupo] + posicao_no_grupo
+        if isinstance(offset, pd.offsets.Tick):
+            datas_resultado = pd.DatetimeIndex(ancoras[codigos_grupo] + passos * offset.nanos)
+        else:
+            datas_resultado = calendario[ancoras[codigos_grupo] + passos * offset.n]
+
+        colunas = {
+            self.ft_id: series_ids.take(codigos_grupo) if not isinstance(ids, pd.Categorical) else pd.Categorical.from_codes(codigos_grupo, dtype=pd.CategoricalDtype(series_ids)),
+            self.ft_date: datas_resultado,
+        }
+        for coluna in df.columns:
+            if coluna not in colunas:
+                colunas[coluna] = df[coluna].array.take(indexer, allow_fill=True)
+
+        df_completo = pd.DataFrame(colunas)
+
+        # o preenchimento é feito por série (groupby vetorizado), sem propagar valores de uma série para outra
+        fill_method = self.fill_method
+        if not self.ascending:
+            fill_method = 'bfill' if fill_method == 'ffill' else 'ffill'
+
+        df_completo[self.ft_to_fill] = getattr(df_completo[self.ft_to_fill].groupby(grupo), fill_method)()
+
+        return df_completo
+
+    def _grid_indexer(self, index, date_range):
+        # posição de cada linha da série no date_range (-1 para as datas sem observação)
+        offset = pd.tseries.frequencies.to_offset(self.freq)
+        valores = index.asi8
+
+        if isinstance(offset, pd.offsets.Tick):
+            # frequências fixas (dias, horas, minutos...) permitem calcular a posição aritmeticamente
+            deslocamento = valores - date_range.asi8[0]
+            posicoes = deslocamento // offset.nanos
+            no_calendario = deslocamento % offset.nanos == 0
+        else:
+            posicoes = date_range.searchsorted(index)
+            no_calendario = date_range.asi8[np.minimum(posicoes, len(date_range) - 1)] == valores if len(date_range) else np.zeros(len(index), dtype=bool)
+
+        indexer = np.full(len(date_range), -1, dtype=np.intp)
+        indexer[posicoes[no_calendario]] = np.flatnonzero(no_calendario)
+
+        return indexer
+
 
 class AddColumn (BaseEstimator, TransformerMixin):
-    def __init__(self):
-        pass
-    
+    # identificador da série no formato do statsforecast; categorical ocupa um único código por linha,
+    # o que reduz memória e agiliza o agrupamento em painéis com muitas séries
+    def __init__(self, unique_id='value', categorical=True):
+        self.unique_id = unique_id
+        self.categorical = categorical
+
     def fit(self, df):
         return self
     
-    def transform(self, df):       
-        df['unique_id'] = 'value'       
+    def transform(self, df):
+        if self.categorical:
+            return df.assign(unique_id=pd.Categorical.from_codes(np.zeros(len(df), dtype='int8'), categories=[self.unique_id]))
 
-        return df
+        return df.assign(unique_id=self.unique_id)
     
 
 class SetIndex(BaseEstimator, TransformerMixin):
@@ -92,7 +283,7 @@ class SetIndex(BaseEstimator, TransformerMixin):
     def transform(self, df):
         if set([self.ft_to_cast]).issubset(df.columns):
             try:
-                df.set_index(self.ft_to_cast, inplace = True)
+                df = df.set_index(self.ft_to_cast)
             except ValueError:                
                 pass
             
@@ -107,7 +298,15 @@ class TransformIndexToColumn(BaseEstimator, TransformerMixin):
         return self
     
     def transform(self, df):
-        df[self.ft_to_cast] = df.index
-        df.reset_index(drop=True, inplace=True) 
-            
-        return df
\ No newline at end of file
+        return df.assign(**{self.ft_to_cast: df.index}).reset_index(drop=True)
+
+
+def data_fingerprint(df, *extras):
+    # hash estável dos dados (e de configurações extras) usado como chave de versão dos artefatos
+    hasher = hashlib.sha256()
+    hasher.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+
+    for extra in extras:
+        hasher.update(json.dumps(extra, sort_keys=True, default=str).encode('utf-8'))
+
+    return hasher.hexdigest()